@@ -0,0 +1,61 @@
+"""
+Benchmark of the CSV parser engines on wide and tall synthetic files.
+
+Run from the repository root with `python benchmarks/csv_engines.py`.
+"""
+import argparse
+import io
+import time
+
+import numpy as np
+import pandas as pd
+
+import mlui.tools as tools
+
+SHAPES = {"wide": (20_000, 1_000), "tall": (2_000_000, 10)}
+OPTIONS = {
+    "c": {"engine": "c"},
+    "c (streaming)": {"engine": "c", "chunksize": tools.data.CHUNK_SIZE},
+    "pyarrow": {"engine": "pyarrow"},
+    "pyarrow (arrow dtypes)": {"engine": "pyarrow", "arrow_dtypes": True},
+}
+
+
+def make_csv(rows: int, columns: int) -> bytes:
+    """Generate a CSV file with random float values."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        rng.random((rows, columns)), columns=[f"column_{i}" for i in range(columns)]
+    )
+
+    return df.to_csv(index=False, float_format="%.6f").encode("utf-8")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scale", type=float, default=1.0, help="row count factor")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'file':<6}{'engine':<24}{'size, MB':>10}{'time, s':>10}{'MB/s':>10}")
+
+    for name, (rows, columns) in SHAPES.items():
+        content = make_csv(int(rows * args.scale), columns)
+        size = len(content) / 2**20
+
+        for label, params in OPTIONS.items():
+            timings = list()
+
+            for _ in range(args.repeats):
+                buff = io.BytesIO(content)
+                start = time.perf_counter()
+                delimiter = tools.data.sniff_csv(buff)
+                tools.data.read_csv(buff, delimiter, **params)
+                timings.append(time.perf_counter() - start)
+
+            best = min(timings)
+            print(f"{name:<6}{label:<24}{size:>10.1f}{best:>10.2f}{size / best:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+import pandas as pd
+
+# Copy-on-Write lets the app's sections share the DataFrames as zero-copy views, which
+# are copied lazily only when they are modified
+pd.set_option("mode.copy_on_write", True)
@@ -0,0 +1,490 @@
+import atexit
+import collections
+import getpass
+import json
+import os
+import pathlib
+import shutil
+import stat
+import tempfile
+import threading
+import typing
+
+import pandas as pd
+import pyarrow as pa
+
+import mlui.types.classes as t
+
+
+class DataCache:
+    """
+    Class representing an on-disk cache of the uploaded datasets.
+
+    This class stores parsed DataFrames in the Feather format along with the results of
+    their validation, keyed by the hash of the uploaded bytes and the parsing options
+    affecting the result. Arrow-backed dtypes are preserved. The total size of the
+    cache is capped, and the least recently used entries are evicted first. The cache
+    directory is only used if it is private to the current user, so other users can
+    not plant entries in it.
+    """
+
+    def __init__(self, path: str | os.PathLike, max_size: int) -> None:
+        """
+        Initialize the cache directory.
+
+        Parameters
+        ----------
+        path : str or PathLike
+            Directory to store the cached entries in. It is created with the
+            permissions of the owner only.
+        max_size : int
+            Maximum total size of the cache in bytes. The cache is disabled if it is
+            not positive.
+        """
+        self._path = pathlib.Path(path)
+        self._max_size = max_size
+
+    def get(self, key: str) -> t.CacheEntry | None:
+        """
+        Get the cached entry and mark it as recently used.
+
+        Parameters
+        ----------
+        key : str
+            Hash of the uploaded bytes and the parsing options.
+
+        Returns
+        -------
+        CacheEntry or None
+            Cached DataFrame (None if the validation has failed) and validation error
+            message (None if the validation has passed), or None on a cache miss.
+        """
+        if not self.enabled or not self._is_private():
+            return None
+
+        meta_path, data_path = self._get_paths(key)
+
+        try:
+            with meta_path.open() as file:
+                meta = json.load(file)
+
+            error = meta["error"]
+            params = {"dtype_backend": "pyarrow"} if meta["arrow_dtypes"] else {}
+            df = None if error else pd.read_feather(data_path, **params)
+
+            for path in (meta_path, data_path):
+                if path.exists():
+                    os.utime(path)
+        except (OSError, ValueError, KeyError, ImportError):
+            return None
+
+        return df, error
+
+    def set(self, key: str, df: t.DataFrame | None, error: str | None) -> None:
+        """
+        Store the entry in the cache, evicting the least recently used entries if the
+        size cap is exceeded. Failures to write are silently ignored.
+
+        Parameters
+        ----------
+        key : str
+            Hash of the uploaded bytes and the parsing options.
+        df : DataFrame or None
+            Parsed DataFrame, None if the validation has failed.
+        error : str or None
+            Validation error message, None if the validation has passed.
+        """
+        if not self.enabled or not self._is_private():
+            return
+
+        meta_path, data_path = self._get_paths(key)
+
+        try:
+            # Write to temporary files first, so concurrent sessions never read
+            # partially written entries
+            if df is not None:
+                tmp_data_path = data_path.with_name(
+                    f"{data_path.name}.{os.getpid()}.tmp"
+                )
+                df.to_feather(tmp_data_path)
+                os.replace(tmp_data_path, data_path)
+
+            tmp_meta_path = meta_path.with_name(f"{meta_path.name}.{os.getpid()}.tmp")
+
+            arrow_dtypes = df is not None and any(
+                isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes
+            )
+
+            with tmp_meta_path.open("w") as file:
+                json.dump({"error": error, "arrow_dtypes": arrow_dtypes}, file)
+
+            os.replace(tmp_meta_path, meta_path)
+        except (OSError, ValueError, ImportError):
+            return
+
+        self._evict()
+
+    def _is_private(self) -> bool:
+        """
+        Create the cache directory if it does not exist, and check that it is a real
+        directory owned by the current user and inaccessible to others.
+
+        Returns
+        -------
+        bool
+            True if the directory can be trusted, False otherwise.
+        """
+        try:
+            self._path.mkdir(mode=0o700, parents=True, exist_ok=True)
+            info = self._path.lstat()
+        except OSError:
+            return False
+
+        if not stat.S_ISDIR(info.st_mode):
+            return False
+
+        # The owner and permissions are only meaningful on POSIX systems
+        if hasattr(os, "getuid"):
+            return info.st_uid == os.getuid() and not info.st_mode & 0o077
+
+        return True
+
+    def _get_paths(self, key: str) -> tuple[pathlib.Path, pathlib.Path]:
+        """
+        Get the paths of the metadata and data files of the entry.
+
+        Parameters
+        ----------
+        key : str
+            Hash of the uploaded bytes and the parsing options.
+
+        Returns
+        -------
+        tuple of Path
+            Paths of the metadata and data files.
+        """
+        return self._path / f"{key}.json", self._path / f"{key}.feather"
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries until the size cap is satisfied."""
+        entries = dict()
+
+        for path in self._path.glob("*.json"):
+            try:
+                files = [file for file in self._get_paths(path.stem) if file.exists()]
+                size = sum(file.stat().st_size for file in files)
+                entries[path.stem] = (path.stat().st_mtime, size, files)
+            except OSError:
+                continue
+
+        total_size = sum(size for _, size, _ in entries.values())
+
+        for _, size, files in sorted(entries.values(), key=lambda entry: entry[0]):
+            if total_size <= self._max_size:
+                break
+
+            for file in files:
+                try:
+                    file.unlink()
+                except OSError:
+                    pass
+
+            total_size -= size
+
+    @property
+    def enabled(self) -> bool:
+        """True if the cache is enabled, False otherwise."""
+        return self._max_size > 0
+
+
+class ResultCache:
+    """
+    Class representing an in-memory cache of the model's results.
+
+    This class keeps the predictions and evaluation results in memory, keyed by the
+    fingerprint of the model's weights and configuration, the data version and the
+    batch size. The total size of the entries is capped, and the least recently used
+    entries are evicted first. Evicted entries can optionally be spilled to disk in
+    the Parquet format, where they are kept within a separate size cap and moved back
+    to memory on the next hit. The spilled entries are private to the process and
+    removed when it exits. The cache is shared by all sessions, so it is guarded by a
+    lock.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        spill_path: str | os.PathLike | None = None,
+        max_spill_size: int = 0,
+    ) -> None:
+        """
+        Initialize an empty cache.
+
+        Parameters
+        ----------
+        max_size : int
+            Maximum total size of the entries in memory in bytes. The cache is
+            disabled if it is not positive.
+        spill_path : str, PathLike or None, optional
+            Directory to spill the evicted entries to, None to discard them. The
+            entries are kept in a new temporary subdirectory accessible only by the
+            current user, created on the first spill.
+        max_spill_size : int, optional
+            Maximum total size of the spilled entries in bytes. The spilling is
+            disabled if it is not positive.
+        """
+        self._max_size = max_size
+        self._spill_root = spill_path
+        self._spill_path: pathlib.Path | None = None
+        self._max_spill_size = max_spill_size
+        self._entries: collections.OrderedDict[
+            str, tuple[t.Result, int]
+        ] = collections.OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> t.Result | None:
+        """
+        Get the cached result and mark it as recently used.
+
+        Parameters
+        ----------
+        key : str
+            Fingerprint of the model, data and parameters.
+
+        Returns
+        -------
+        Result or None
+            Cached result, or None on a cache miss.
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+
+                return self._entries[key][0]
+
+        result = self._load(key)
+
+        if result is not None:
+            self.set(key, result)
+
+        return result
+
+    def set(self, key: str, result: t.Result) -> None:
+        """
+        Store the result in the cache, evicting the least recently used entries if the
+        size cap is exceeded. Results larger than the cap are not stored.
+
+        Parameters
+        ----------
+        key : str
+            Fingerprint of the model, data and parameters.
+        result : Result
+            Predictions or evaluation results.
+        """
+        if not self.enabled:
+            return
+
+        size = get_result_size(result)
+
+        if size > self._max_size:
+            return
+
+        evicted = list()
+
+        with self._lock:
+            if key in self._entries:
+                self._size -= self._entries.pop(key)[1]
+
+            self._entries[key] = (result, size)
+            self._size += size
+
+            while self._size > self._max_size:
+                evicted_key, (evicted_result, evicted_size) = self._entries.popitem(
+                    last=False
+                )
+                self._size -= evicted_size
+                evicted.append((evicted_key, evicted_result))
+
+        for evicted_key, evicted_result in evicted:
+            self._spill(evicted_key, evicted_result)
+
+    def clear(self) -> None:
+        """Remove all entries from memory and disk."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+        if self._spill_path is not None:
+            for path in self._spill_path.iterdir():
+                shutil.rmtree(path, ignore_errors=True)
+
+    def _get_spill_path(self) -> pathlib.Path:
+        """
+        Get the directory of the spilled entries, creating it on the first call.
+
+        Returns
+        -------
+        Path
+            Private temporary directory, removed when the process exits.
+
+        Raises
+        ------
+        OSError
+            If there is an issue creating the directory.
+        """
+        with self._lock:
+            if self._spill_path is None:
+                root = pathlib.Path(typing.cast(str | os.PathLike, self._spill_root))
+                root.mkdir(parents=True, exist_ok=True)
+
+                self._spill_path = pathlib.Path(
+                    tempfile.mkdtemp(prefix="results-", dir=root)
+                )
+                atexit.register(shutil.rmtree, self._spill_path, ignore_errors=True)
+
+            return self._spill_path
+
+    def _spill(self, key: str, result: t.Result) -> None:
+        """
+        Write the evicted entry to disk, evicting the least recently used spilled
+        entries if the size cap is exceeded. Failures to write are silently ignored.
+
+        Each entry is a directory with a Parquet file for each of its DataFrames,
+        which is written under a temporary name and then renamed.
+
+        Parameters
+        ----------
+        key : str
+            Fingerprint of the model, data and parameters.
+        result : Result
+            Predictions or evaluation results.
+        """
+        if self._spill_root is None or self._max_spill_size <= 0:
+            return
+
+        try:
+            spill_path = self._get_spill_path()
+            path = spill_path / key
+
+            if path.exists():
+                return
+
+            tmp_path = spill_path / f"{key}.{threading.get_ident()}.tmp"
+            tmp_path.mkdir()
+
+            try:
+                if isinstance(result, list):
+                    for position, df in enumerate(result):
+                        df.to_parquet(tmp_path / f"{position}.parquet")
+                else:
+                    result.to_parquet(tmp_path / "result.parquet")
+
+                os.replace(tmp_path, path)
+            finally:
+                shutil.rmtree(tmp_path, ignore_errors=True)
+        except (OSError, ValueError, TypeError, pa.ArrowException):
+            return
+
+        entries = list()
+
+        for spilled in spill_path.iterdir():
+            try:
+                files = [file.stat().st_size for file in spilled.iterdir()]
+                entries.append((spilled.stat().st_mtime, sum(files), spilled))
+            except OSError:
+                continue
+
+        total_size = sum(size for _, size, _ in entries)
+
+        for _, size, spilled in sorted(entries, key=lambda entry: entry[0]):
+            if total_size <= self._max_spill_size:
+                break
+
+            shutil.rmtree(spilled, ignore_errors=True)
+            total_size -= size
+
+    def _load(self, key: str) -> t.Result | None:
+        """
+        Read the spilled entry and remove it from disk.
+
+        Parameters
+        ----------
+        key : str
+            Fingerprint of the model, data and parameters.
+
+        Returns
+        -------
+        Result or None
+            Spilled result, or None if it is not on disk.
+        """
+        if self._spill_path is None:
+            return None
+
+        path = self._spill_path / key
+
+        try:
+            if (path / "result.parquet").exists():
+                result: t.Result = pd.read_parquet(path / "result.parquet")
+            else:
+                files = sorted(path.glob("*.parquet"), key=lambda file: int(file.stem))
+
+                if not files:
+                    return None
+
+                result = [pd.read_parquet(file) for file in files]
+        except (OSError, ValueError, pa.ArrowException):
+            return None
+        finally:
+            shutil.rmtree(path, ignore_errors=True)
+
+        return result
+
+    @property
+    def enabled(self) -> bool:
+        """True if the cache is enabled, False otherwise."""
+        return self._max_size > 0
+
+    @property
+    def size(self) -> int:
+        """Total size of the entries in memory in bytes."""
+        return self._size
+
+
+def get_result_size(result: t.Result) -> int:
+    """
+    Get the memory usage of the result.
+
+    Parameters
+    ----------
+    result : Result
+        Predictions or evaluation results.
+
+    Returns
+    -------
+    int
+        Memory usage in bytes.
+    """
+    frames = result if isinstance(result, list) else [result]
+
+    return sum(int(df.memory_usage(deep=True).sum()) for df in frames)
+
+
+data_cache = DataCache(
+    os.environ.get(
+        "MLUI_DATA_CACHE_DIR",
+        os.path.join(tempfile.gettempdir(), f"mlui-data-{getpass.getuser()}"),
+    ),
+    int(os.environ.get("MLUI_DATA_CACHE_SIZE", 1024)) * 2**20,
+)
+
+result_cache = ResultCache(
+    int(os.environ.get("MLUI_RESULT_CACHE_SIZE", 256)) * 2**20,
+    os.environ.get(
+        "MLUI_RESULT_CACHE_DIR", os.path.join(tempfile.gettempdir(), "mlui", "results")
+    ),
+    int(os.environ.get("MLUI_RESULT_SPILL_SIZE", 1024)) * 2**20,
+)
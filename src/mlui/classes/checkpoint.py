@@ -0,0 +1,179 @@
+import io
+import math
+import os
+import tempfile
+import uuid
+
+import pandas as pd
+import tensorflow as tf
+
+import mlui.types.classes as t
+
+CHECKPOINT_DIR = os.environ.get(
+    "MLUI_CHECKPOINT_DIR", os.path.join(tempfile.gettempdir(), "mlui", "checkpoints")
+)
+
+
+class Checkpoint(tf.keras.callbacks.Callback):
+    """
+    Class representing a callback saving resumable checkpoints of the training.
+
+    This class saves the weights and optimizer state of the model along with the
+    number of completed epochs and the training history at the end of the epochs,
+    either after every epoch or only when the monitored log improves, together with
+    the best value of the monitored log. Only the last `max_to_keep` checkpoints are
+    kept. The checkpoints are stored per model name and run ID, so the runs of
+    different sessions never prune each other's checkpoints, and a training
+    interrupted by a server restart can be resumed by a model with the same name and
+    architecture given the ID of the run.
+    """
+
+    def __init__(
+        self,
+        max_to_keep: int = 3,
+        best_only: bool = False,
+        monitor: str = "val_loss",
+        run_id: str | None = None,
+        directory: str = CHECKPOINT_DIR,
+    ) -> None:
+        """
+        Initialize the callback.
+
+        Parameters
+        ----------
+        max_to_keep : int, optional
+            Number of the latest checkpoints to keep.
+        best_only : bool, optional
+            Whether to save a checkpoint only when the monitored log improves.
+        monitor : str, optional
+            Log to monitor if `best_only` is set. Accuracy logs are maximized, the
+            other ones are minimized.
+        run_id : str or None, optional
+            ID of the run to store the checkpoints under, e.g. of an interrupted run
+            to resume. If None, a new ID is generated.
+        directory : str, optional
+            Directory to store the checkpoints of each model in.
+        """
+        super().__init__()
+
+        self._max_to_keep = max_to_keep
+        self._best_only = best_only
+        self._monitor = monitor
+        self._directory = directory
+        self._run_id = run_id or uuid.uuid4().hex[:8]
+        self._maximize = "acc" in monitor
+        self._best: float | None = None
+        self._best_value = tf.Variable(math.nan, dtype=tf.float64, trainable=False)
+        self._epoch = tf.Variable(0, dtype=tf.int64, trainable=False)
+        self._history_json = tf.Variable("", dtype=tf.string, trainable=False)
+        self._manager: tf.train.CheckpointManager | None = None
+        self._tracked: tuple[int, int] | None = None
+        self.history: t.DataFrame = pd.DataFrame()
+
+    def _get_manager(self, model: t.Object) -> tf.train.CheckpointManager:
+        """
+        Get the checkpoint manager of the model, creating it again whenever the model
+        or its optimizer are replaced (e.g. after the model is recompiled).
+
+        Parameters
+        ----------
+        model : Model
+            Keras model to be checkpointed.
+
+        Returns
+        -------
+        CheckpointManager
+            Manager of the model's checkpoints.
+        """
+        tracked = (id(model), id(model.optimizer))
+
+        if self._manager is None or self._tracked != tracked:
+            checkpoint = tf.train.Checkpoint(
+                model=model,
+                optimizer=model.optimizer,
+                epoch=self._epoch,
+                history=self._history_json,
+                best=self._best_value,
+            )
+            self._manager = tf.train.CheckpointManager(
+                checkpoint,
+                os.path.join(self._directory, model.name, self._run_id),
+                max_to_keep=self._max_to_keep,
+            )
+            self._tracked = tracked
+
+        return self._manager
+
+    def on_train_begin(self, logs: t.Logs | None = None) -> None:
+        """Start recording the logs on top of the history of the previous runs."""
+        self._logs: list[t.Logs] = list()
+
+    def on_epoch_end(self, epoch: int, logs: t.Logs | None = None) -> None:
+        """Save a checkpoint if required."""
+        logs = {name: float(value) for name, value in (logs or dict()).items()}
+        self._logs.append(logs)
+
+        if self._best_only:
+            current = logs.get(self._monitor)
+
+            if current is None:
+                return
+
+            if self._best is not None and (
+                current <= self._best if self._maximize else current >= self._best
+            ):
+                return
+
+            self._best = current
+
+        history = pd.DataFrame(self._logs)
+        history.insert(
+            0,
+            "epoch",
+            range(len(self.history) + 1, len(self.history) + len(self._logs) + 1),
+        )
+        history = pd.concat([self.history, history])
+
+        self._epoch.assign(len(history))
+        self._history_json.assign(history.to_json(orient="records"))
+        self._best_value.assign(math.nan if self._best is None else self._best)
+        self._get_manager(self.model).save(checkpoint_number=len(history))
+
+    def restore(self, model: t.Object) -> t.DataFrame | None:
+        """
+        Restore the latest checkpoint of the model, along with the best value of the
+        monitored log, so a resumed `best_only` run keeps improving on it.
+
+        Parameters
+        ----------
+        model : Model
+            Keras model to restore the weights and optimizer state of.
+
+        Returns
+        -------
+        DataFrame or None
+            Training history up to the checkpoint, None if there are no checkpoints.
+        """
+        manager = self._get_manager(model)
+
+        if manager.latest_checkpoint is None:
+            return None
+
+        manager.checkpoint.restore(manager.latest_checkpoint).expect_partial()
+        best = float(self._best_value.numpy())
+        self._best = None if math.isnan(best) else best
+        self.history = pd.read_json(
+            io.StringIO(self._history_json.numpy().decode()), orient="records"
+        )
+
+        return self.history
+
+    @property
+    def epoch(self) -> int:
+        """Number of the epochs completed at the latest saved or restored checkpoint."""
+        return int(self._epoch.numpy())
+
+    @property
+    def run_id(self) -> str:
+        """ID of the run the checkpoints are stored under."""
+        return self._run_id
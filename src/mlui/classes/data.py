@@ -1,12 +1,24 @@
+import contextlib
+import hashlib
 import io
+import itertools
+import json
+import time
+import typing
 
 import altair as alt
+import numpy as np
 import pandas as pd
 
+import mlui.classes.cache as cache
 import mlui.classes.errors as errors
+import mlui.classes.profile as profile
 import mlui.tools as tools
 import mlui.types.classes as t
 
+# Shared by all sessions, so versions are never reused by different DataFrames
+versions = itertools.count()
+
 
 class Data:
     """
@@ -27,6 +39,14 @@ class Data:
         This method resets the internal state of the DataFrame to an empty object.
         """
         self._dataframe: t.DataFrame = pd.DataFrame()
+        self._profile: profile.DataProfile = profile.DataProfile(self._dataframe)
+        self._upload_report: t.UploadReport | None = None
+        self._memory_usage: t.DataFrame = pd.DataFrame()
+        self._histograms: dict[tuple[str, int | None], t.DataFrame] = dict()
+        self._view: tuple[t.ViewKey, t.Indices | None] = (t.ViewKey(), None)
+        self._version: int = next(versions)
+        self._upload_key: tuple[str, bool, int | None] | None = None
+        self._digest: tuple[str, str] | None = None
         self.update_state()
 
     def update_state(self) -> None:
@@ -37,39 +57,398 @@ class Data:
         self._columns: t.Columns = list(self._dataframe.columns)
         self._unused_columns: t.Columns = self._columns.copy()
 
-    def upload(self, buff: io.BytesIO) -> None:
+    def upload(
+        self,
+        buff: io.BytesIO,
+        streaming: bool = False,
+        engine: t.Engine = "c",
+        arrow_dtypes: bool = False,
+        downcast: bool = False,
+        sketch_size: int | None = None,
+        columns: t.Columns | None = None,
+        measure_memory: bool = False,
+    ) -> None:
         """
         Upload data from a file into the DataFrame.
 
+        The format of the file is identified by its extension. For CSV files, the
+        delimiter and header are detected from a bounded prefix of the file, and the
+        file is parsed directly from the byte buffer without decoding it into a string
+        as a whole; compressed CSV files are decompressed as a stream while parsing.
+        Parquet, Feather/Arrow IPC, NPY and NPZ files are read without parsing, and
+        only the selected columns are read from them. Parsed and validated files are
+        cached on disk by the hash of their content, so uploading an identical file
+        again skips these steps. If the file and the options are the same as those of
+        the loaded data, e.g. on a rerun of the page, nothing is done, and the data
+        keeps its version.
+
         Parameters
         ----------
         buff : file-like object
             Byte buffer containing the data.
+        streaming : bool, optional
+            Whether to parse the file in chunks of rows, keeping the peak memory usage
+            close to the size of the final DataFrame.
+        engine : {'c', 'pyarrow'}, optional
+            Parser engine. The 'pyarrow' engine reads the file using all available
+            cores.
+        arrow_dtypes : bool, optional
+            Whether to keep the Arrow-backed dtypes in the DataFrame.
+        downcast : bool, optional
+            Whether to downcast the numeric columns to the smallest safe dtypes, with
+            `float32` for the float columns. It reduces the memory usage and avoids
+            casting the data on each call of the model's methods.
+        sketch_size : int or None, optional
+            Size of the quantile sketches for the approximate statistics. If provided,
+            the statistics are built chunk by chunk (during the parsing in the
+            streaming mode) without sorting the data, and the quartiles come with a
+            rank error bound; otherwise, the exact statistics are computed.
+        columns : list of str or None, optional
+            Columns to be read from a binary file, None to read all columns. Ignored
+            for CSV files.
+        measure_memory : bool, optional
+            Whether to trace the memory allocations of the upload for its report.
+            Tracing slows the upload down, so it is disabled by default.
 
         Raises
         ------
         UploadError
-            If there is an issue parsing the file. If there is an issue reading the file
-            to the DataFrame. If there is an issue validating the DataFrame.
+            If the file's format is not supported. If there is an issue parsing the
+            file. If there is an issue reading the file to the DataFrame. If there is an
+            issue validating the DataFrame.
         """
-        try:
-            csv_str = buff.getvalue().decode("utf-8")
-            delimiter = tools.data.parse_csv(csv_str)
-        except errors.ParseCSVError as error:
-            raise errors.UploadError(error)
+        start_time = time.perf_counter()
+        tracer = (
+            tools.data.trace_memory() if measure_memory else contextlib.nullcontext()
+        )
 
+        with tracer as get_peak:
+            backend = "arrow" if arrow_dtypes else "numpy"
+
+            try:
+                data_format = tools.data.get_data_format(buff.name)
+            except errors.ReadDataError as error:
+                raise errors.UploadError(error)
+
+            if data_format == "csv":
+                columns = None
+
+            key = self._get_cache_key(buff, data_format, backend, columns)
+            upload_key = (key, downcast, sketch_size)
+
+            if upload_key == self._upload_key:
+                return
+
+            cached = cache.data_cache.get(key)
+            approximate = (
+                profile.ApproximateProfile(sketch_size) if sketch_size else None
+            )
+            on_chunk = approximate.update if approximate else None
+
+            if cached is not None:
+                df, error = cached
+
+                if df is None:
+                    raise errors.UploadError(error)
+            else:
+                df = self._read(
+                    buff,
+                    key,
+                    data_format,
+                    streaming,
+                    engine,
+                    arrow_dtypes,
+                    on_chunk,
+                    columns,
+                )
+
+            memory_before = tools.data.get_memory_usage(df)
+
+            if downcast:
+                df = tools.data.downcast_numeric(df)
+
+            memory_after = tools.data.get_memory_usage(df)
+
+            self._dataframe = df
+            self._histograms = dict()
+            self._view = (t.ViewKey(), None)
+            self._version = next(versions)
+            self._profile = self._get_profile(df, approximate)
+            self._memory_usage = pd.concat(
+                [
+                    memory_before.rename("KiB before downcast"),
+                    memory_after.rename("KiB after downcast"),
+                ],
+                axis=1,
+            )
+            self._upload_report = self._get_upload_report(
+                buff,
+                start_time,
+                get_peak() if get_peak else None,
+                cached is not None,
+            )
+            self._upload_key = upload_key
+            self.update_state()
+
+    def read_columns(self, buff: io.BytesIO) -> t.Columns | None:
+        """
+        Read the column names of a binary data file without reading its data.
+
+        Parameters
+        ----------
+        buff : file-like object
+            Byte buffer containing the data.
+
+        Returns
+        -------
+        list of str or None
+            Column names, None for a CSV file.
+
+        Raises
+        ------
+        UploadError
+            If the file's format is not supported. If there is an issue reading the
+            file's metadata.
+        """
         try:
-            df = pd.read_csv(buff, sep=delimiter, header=0, skipinitialspace=True)
-        except (ValueError, pd.errors.ParserError) as error:
+            data_format = tools.data.get_data_format(buff.name)
+
+            if data_format == "csv":
+                return None
+
+            return tools.data.read_columns(buff, data_format)
+        except errors.ReadDataError as error:
             raise errors.UploadError(error)
 
+    def _get_cache_key(
+        self,
+        buff: io.BytesIO,
+        data_format: t.DataFormat,
+        backend: str,
+        columns: t.Columns | None,
+    ) -> str:
+        """
+        Get the data cache key of the file: the hash of its content and the reading
+        options affecting the result.
+
+        Parameters
+        ----------
+        buff : file-like object
+            Byte buffer containing the data.
+        data_format : {'csv', 'parquet', 'feather', 'npy', 'npz'}
+            Format of the data.
+        backend : {'numpy', 'arrow'}
+            Backend of the DataFrame's dtypes.
+        columns : list of str or None
+            Columns to be read, None to read all columns.
+
+        Returns
+        -------
+        str
+            Cache key.
+        """
+        key = f"{self._hash_buffer(buff)}-{data_format}-{backend}"
+
+        if columns is not None:
+            digest = hashlib.sha256(json.dumps(columns).encode()).hexdigest()
+            key = f"{key}-{digest[:16]}"
+
+        return key
+
+    def _hash_buffer(self, buff: io.BytesIO) -> str:
+        """
+        Compute the content hash of the buffer, reusing the digest of the last hashed
+        file with the same ID, which Streamlit's uploaded files carry, so the file is
+        not hashed again on each rerun of the page.
+
+        Parameters
+        ----------
+        buff : file-like object
+            Byte buffer containing the data.
+
+        Returns
+        -------
+        str
+            Hexadecimal SHA-256 digest of the buffer's content.
+        """
+        file_id = getattr(buff, "file_id", None)
+
+        if file_id is not None and self._digest and self._digest[0] == file_id:
+            return self._digest[1]
+
+        digest = tools.data.hash_buffer(buff)
+
+        if file_id is not None:
+            self._digest = (file_id, digest)
+
+        return digest
+
+    def _read(
+        self,
+        buff: io.BytesIO,
+        key: str,
+        data_format: t.DataFormat,
+        streaming: bool,
+        engine: t.Engine,
+        arrow_dtypes: bool,
+        on_chunk: typing.Callable[[t.DataFrame], None] | None,
+        columns: t.Columns | None,
+    ) -> t.DataFrame:
+        """
+        Parse and validate the data file, storing the result in the data cache.
+
+        Parameters
+        ----------
+        buff : file-like object
+            Byte buffer containing the data.
+        key : str
+            Hash of the buffer's content and the parsing options.
+        data_format : {'csv', 'parquet', 'feather', 'npy', 'npz'}
+            Format of the data.
+        streaming : bool
+            Whether to parse the file in chunks of rows.
+        engine : {'c', 'pyarrow'}
+            Parser engine.
+        arrow_dtypes : bool
+            Whether to keep the Arrow-backed dtypes in the DataFrame.
+        on_chunk : Callable or None
+            Function to be called with each parsed chunk in the streaming mode.
+        columns : list of str or None
+            Columns to be read from a binary file, None to read all columns.
+
+        Returns
+        -------
+        DataFrame
+            Parsed data.
+
+        Raises
+        ------
+        UploadError
+            If there is an issue parsing the file. If there is an issue reading the file
+            to the DataFrame. If there is an issue validating the DataFrame.
+        """
+        chunksize = tools.data.CHUNK_SIZE if streaming else None
+
+        if data_format == "csv":
+            compression = tools.data.get_compression(buff.name)
+
+            # The delimiter is detected from the first decompressed block, and the
+            # data is then parsed from a fresh stream
+            try:
+                with tools.data.open_stream(buff, compression) as stream:
+                    delimiter = tools.data.sniff_csv(stream)
+            except (errors.ParseCSVError, errors.ReadDataError) as error:
+                raise errors.UploadError(error)
+
+            # The lines are counted in a cheap first pass, so the streamed chunks can be
+            # copied into the columns allocated up front instead of being concatenated
+            rows = None
+
+            if chunksize is not None and engine == "c" and not arrow_dtypes:
+                try:
+                    with tools.data.open_stream(buff, compression) as stream:
+                        rows = max(tools.data.count_lines(stream) - 1, 0)
+                except errors.ReadDataError as error:
+                    raise errors.UploadError(error)
+
+            try:
+                with tools.data.open_stream(buff, compression) as stream:
+                    df = tools.data.read_csv(
+                        stream,
+                        delimiter,
+                        chunksize,
+                        engine,
+                        arrow_dtypes,
+                        on_chunk,
+                        rows,
+                    )
+            except (
+                ValueError,
+                pd.errors.ParserError,
+                errors.ReadDataError,
+            ) as error:
+                raise errors.UploadError(error)
+        else:
+            try:
+                df = tools.data.read_binary(buff, data_format, columns, arrow_dtypes)
+            except errors.ReadDataError as error:
+                raise errors.UploadError(error)
+
         try:
             tools.data.validate_df(df)
         except errors.ValidateDataError as error:
+            cache.data_cache.set(key, None, str(error))
             raise errors.UploadError(error)
 
-        self._dataframe = df
-        self.update_state()
+        cache.data_cache.set(key, df, None)
+
+        return df
+
+    def _get_profile(
+        self, df: t.DataFrame, approximate: profile.ApproximateProfile | None
+    ) -> profile.DataProfile:
+        """
+        Get the profile of the uploaded DataFrame.
+
+        Parameters
+        ----------
+        df : DataFrame
+            Uploaded data.
+        approximate : ApproximateProfile or None
+            Approximate profile to be completed, None for the exact profile.
+
+        Returns
+        -------
+        DataProfile
+            Exact or approximate profile of the data.
+        """
+        if approximate is None:
+            return profile.DataProfile(df)
+
+        # The profile is already built if the data has been parsed in chunks
+        if not approximate.rows:
+            for chunk in tools.data.iter_chunks(df):
+                approximate.update(chunk)
+
+        return approximate
+
+    def _get_upload_report(
+        self,
+        buff: io.BytesIO,
+        start_time: float,
+        peak: float | None,
+        cached: bool,
+    ) -> t.UploadReport:
+        """
+        Measure the performance of the upload that has just finished.
+
+        Parameters
+        ----------
+        buff : file-like object
+            Byte buffer containing the data.
+        start_time : float
+            Value of the performance counter at the start of the upload.
+        peak : float or None
+            Peak traced memory allocation during the upload in megabytes, None if the
+            memory has not been traced.
+        cached : bool
+            Whether the data has been loaded from the data cache.
+
+        Returns
+        -------
+        UploadReport
+            Upload time in seconds, size of the file in megabytes, peak traced memory
+            allocation per megabyte of the file (None if not traced), and the cache hit
+            flag.
+        """
+        size = buff.getbuffer().nbytes / 2**20
+
+        return {
+            "time": time.perf_counter() - start_time,
+            "size": size,
+            "peak_memory": None if peak is None else peak / size if size else 0.0,
+            "cached": cached,
+        }
 
     def set_unused_columns(self, available: list[str], selected: list[str]) -> None:
         """
@@ -105,36 +484,45 @@ class Data:
 
     def get_stats(self) -> t.DataFrame:
         """
-        Get descriptive statistics and data types information for the DataFrame.
+        Get descriptive statistics, data types and memory usage information for the
+        DataFrame. The statistics are read from the profile computed on upload. For
+        the approximate profile, the rank error bound of the quartiles is included.
 
         Returns
         -------
         DataFrame
-            DataFrame containing descriptive statistics and data types information.
-
-        Raises
-        ------
-        PlotError
-            If there is an issue generating the statistics.
+            DataFrame containing descriptive statistics, data types and memory usage
+            of each column before and after the downcasting.
         """
-        try:
-            stats = pd.concat(
-                [
-                    self._dataframe.describe().transpose(),
-                    self._dataframe.dtypes.rename("dtype"),
-                    pd.Series(
-                        self._dataframe.isnull().mean().round(3).mul(100),
-                        name="% of NULLs",
-                    ),
-                ],
-                axis=1,
-            )
-        except ValueError:
-            stats = pd.DataFrame()
-
-        return stats
-
-    def plot_columns(self, x: str | None, y: str | None, points: bool) -> t.Chart:
+        if self.empty:
+            return pd.DataFrame()
+
+        table = self._profile.table
+        nulls = table["nulls"].div(self._profile.rows).round(3).mul(100)
+        stats = table.drop(columns=["nulls", "dtype", "numeric"])
+
+        if "rank error" in stats:
+            stats["rank error"] = stats["rank error"].mul(100).round(2)
+            stats = stats.rename(columns={"rank error": "± % rank error"})
+
+        return pd.concat(
+            [
+                stats,
+                self._dataframe.dtypes.rename("dtype"),
+                nulls.rename("% of NULLs"),
+                self._memory_usage.round(1),
+            ],
+            axis=1,
+        )
+
+    def plot_columns(
+        self,
+        x: str | None,
+        y: str | None,
+        points: bool,
+        max_points: int | None = tools.data.PLOT_POINTS,
+        bins: int | None = None,
+    ) -> t.Chart:
         """
         Plot columns from the DataFrame.
 
@@ -146,6 +534,13 @@ class Data:
             Column to use for the y-axis.
         points : bool
             Whether to include points on the plot.
+        max_points : int or None, optional
+            Maximum number of points of the line plot. Longer series are downsampled
+            on the server with the Largest-Triangle-Three-Buckets algorithm, which
+            preserves the visual shape of the line. If None, all points are plotted.
+        bins : int or None, optional
+            Number of bins of the histogram. If None, it is determined automatically.
+            The histogram is binned on the server and cached until the data changes.
 
         Returns
         -------
@@ -161,7 +556,7 @@ class Data:
             raise errors.PlotError("Please, select the columns!")
 
         if x == y:
-            columns = self._dataframe.loc[:, [x]].rename(columns={x: "Column"})
+            columns = self._dataframe[x].to_frame("Column")
         else:
             columns = (
                 self._dataframe.loc[:, [x, y]]
@@ -173,13 +568,25 @@ class Data:
             raise errors.PlotError("Unable to plot columns of non-numeric dtype!")
 
         try:
+            if x == y:
+                columns = self._get_histogram(x, bins)
+            elif max_points is not None and len(columns) > max_points:
+                columns = columns.dropna()
+                indices = tools.data.downsample_lttb(
+                    columns["Column_1"].to_numpy(dtype="float64", na_value=np.nan),
+                    columns["Column_2"].to_numpy(dtype="float64", na_value=np.nan),
+                    max_points,
+                )
+                columns = columns.iloc[indices]
+
             if x == y:
                 chart = (
                     alt.Chart(columns)
                     .mark_bar()
                     .encode(
-                        x=alt.X("Column").title(x),
-                        y=alt.Y("count()"),
+                        x=alt.X("Bin_Start").bin("binned").title(x),
+                        x2=alt.X2("Bin_End"),
+                        y=alt.Y("Count").title("Count of Records"),
                     )
                     .interactive(bind_x=True)
                     .properties(height=500)
@@ -201,10 +608,147 @@ class Data:
 
         return chart
 
+    def get_page(
+        self,
+        page: int,
+        page_size: int,
+        sort_by: str | None = None,
+        ascending: bool = True,
+        filter_by: str | None = None,
+        bounds: tuple[float, float] | None = None,
+    ) -> tuple[t.DataFrame, int]:
+        """
+        Get a page of rows of the DataFrame, optionally filtered and sorted.
+
+        Only the rows of the page are sliced out of the DataFrame. The order of the
+        filtered and sorted rows is computed once and reused for the next pages until
+        the view options or the data change.
+
+        Parameters
+        ----------
+        page : int
+            Zero-based index of the page.
+        page_size : int
+            Number of rows per page.
+        sort_by : str or None, optional
+            Column to sort the rows by, None to keep the original order.
+        ascending : bool, optional
+            Whether to sort the rows in ascending order.
+        filter_by : str or None, optional
+            Numeric column to filter the rows by, None to keep all rows.
+        bounds : tuple of float or None, optional
+            Inclusive lower and upper bounds of the values in the `filter_by` column.
+
+        Returns
+        -------
+        tuple of DataFrame and int
+            Rows of the page and total number of rows passing the filter.
+        """
+        positions = self._get_view_positions(
+            t.ViewKey(sort_by, ascending, filter_by, bounds)
+        )
+        start = page * page_size
+
+        if positions is None:
+            rows = self._dataframe.iloc[start : start + page_size]
+            return rows, len(self._dataframe)
+
+        rows = self._dataframe.iloc[positions[start : start + page_size]]
+
+        return rows, len(positions)
+
+    def _get_view_positions(self, key: t.ViewKey) -> t.Indices | None:
+        """
+        Get the positions of the filtered and sorted rows, computing them only if the
+        view options have changed.
+
+        Parameters
+        ----------
+        key : ViewKey
+            Sorting and filtering options.
+
+        Returns
+        -------
+        NDArray or None
+            Positions of the rows, None if the rows are neither filtered nor sorted.
+        """
+        cached_key, positions = self._view
+
+        if key == cached_key:
+            return positions
+
+        if key.filter_by is not None and key.bounds is not None:
+            lower, upper = key.bounds
+            column = self._dataframe[key.filter_by]
+            positions = np.flatnonzero(column.between(lower, upper).to_numpy(bool))
+        elif key.sort_by is not None:
+            positions = np.arange(len(self._dataframe))
+        else:
+            positions = None
+
+        if key.sort_by is not None and positions is not None:
+            column = self._dataframe[key.sort_by].take(positions)
+            order = column.reset_index(drop=True).sort_values(
+                ascending=key.ascending, kind="stable", na_position="last"
+            )
+            positions = positions[order.index.to_numpy()]
+
+        self._view = (key, positions)
+
+        return positions
+
+    def _get_histogram(self, column: str, bins: int | None) -> t.DataFrame:
+        """
+        Get the histogram of the column, computing it on the first request.
+
+        Parameters
+        ----------
+        column : str
+            Name of the column.
+        bins : int or None
+            Number of bins, None to determine it automatically.
+
+        Returns
+        -------
+        DataFrame
+            Start, end and count of records of each bin.
+        """
+        key = (column, bins)
+
+        if key not in self._histograms:
+            values = self._dataframe[column].to_numpy(dtype="float64", na_value=np.nan)
+            self._histograms[key] = tools.data.compute_histogram(values, bins)
+
+        return self._histograms[key]
+
     @property
     def dataframe(self) -> t.DataFrame:
-        """Copy of the DataFrame."""
-        return self._dataframe.copy()
+        """
+        Zero-copy view of the DataFrame. Its NumPy arrays are read-only, and any
+        modification of the view copies the affected data instead of changing the
+        original DataFrame.
+        """
+        return self._dataframe.copy(deep=False)
+
+    @property
+    def version(self) -> int:
+        """
+        Version of the DataFrame, changed on each upload and reset. Objects derived
+        from the DataFrame can be cached by it.
+        """
+        return self._version
+
+    @property
+    def upload_report(self) -> t.UploadReport | None:
+        """Performance report of the last upload, None if no file is uploaded."""
+        return self._upload_report.copy() if self._upload_report else None
+
+    @property
+    def numeric_columns(self) -> t.Columns:
+        """Names of the columns with numeric data types."""
+        table = self._profile.table
+
+        return list(table.index[table["numeric"].astype(bool)])
 
     @property
     def columns(self) -> t.Columns:
@@ -214,7 +758,7 @@ class Data:
     @property
     def has_nans(self) -> bool:
         """True if there are NaN values in the DataFrame, False otherwise."""
-        return tools.data.contains_nans(self._dataframe)
+        return self._profile.has_nans
 
     @property
     def has_nonnumeric_dtypes(self) -> bool:
@@ -222,7 +766,7 @@ class Data:
         True if the DataFrame contains columns with non-numeric data types, False
         otherwise.
         """
-        return tools.data.contains_nonnumeric_dtypes(self._dataframe)
+        return self._profile.has_nonnumeric_dtypes
 
     @property
     def empty(self) -> bool:
@@ -10,6 +10,10 @@ class ParseCSVError(Exception):
     """For errors during the process of parsing a file."""
 
 
+class ReadDataError(Exception):
+    """For errors during the process of reading or decompressing a data file."""
+
+
 class ValidateDataError(Exception):
     """For errors during the process of validating the data file."""
 
@@ -36,3 +40,7 @@ class DeleteError(Exception):
 
 class PlotError(Exception):
     """For errors during the process of displaying a plot."""
+
+
+class SweepError(Exception):
+    """For errors during the process of running a hyperparameter sweep."""
@@ -1,17 +1,148 @@
+import collections
+import concurrent.futures
+import hashlib
 import io
+import json
+import multiprocessing
+import shutil
 import tempfile
+import time
 import typing
+import weakref
 
 import altair as alt
+import numpy as np
 import pandas as pd
 import tensorflow as tf
 
+import mlui.classes.cache as cache
+import mlui.classes.data as data
 import mlui.classes.errors as errors
 import mlui.enums as enums
 import mlui.tools as tools
 import mlui.types.classes as t
 
 
+# State of a cross-validation process, set by `_init_fold_process`
+_fold_state: dict[str, typing.Any] = dict()
+
+
+def _init_fold_process(
+    threads: int,
+    model_bytes: bytes,
+    compile_config: dict[str, typing.Any],
+    x: dict[str, t.SharedArray],
+    y: dict[str, t.SharedArray],
+) -> None:
+    """
+    Initialize a process of the cross-validation pool: limit the TensorFlow thread
+    pools and attach to the shared arrays of the features.
+
+    Parameters
+    ----------
+    threads : int
+        Number of the intra-op threads of each fold.
+    model_bytes : bytes
+        Saved model, cloned for each fold.
+    compile_config : dict
+        Arguments of the model's `compile` method, with the serialized optimizer.
+    x : dict of {str to SharedArray}
+        Shared input data of each input layer.
+    y : dict of {str to SharedArray}
+        Shared output data of each output layer.
+    """
+    tf.config.threading.set_intra_op_parallelism_threads(threads)
+    tf.config.threading.set_inter_op_parallelism_threads(1)
+    tf.get_logger().setLevel("ERROR")
+
+    blocks = list()
+    arrays: list[t.LayerData] = [dict(), dict()]
+
+    for side, specs in zip(arrays, (x, y)):
+        for layer, spec in specs.items():
+            block, side[layer] = tools.data.attach_array(spec)
+            blocks.append(block)
+
+    _fold_state.update(
+        model_bytes=model_bytes,
+        compile_config=compile_config,
+        x=arrays[0],
+        y=arrays[1],
+        blocks=blocks,
+    )
+
+
+def _run_fold(
+    fold: tuple[int, int], batch_size: int, num_epochs: int
+) -> dict[str, float]:
+    """
+    Fit a clone of the model to the rows outside the fold and evaluate it on the fold
+    in a process of the cross-validation pool.
+
+    Parameters
+    ----------
+    fold : tuple of int
+        First and after the last row of the fold.
+    batch_size : int
+        Batch size.
+    num_epochs : int
+        Number of epochs.
+
+    Returns
+    -------
+    dict of {str to float}
+        Logs of the evaluation on the fold and the wall time of the fold.
+    """
+    start = time.perf_counter()
+
+    with tempfile.NamedTemporaryFile(suffix=".h5") as tmp:
+        tmp.write(_fold_state["model_bytes"])
+        tmp.flush()
+
+        clone = tf.keras.models.load_model(tmp.name, compile=False)
+
+    config = dict(_fold_state["compile_config"])
+    config["optimizer"] = tf.keras.optimizers.deserialize(config["optimizer"])
+    clone.compile(**config)
+
+    x, y = _fold_state["x"], _fold_state["y"]
+    train = tools.model.make_dataset(
+        x, y, batch_size, shuffle=True, memmap=True, skip=fold
+    )
+    val = tools.model.make_dataset(
+        x, y, batch_size, start=fold[0], stop=fold[1], memmap=True
+    )
+
+    clone.fit(x=train, epochs=num_epochs, verbose=0)
+    logs = clone.evaluate(x=val, return_dict=True, verbose=0)
+
+    return {
+        **{name: float(value) for name, value in logs.items()},
+        "time, s": time.perf_counter() - start,
+    }
+
+
+LATENCY_WINDOW = 1_000
+
+
+class EpochTimer(tf.keras.callbacks.Callback):
+    """Callback measuring the wall time of each training epoch."""
+
+    def __init__(self) -> None:
+        """Initialize the callback with no measured epochs."""
+        super().__init__()
+
+        self.times: list[float] = list()
+
+    def on_epoch_begin(self, epoch: int, logs: t.Logs | None = None) -> None:
+        """Start the timer."""
+        self._start = time.perf_counter()
+
+    def on_epoch_end(self, epoch: int, logs: t.Logs | None = None) -> None:
+        """Record the elapsed time."""
+        self.times.append(time.perf_counter() - self._start)
+
+
 class Model:
     """
     Class representing a machine learning model.
@@ -48,6 +179,11 @@ class Model:
         self._metrics: t.LayerMetrics = dict.fromkeys(self._outputs, list())
         self._callbacks: t.Callbacks = dict()
         self._compiled: bool = self._object._is_compiled
+        self._jit_compile: bool = False
+        self._steps_per_execution: int = 1
+        self._mixed_precision: bool = False
+        self._compiled_losses: t.LayerLosses = dict()
+        self._compiled_metrics: t.LayerMetrics = dict()
         self._history: t.DataFrame = pd.DataFrame()
 
     def update_state(self) -> None:
@@ -58,6 +194,7 @@ class Model:
         self._output_features: t.LayerFeatures = dict.fromkeys(self._outputs, list())
         self._input_configured: t.LayerConfigured = dict.fromkeys(self._inputs, False)
         self._output_configured: t.LayerConfigured = dict.fromkeys(self._outputs, False)
+        self._layer_data: dict[t.LayerDataKey, t.LayerData] = dict()
 
     def _shapes_to_list(self, shapes: t.Shapes) -> list[t.Shape]:
         """
@@ -117,7 +254,43 @@ class Model:
         Returns
         -------
         dict of {str to NDArray}
-            Processed data.
+            Processed data as C-contiguous `float32` arrays.
+        """
+        if at == "input":
+            layers = self._inputs
+            features = self._input_features
+        else:
+            layers = self._outputs
+            features = self._output_features
+
+        return {
+            layer: np.ascontiguousarray(
+                data[features[layer]].to_numpy(np.float32, na_value=np.nan)
+            )
+            for layer in layers
+        }
+
+    def _get_out_of_core_data(self, data: t.DataFrame, at: t.Side) -> t.LayerData:
+        """
+        Write the input or output data of each layer to a memory-mapped `float32`
+        file, so that it can be read from disk batch by batch.
+
+        Parameters
+        ----------
+        data : DataFrame
+            Input or output data.
+        at : {'input', 'output'}
+            Side to process data for.
+
+        Returns
+        -------
+        dict of {str to NDArray}
+            Memory-mapped data.
+
+        Raises
+        ------
+        ModelError
+            If there is an issue writing the data.
         """
         if at == "input":
             layers = self._inputs
@@ -126,7 +299,62 @@ class Model:
             layers = self._outputs
             features = self._output_features
 
-        return {layer: data[features[layer]].to_numpy() for layer in layers}
+        try:
+            return {
+                layer: tools.data.write_memmap(data, features[layer])
+                for layer in layers
+            }
+        except OSError:
+            raise errors.ModelError("Unable to write the data to disk!")
+
+    def _get_layer_data(
+        self, data: data.Data, at: t.Side, out_of_core: bool
+    ) -> t.LayerData:
+        """
+        Get the input or output data of each layer, in memory or memory-mapped.
+
+        The processed data is cached by the version of the DataFrame and the features
+        of the layers, so repeated calls skip the processing until the data is
+        uploaded or reset, or the features are set.
+
+        Parameters
+        ----------
+        data : Data
+            Data object.
+        at : {'input', 'output'}
+            Side to process data for.
+        out_of_core : bool
+            Whether to write the data to memory-mapped files.
+
+        Returns
+        -------
+        dict of {str to NDArray}
+            Processed data.
+        """
+        features = self._input_features if at == "input" else self._output_features
+        key = (
+            data.version,
+            at,
+            out_of_core,
+            tuple((layer, tuple(columns)) for layer, columns in features.items()),
+        )
+
+        if key not in self._layer_data:
+            # Only the data processed from the current DataFrame is kept
+            self._layer_data = {
+                cached_key: layer_data
+                for cached_key, layer_data in self._layer_data.items()
+                if cached_key[0] == data.version
+            }
+
+            if out_of_core:
+                layer_data = self._get_out_of_core_data(data.dataframe, at)
+            else:
+                layer_data = self._get_processed_data(data.dataframe, at)
+
+            self._layer_data[key] = layer_data
+
+        return self._layer_data[key]
 
     def set_optimizer(self, entity: str, params: t.OptimizerParams) -> None:
         """
@@ -221,10 +449,30 @@ class Model:
         """
         return self._metrics[layer].copy() if self._metrics.get(layer) else list()
 
-    def compile(self) -> None:
+    def compile(
+        self,
+        jit_compile: bool = False,
+        steps_per_execution: int = 1,
+        mixed_precision: bool = False,
+    ) -> None:
         """
         Compile the model.
 
+        Parameters
+        ----------
+        jit_compile : bool, optional
+            Whether to compile the training, evaluation and prediction steps with XLA,
+            fusing their operations into fewer kernels.
+        steps_per_execution : int, optional
+            Number of batches to run in each call of the compiled step function. Larger
+            values reduce the per-step Python and dispatch overhead, but the callbacks
+            receive the batch logs less frequently.
+        mixed_precision : bool, optional
+            Whether to compute the hidden layers in bfloat16 while keeping their
+            variables and the output layers in float32. On CPUs supporting bfloat16
+            instructions it speeds up the training and halves the memory taken by the
+            activations. Switching it rebuilds the model with the same weights.
+
         Raises
         ------
         ModelError
@@ -238,14 +486,163 @@ class Model:
                 "Please, set the loss function for each output layer!"
             )
 
+        if mixed_precision != self._mixed_precision:
+            self._object = self._clone(mixed_precision)
+            self._optimizer = self._optimizer.from_config(self._optimizer.get_config())
+            self._mixed_precision = mixed_precision
+
         try:
             self._object.compile(
-                optimizer=self._optimizer, loss=self._losses, metrics=self._metrics
+                optimizer=self._optimizer,
+                loss=self._losses,
+                metrics=self._metrics,
+                jit_compile=jit_compile,
+                steps_per_execution=steps_per_execution,
             )
         except (ValueError, AttributeError, TypeError):
             raise errors.ModelError("Unable to compile the model!")
 
+        # The losses and metrics can be set again without recompiling the model, so the
+        # compiled ones are kept for the result cache keys
         self._compiled = True
+        self._compiled_losses = self._losses.copy()
+        self._compiled_metrics = {
+            layer: list(metrics or list()) for layer, metrics in self._metrics.items()
+        }
+        self._jit_compile = jit_compile
+        self._steps_per_execution = steps_per_execution
+
+    def _clone(self, mixed_precision: bool) -> t.Object:
+        """
+        Rebuild the model with the same architecture and weights under the precision
+        policy.
+
+        Parameters
+        ----------
+        mixed_precision : bool
+            Whether to compute the layers in bfloat16, except for the output ones.
+
+        Returns
+        -------
+        Model
+            Rebuilt uncompiled Keras model.
+
+        Raises
+        ------
+        ModelError
+            If the model cannot be rebuilt, e.g. if it is not a functional model.
+        """
+        policy = "mixed_bfloat16" if mixed_precision else "float32"
+
+        def clone_layer(layer: tf.keras.layers.Layer) -> tf.keras.layers.Layer:
+            """Create a copy of the layer with the dtype policy."""
+            dtype = "float32" if layer.name in self._outputs else policy
+
+            return layer.__class__.from_config({**layer.get_config(), "dtype": dtype})
+
+        try:
+            clone = tf.keras.models.clone_model(
+                self._object, clone_function=clone_layer
+            )
+            clone.set_weights(self._object.get_weights())
+        except (ValueError, AttributeError, TypeError):
+            raise errors.ModelError("Unable to set the precision of the model!")
+
+        return clone
+
+    def benchmark(
+        self, data: data.Data, batch_size: int, num_epochs: int
+    ) -> t.DataFrame:
+        """
+        Compare the per-epoch training time, throughput and activations memory of the
+        model compiled with the current settings against the default ones.
+
+        Each configuration trains a copy of the model with a copy of its optimizer
+        starting from the same weights, so the model itself is left untouched. The
+        first epoch includes the tracing and, with XLA, the compilation of the step
+        function, so it is reported separately from the remaining ones.
+
+        Parameters
+        ----------
+        data : Data
+            Data object.
+        batch_size : int
+            Batch size.
+        num_epochs : int
+            Number of epochs to train each configuration for.
+
+        Returns
+        -------
+        DataFrame
+            First epoch time, median time of the remaining epochs, its speedup over
+            the default settings, throughput in samples per second, and memory taken
+            by the activations of a batch for each configuration.
+
+        Raises
+        ------
+        ModelError
+            If there is an issue benchmarking the model.
+        """
+        if not self._compiled:
+            raise errors.ModelError("Please, compile the model first!")
+
+        if data.has_nonnumeric_dtypes:
+            raise errors.ModelError("The data for fitting contains non-numeric values!")
+
+        x = self._get_layer_data(data, "input", False)
+        y = self._get_layer_data(data, "output", False)
+        dataset = tools.model.make_dataset(x, y, batch_size, shuffle=True)
+        configs = {
+            "Default": (False, 1, False),
+            "Current": (
+                self._jit_compile,
+                self._steps_per_execution,
+                self._mixed_precision,
+            ),
+        }
+        rows = list()
+
+        for config, (jit_compile, steps_per_execution, mixed) in configs.items():
+            timer = EpochTimer()
+            clone = self._clone(mixed)
+
+            try:
+                clone.compile(
+                    optimizer=self._optimizer.from_config(self._optimizer.get_config()),
+                    loss=self._losses,
+                    metrics=self._metrics,
+                    jit_compile=jit_compile,
+                    steps_per_execution=steps_per_execution,
+                )
+                clone.fit(x=dataset, epochs=num_epochs, callbacks=[timer], verbose=0)
+            except (
+                RuntimeError,
+                ValueError,
+                AttributeError,
+                TypeError,
+                tf.errors.OpError,
+            ):
+                raise errors.ModelError("Unable to benchmark the model!")
+
+            rows.append(
+                {
+                    "configuration": config,
+                    "jit_compile": jit_compile,
+                    "steps_per_execution": steps_per_execution,
+                    "mixed_precision": mixed,
+                    "first epoch, s": timer.times[0],
+                    "epoch, s": float(np.median(timer.times[1:] or timer.times)),
+                    "activations, MiB": tools.model.get_activations_size(
+                        clone, batch_size
+                    ),
+                }
+            )
+
+        results = pd.DataFrame(rows)
+        results["speedup"] = results["epoch, s"].iloc[0] / results["epoch, s"]
+        results["samples/s"] = len(data.dataframe) / results["epoch, s"]
+
+        return results
 
     def set_features(self, layer: str, columns: t.Columns, at: t.Side) -> None:
         """
@@ -289,6 +686,7 @@ class Model:
             configured[layer] = False
 
         features[layer] = columns
+        self._layer_data.clear()
 
     def get_features(self, layer: str, at: t.Side) -> t.Features:
         """
@@ -365,44 +763,254 @@ class Model:
         self._callbacks.pop(entity, None)
 
     def fit(
-        self, data: t.DataFrame, batch_size: int, num_epochs: int, val_split: float
+        self,
+        data: data.Data,
+        batch_size: int,
+        num_epochs: int,
+        val_split: float,
+        out_of_core: bool = False,
+        callbacks: list[tf.keras.callbacks.Callback] | None = None,
     ) -> None:
         """
         Fit the model to the provided data.
 
+        The data is split into the training and validation rows up front, and both
+        are fed to the model through input pipelines which shuffle the training rows,
+        gather the batches in parallel and prefetch them.
+        The progress is not printed; it can be tracked with the callbacks instead.
+
         Parameters
         ----------
-        data : DataFrame
-            Input and output data.
+        data : Data
+            Data object.
         batch_size : int
             Batch size.
         num_epochs : int
             Number of epochs.
         val_split : float
             Validation split.
+        out_of_core : bool, optional
+            Whether to write the data to memory-mapped files and read it from disk
+            batch by batch, instead of keeping its copies in memory. The last
+            `val_split` fraction of the rows is used for the validation in both modes.
+        callbacks : list of Callback or None, optional
+            Additional callbacks for this fit only, on top of the model's callbacks.
 
         Raises
         ------
         ModelError
             If there is an issue fitting the model.
         """
-        if tools.data.contains_nonnumeric_dtypes(data):
+        if data.has_nonnumeric_dtypes:
             raise errors.ModelError("The data for fitting contains non-numeric values!")
 
+        x = self._get_layer_data(data, "input", out_of_core)
+        y = self._get_layer_data(data, "output", out_of_core)
+
+        if not out_of_core:
+            x, y = tools.model.to_tensors(x), tools.model.to_tensors(y)
+
+        rows = len(data.dataframe)
+        split = int(rows * (1 - val_split))
+        train = tools.model.make_dataset(
+            x, y, batch_size, stop=split, shuffle=True, memmap=out_of_core
+        )
+        val = None
+
+        if split < rows:
+            val = tools.model.make_dataset(
+                x, y, batch_size, start=split, memmap=out_of_core
+            )
+
+        checkpoint = self._callbacks.get("Checkpoint")
+
+        if checkpoint is not None:
+            checkpoint.history = self._history
+
+        # The epochs continue the history, e.g. the one restored from a checkpoint
+        initial_epoch = len(self._history)
+
         try:
             logs = self._object.fit(
-                x=self._get_processed_data(data, "input"),
-                y=self._get_processed_data(data, "output"),
-                batch_size=batch_size,
-                epochs=num_epochs,
-                validation_split=val_split,
-                callbacks=self._callbacks.values(),
+                x=train,
+                validation_data=val,
+                epochs=initial_epoch + num_epochs,
+                initial_epoch=initial_epoch,
+                callbacks=[*self._callbacks.values(), *(callbacks or list())],
+                verbose=0,
             )
-        except (RuntimeError, ValueError, AttributeError, TypeError):
+        except (
+            RuntimeError,
+            ValueError,
+            AttributeError,
+            TypeError,
+            tf.errors.OpError,
+        ):
             raise errors.ModelError("Unable to fit the model!")
 
         self._update_history(pd.DataFrame(logs.history))
 
+    def cross_validate(
+        self,
+        data: data.Data,
+        num_folds: int,
+        batch_size: int,
+        num_epochs: int,
+        threads: int = 1,
+        shuffle: bool = True,
+        seed: int = 0,
+    ) -> t.CrossValidationReport:
+        """
+        Estimate the performance of the model with the K-fold cross-validation.
+
+        The rows are shuffled with a seeded permutation, so the folds don't follow the
+        order of the file, and split into `num_folds` folds. For each fold, a clone of
+        the compiled model starting from its current weights is fitted to the other
+        rows and evaluated on the fold. The folds are run in parallel processes, each
+        limiting TensorFlow to `threads` intra-op threads, and all of them read the
+        features from a single read-only copy in shared memory. The model itself is
+        left untouched.
+
+        Parameters
+        ----------
+        data : Data
+            Data object.
+        num_folds : int
+            Number of folds.
+        batch_size : int
+            Batch size.
+        num_epochs : int
+            Number of epochs.
+        threads : int, optional
+            Number of the intra-op threads of each fold. The pool has as many
+            processes as fit into the available cores.
+        shuffle : bool, optional
+            Whether to shuffle the rows before splitting them into the folds. If
+            False, the folds are contiguous ranges of the rows.
+        seed : int, optional
+            Seed of the permutation of the rows, so the folds are reproducible.
+
+        Returns
+        -------
+        CrossValidationReport
+            Evaluation logs and wall time of each fold, their mean and standard
+            deviation across the folds, and the wall time of the whole run.
+
+        Raises
+        ------
+        ModelError
+            If there is an issue cross-validating the model.
+        """
+        if not self._compiled:
+            raise errors.ModelError("Please, compile the model first!")
+
+        if data.has_nonnumeric_dtypes:
+            raise errors.ModelError("The data for fitting contains non-numeric values!")
+
+        rows = len(data.dataframe)
+
+        if not 2 <= num_folds <= rows:
+            raise errors.ModelError(
+                "The number of folds must be between 2 and the number of rows!"
+            )
+
+        x = self._get_layer_data(data, "input", False)
+        y = self._get_layer_data(data, "output", False)
+        folds = [
+            (rows * i // num_folds, rows * (i + 1) // num_folds)
+            for i in range(num_folds)
+        ]
+        processes = max(1, tools.model.get_available_cores() // threads)
+        compile_config = {
+            "optimizer": tf.keras.optimizers.serialize(self._optimizer),
+            "loss": self._compiled_losses,
+            "metrics": self._compiled_metrics,
+            "jit_compile": self._jit_compile,
+            "steps_per_execution": self._steps_per_execution,
+        }
+        # The rows are permuted while being copied to the shared memory, so each fold
+        # is still a contiguous slice of the shared arrays
+        permutation = np.random.default_rng(seed).permutation(rows) if shuffle else None
+        blocks = list()
+        start = time.perf_counter()
+
+        try:
+            shared: list[dict[str, t.SharedArray]] = [dict(), dict()]
+
+            for specs, arrays in zip(shared, (x, y)):
+                for layer, array in arrays.items():
+                    block, specs[layer] = tools.data.share_array(array, permutation)
+                    blocks.append(block)
+
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(processes, num_folds),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_fold_process,
+                initargs=(threads, self.as_bytes, compile_config, *shared),
+            ) as executor:
+                logs = list(
+                    executor.map(
+                        _run_fold,
+                        folds,
+                        [batch_size] * num_folds,
+                        [num_epochs] * num_folds,
+                    )
+                )
+        except (
+            RuntimeError,
+            ValueError,
+            TypeError,
+            OSError,
+            tf.errors.OpError,
+            concurrent.futures.process.BrokenProcessPool,
+        ):
+            raise errors.ModelError("Unable to cross-validate the model!")
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+        results = pd.DataFrame(logs, index=pd.RangeIndex(1, num_folds + 1, name="fold"))
+        results.insert(0, "rows", [last - first for first, last in folds])
+
+        return {
+            "folds": results,
+            "summary": results.drop(columns="rows").agg(["mean", "std"]),
+            "wall_time": time.perf_counter() - start,
+        }
+
+    def restore_checkpoint(self) -> int:
+        """
+        Restore the weights, optimizer state and training history of the model from
+        its latest checkpoint, so that the next fit resumes the interrupted run.
+
+        Returns
+        -------
+        int
+            Number of the epochs completed at the restored checkpoint.
+
+        Raises
+        ------
+        ModelError
+            If there is an issue restoring the checkpoint.
+        """
+        checkpoint = self._callbacks.get("Checkpoint")
+
+        if checkpoint is None:
+            raise errors.ModelError("Please, set the Checkpoint callback!")
+
+        try:
+            history = checkpoint.restore(self._object)
+        except (ValueError, AssertionError, tf.errors.OpError):
+            raise errors.ModelError("Unable to restore the checkpoint!")
+
+        if history is None:
+            raise errors.ModelError("There are no checkpoints for this model!")
+
+        self._history = history
+
+        return checkpoint.epoch
+
     def _update_history(self, logs: t.DataFrame) -> None:
         """
         Update the training history with new logs.
@@ -522,10 +1130,28 @@ class Model:
         """True if the model is compiled, False otherwise."""
         return self._compiled
 
+    @property
+    def jit_compile(self) -> bool:
+        """True if the model is compiled with XLA, False otherwise."""
+        return self._jit_compile
+
+    @property
+    def mixed_precision(self) -> bool:
+        """True if the hidden layers are computed in bfloat16, False otherwise."""
+        return self._mixed_precision
+
+    @property
+    def steps_per_execution(self) -> int:
+        """Number of batches run in each call of the compiled step function."""
+        return self._steps_per_execution
+
     @property
     def history(self) -> t.DataFrame:
-        """Training history DataFrame."""
-        return self._history.copy()
+        """
+        Zero-copy view of the training history DataFrame. Any modification of the view
+        copies the affected data instead of changing the original history.
+        """
+        return self._history.copy(deep=False)
 
     @property
     def summary(self) -> None:
@@ -562,6 +1188,161 @@ class UploadedModel(Model):
         """Initialize an empty uploaded machine learning model."""
         super().__init__()
 
+        self._export: t.ExportReport | None = None
+        self._export_dir: str | None = None
+        self._serving: t.ServingFunction | None = None
+        self._serving_object: t.Object | None = None
+        self._traces = 0
+        self._latencies: collections.deque[float] = collections.deque(
+            maxlen=LATENCY_WINDOW
+        )
+
+    def _get_serving_function(self) -> t.ServingFunction:
+        """
+        Get the serving function of the model, tracing it again only if the model is
+        replaced (e.g. after an upload or a change of the precision).
+
+        The function has a fixed input signature with an unknown batch dimension, so
+        it is traced once and reused for any batch size, including the last partial
+        batch and single rows.
+
+        Returns
+        -------
+        Function
+            Function mapping the input batch of each input layer to the list of the
+            output batches, in the order of the output layers.
+        """
+        if self._serving is None or self._serving_object is not self._object:
+            keras_model = self._object
+            outputs = list(self._outputs)
+            signature = {
+                layer: tf.TensorSpec([None, size], tf.float32, name=layer)
+                for layer, size in self._input_shape.items()
+            }
+
+            @tf.function(input_signature=[signature])
+            def serve(inputs: dict[str, tf.Tensor]) -> list[tf.Tensor]:
+                self._traces += 1  # Python code only runs while tracing
+                predictions = keras_model(inputs, training=False)
+
+                if isinstance(predictions, dict):
+                    return [predictions[output] for output in outputs]
+
+                if isinstance(predictions, (list, tuple)):
+                    return list(predictions)
+
+                return [predictions]
+
+            self._serving = serve
+            self._serving_object = keras_model
+            self._latencies.clear()
+
+        return self._serving
+
+    def _serve(self, inputs: t.InputBatch) -> list[t.NDArray]:
+        """
+        Run the serving function on a batch and record its latency.
+
+        Parameters
+        ----------
+        inputs : dict of {str to Tensor or NDArray}
+            Input batch of each input layer.
+
+        Returns
+        -------
+        list of NDArray
+            Output batch of each output layer.
+        """
+        serve = self._get_serving_function()
+        start = time.perf_counter()
+        outputs = [tensor.numpy() for tensor in serve(inputs)]
+
+        self._latencies.append(time.perf_counter() - start)
+
+        return outputs
+
+    def predict_one(self, features: dict[str, float]) -> dict[str, list[float]]:
+        """
+        Make a prediction for a single row with the serving function, avoiding the
+        overhead of building an input pipeline.
+
+        Parameters
+        ----------
+        features : dict of {str to float}
+            Values of the input features.
+
+        Returns
+        -------
+        dict of {str to list of float}
+            Values of the nodes of each output layer.
+
+        Raises
+        ------
+        ModelError
+            If there is an issue making the prediction.
+        """
+        try:
+            inputs = {
+                layer: np.array(
+                    [[features[column] for column in self._input_features[layer]]],
+                    dtype=np.float32,
+                )
+                for layer in self._inputs
+            }
+            outputs = self._serve(inputs)
+        except KeyError:
+            raise errors.ModelError("Please, provide the values of all input features!")
+        except (
+            RuntimeError,
+            ValueError,
+            AttributeError,
+            TypeError,
+            tf.errors.OpError,
+        ):
+            raise errors.ModelError("Unable to make the prediction!")
+
+        return {
+            output: array[0].tolist() for output, array in zip(self._outputs, outputs)
+        }
+
+    def _get_result_key(self, data: data.Data, batch_size: int, task: str) -> str:
+        """
+        Get the result cache key: the fingerprint of the model's weights, its features,
+        compiled losses and metrics, precision, the data version and the batch size.
+
+        Parameters
+        ----------
+        data : Data
+            Data object.
+        batch_size : int
+            Batch size.
+        task : {'evaluate', 'predict'}
+            Method producing the result.
+
+        Returns
+        -------
+        str
+            Hexadecimal SHA-256 digest of the key components.
+        """
+        config = json.dumps(
+            {
+                "task": task,
+                "weights": tools.model.get_weights_fingerprint(self._object),
+                "input_features": self._input_features,
+                "output_features": self._output_features
+                if task == "evaluate"
+                else None,
+                "losses": self._compiled_losses if task == "evaluate" else None,
+                "metrics": self._compiled_metrics if task == "evaluate" else None,
+                "mixed_precision": self._mixed_precision,
+                "data_version": data.version,
+                "batch_size": batch_size,
+            },
+            sort_keys=True,
+        )
+
+        return hashlib.sha256(config.encode()).hexdigest()
+
     def upload(self, buff: io.BytesIO) -> None:
         """
         Upload a model from the provided file.
@@ -594,16 +1375,22 @@ class UploadedModel(Model):
         except (ValueError, errors.ValidateModelError) as error:
             raise errors.UploadError(error)
 
-    def evaluate(self, data: t.DataFrame, batch_size: int) -> t.EvaluationResults:
+    def evaluate(
+        self, data: data.Data, batch_size: int, out_of_core: bool = False
+    ) -> t.EvaluationResults:
         """
-        Evaluate the model on the provided data.
+        Evaluate the model on the provided data. The results are cached until the
+        weights, features, losses or metrics of the model or the data change.
 
         Parameters
         ----------
-        data : DataFrame
-            Input and output data.
+        data : Data
+            Data object.
         batch_size : int
             Batch size.
+        out_of_core : bool, optional
+            Whether to write the data to memory-mapped files and read it from disk
+            batch by batch, instead of keeping its copies in memory.
 
         Raises
         ------
@@ -615,38 +1402,63 @@ class UploadedModel(Model):
         DataFrame
             Evaluation results as a DataFrame.
         """
-        if tools.data.contains_nonnumeric_dtypes(data):
+        if data.has_nonnumeric_dtypes:
             raise errors.ModelError(
                 "The data for evaluation contains non-numeric values!"
             )
 
+        key = self._get_result_key(data, batch_size, "evaluate")
+        cached = cache.result_cache.get(key)
+
+        if cached is not None:
+            return typing.cast(t.EvaluationResults, cached).copy(deep=False)
+
+        x = self._get_layer_data(data, "input", out_of_core)
+        y = self._get_layer_data(data, "output", out_of_core)
+        dataset = tools.model.make_dataset(x, y, batch_size, memmap=out_of_core)
+
         try:
             logs = typing.cast(
                 dict[str, float],
                 self._object.evaluate(
-                    x=self._get_processed_data(data, "input"),
-                    y=self._get_processed_data(data, "output"),
-                    batch_size=batch_size,
-                    callbacks=self._callbacks.values(),
-                    return_dict=True,
+                    x=dataset, callbacks=self._callbacks.values(), return_dict=True
                 ),
             )  # Type-cast the return value as 'return_dict' is set to True
             results = pd.DataFrame(logs.items(), columns=["Name", "Value"])
-        except (RuntimeError, ValueError, AttributeError, TypeError):
+        except (
+            RuntimeError,
+            ValueError,
+            AttributeError,
+            TypeError,
+            tf.errors.OpError,
+        ):
             raise errors.ModelError("Unable to evaluate the model!")
 
+        cache.result_cache.set(key, results.copy(deep=False))
+
         return results
 
-    def predict(self, data: t.DataFrame, batch_size: int) -> t.Predictions:
+    def predict(
+        self, data: data.Data, batch_size: int, out_of_core: bool = False
+    ) -> t.Predictions:
         """
-        Make predictions using the model on the provided data.
+        Make predictions using the model on the provided data. The predictions are
+        cached until the weights or input features of the model or the data change.
+
+        The batches are fed to the serving function of the model, which is traced
+        once, instead of the `predict` method of Keras, which rebuilds its function on
+        each call. The prediction hooks of the model's callbacks are called as Keras
+        would call them.
 
         Parameters
         ----------
-        data : DataFrame
-            Input data.
+        data : Data
+            Data object.
         batch_size : int
             Batch size.
+        out_of_core : bool, optional
+            Whether to write the data to memory-mapped files and read it from disk
+            batch by batch, instead of keeping its copies in memory.
 
         Raises
         ------
@@ -658,28 +1470,252 @@ class UploadedModel(Model):
         list of DataFrame
             Predictions as DataFrames.
         """
-        if tools.data.contains_nonnumeric_dtypes(data):
+        if data.has_nonnumeric_dtypes:
             raise errors.ModelError(
                 "The data for predictions contains non-numeric values!"
             )
 
+        key = self._get_result_key(data, batch_size, "predict")
+        cached = cache.result_cache.get(key)
+
+        if cached is not None:
+            return [df.copy(deep=False) for df in typing.cast(t.Predictions, cached)]
+
+        x = self._get_layer_data(data, "input", out_of_core)
+        dataset = tools.model.make_dataset(x, None, batch_size, memmap=out_of_core)
+
         try:
-            arrays = self._object.predict(
-                x=self._get_processed_data(data, "input"),
-                batch_size=batch_size,
-                callbacks=self._callbacks.values(),
+            callbacks = self._get_predict_callbacks()
+            callbacks.on_predict_begin()
+            batches = self._serve_batches(dataset, callbacks)
+            callbacks.on_predict_end()
+            predictions = [
+                pd.DataFrame(np.concatenate([batch[position] for batch in batches]))
+                for position in range(len(self._outputs))
+            ]
+        except (
+            RuntimeError,
+            ValueError,
+            AttributeError,
+            TypeError,
+            tf.errors.OpError,
+        ):
+            raise errors.ModelError("Unable to make the prediction!")
+
+        cache.result_cache.set(key, [df.copy(deep=False) for df in predictions])
+
+        return predictions
+
+    def _get_predict_callbacks(self) -> tf.keras.callbacks.CallbackList:
+        """
+        Get the list of the model's callbacks to be called during the predictions.
+
+        Returns
+        -------
+        CallbackList
+            Callbacks of the model, attached to its Keras object.
+        """
+        return tf.keras.callbacks.CallbackList(
+            list(self._callbacks.values()), model=self._object
+        )
+
+    def _serve_batches(
+        self,
+        dataset: tf.data.Dataset,
+        callbacks: tf.keras.callbacks.CallbackList,
+        step: int = 0,
+    ) -> list[list[t.NDArray]]:
+        """
+        Run the serving function on each batch of the dataset, calling the batch
+        hooks of the callbacks with the outputs as Keras does.
+
+        Parameters
+        ----------
+        dataset : Dataset
+            Batches of the input data.
+        callbacks : CallbackList
+            Callbacks of the model.
+        step : int, optional
+            Number of the first batch.
+
+        Returns
+        -------
+        list of list of NDArray
+            Output batches of each output layer for each batch.
+        """
+        batches = list()
+
+        for index, batch in enumerate(dataset, step):
+            callbacks.on_predict_batch_begin(index)
+            outputs = self._serve(batch)
+            callbacks.on_predict_batch_end(index, {"outputs": outputs})
+            batches.append(outputs)
+
+        return batches
+
+    def _iter_predictions(
+        self, x: t.LayerData, batch_size: int, chunk_size: int
+    ) -> typing.Iterator[t.DataFrame]:
+        """
+        Make predictions chunk by chunk.
+
+        Parameters
+        ----------
+        x : dict of {str to NDArray}
+            Input data of each input layer.
+        batch_size : int
+            Batch size.
+        chunk_size : int
+            Number of rows in each chunk.
+
+        Yields
+        ------
+        DataFrame
+            Predictions for the chunk of rows, with a column for each node of each
+            output layer, named after the layer and the node.
+        """
+        rows = len(next(iter(x.values())))
+        callbacks = self._get_predict_callbacks()
+        callbacks.on_predict_begin()
+        step = 0
+
+        for start in range(0, rows, chunk_size):
+            # The batches are sliced from the arrays, which are never copied as a whole
+            dataset = tools.model.make_dataset(
+                x, None, batch_size, start, min(start + chunk_size, rows), memmap=True
+            )
+            batches = self._serve_batches(dataset, callbacks, step)
+            step += len(batches)
+            arrays = [
+                np.concatenate([batch[position] for batch in batches])
+                for position in range(len(self._outputs))
+            ]
+
+            yield pd.DataFrame(
+                {
+                    f"{output}_{node}": array[:, node]
+                    for output, array in zip(self._outputs, arrays)
+                    for node in range(array.shape[1])
+                }
             )
 
-            if isinstance(arrays, dict):
-                predictions = [pd.DataFrame(array) for array in arrays.values()]
-            elif isinstance(arrays, list):
-                predictions = [pd.DataFrame(array) for array in arrays]
-            else:
-                predictions = [pd.DataFrame(arrays)]
-        except (RuntimeError, ValueError, AttributeError, TypeError):
+        callbacks.on_predict_end()
+
+    def export_predictions(
+        self,
+        data: data.Data,
+        batch_size: int,
+        fmt: t.ExportFormat,
+        chunk_size: int = tools.data.CHUNK_SIZE,
+        out_of_core: bool = False,
+    ) -> t.ExportReport:
+        """
+        Make predictions using the model on the provided data and write them to files
+        chunk by chunk, so that only the predictions for a single chunk of rows are
+        held in memory at a time. The files are written to the private directory of
+        the model, which is removed once the model is discarded with its session, and
+        the files of the previous export are removed.
+
+        Parameters
+        ----------
+        data : Data
+            Data object.
+        batch_size : int
+            Batch size.
+        fmt : {'csv', 'parquet'}
+            Format of the file.
+        chunk_size : int, optional
+            Number of rows to predict before appending them to a file.
+        out_of_core : bool, optional
+            Whether to write the data to memory-mapped files and read it from disk
+            batch by batch, instead of keeping its copies in memory.
+
+        Returns
+        -------
+        ExportReport
+            Directory, paths to the parts, number of rows, size in megabytes and
+            preview of the files.
+
+        Raises
+        ------
+        ModelError
+            If there is an issue making or writing the predictions.
+        """
+        if data.has_nonnumeric_dtypes:
+            raise errors.ModelError(
+                "The data for predictions contains non-numeric values!"
+            )
+
+        if self._export is not None:
+            shutil.rmtree(self._export["directory"], ignore_errors=True)
+
+            self._export = None
+
+        x = self._get_layer_data(data, "input", out_of_core)
+
+        try:
+            self._export = tools.data.write_chunks(
+                self._iter_predictions(x, batch_size, chunk_size),
+                fmt,
+                self._get_export_dir(),
+            )
+        except OSError:
+            raise errors.ModelError("Unable to write the predictions to disk!")
+        except (
+            RuntimeError,
+            ValueError,
+            AttributeError,
+            TypeError,
+            tf.errors.OpError,
+        ):
             raise errors.ModelError("Unable to make the prediction!")
 
-        return predictions
+        return self._export
+
+    def _get_export_dir(self) -> str:
+        """
+        Get the private directory for the exported files of the model, creating it on
+        the first export.
+
+        The directory is removed when the model is garbage collected, e.g. when its
+        session ends, or when the interpreter exits.
+
+        Returns
+        -------
+        str
+            Path to the directory.
+
+        Raises
+        ------
+        OSError
+            If there is an issue creating the directory.
+        """
+        if self._export_dir is None:
+            self._export_dir = tools.data.make_export_dir()
+            weakref.finalize(self, shutil.rmtree, self._export_dir, True)
+
+        return self._export_dir
+
+    @property
+    def export(self) -> t.ExportReport | None:
+        """Report of the last export of the predictions, None if there is none."""
+        return self._export.copy() if self._export else None
+
+    @property
+    def serving_stats(self) -> t.ServingStats:
+        """
+        Number of the traces of the serving function, number of its latest calls and
+        their mean, median and 95th percentile latencies in milliseconds.
+        """
+        latencies = np.array(self._latencies) * 1_000
+
+        return {
+            "traces": self._traces,
+            "calls": len(latencies),
+            "mean": float(latencies.mean()) if len(latencies) else 0.0,
+            "p50": float(np.percentile(latencies, 50)) if len(latencies) else 0.0,
+            "p95": float(np.percentile(latencies, 95)) if len(latencies) else 0.0,
+        }
 
 
 class CreatedModel(Model):
@@ -825,3 +1861,8 @@ class CreatedModel(Model):
     def layers(self) -> t.LayerObject:
         """Objects of the layers."""
         return self._layers.copy()
+
+    @property
+    def keras_model(self) -> t.Object:
+        """Keras object of the created model, e.g. to fit it on custom datasets."""
+        return self._object
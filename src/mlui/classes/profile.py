@@ -0,0 +1,219 @@
+import numpy as np
+import pandas as pd
+
+import mlui.classes.sketch as sketch
+import mlui.types.classes as t
+
+STATISTICS = ["count", "mean", "std", "min", "25%", "50%", "75%", "max"]
+
+
+class DataProfile:
+    """
+    Class representing a profile of the DataFrame.
+
+    This class computes the per-column statistics of the DataFrame once, so that they
+    can be accessed repeatedly without scanning the data again. Each numeric column
+    is converted and stripped of its nulls once, and a single partition of it gives
+    the minimum, quartiles and maximum.
+    """
+
+    def __init__(self, df: t.DataFrame) -> None:
+        """
+        Compute the profile of the DataFrame.
+
+        Parameters
+        ----------
+        df : DataFrame
+            DataFrame to be profiled.
+        """
+        numeric = df.select_dtypes(include=[np.floating, np.integer])
+        summary = pd.DataFrame(
+            [_describe(values) for _, values in numeric.items()],
+            index=numeric.columns,
+            columns=STATISTICS,
+            dtype="float64",
+        ).reindex(df.columns)
+
+        # The nulls of the numeric columns are known from their counts
+        nulls = pd.concat(
+            [
+                len(df) - summary["count"].dropna().astype("int64"),
+                df.drop(columns=numeric.columns).isna().sum(),
+            ]
+        ).reindex(df.columns)
+
+        self._rows: int = len(df)
+        self._table: t.DataFrame = pd.concat(
+            [
+                summary,
+                nulls.rename("nulls"),
+                df.dtypes.rename("dtype"),
+                pd.Series(df.columns.isin(numeric.columns), df.columns, name="numeric"),
+            ],
+            axis=1,
+        )
+
+    @property
+    def table(self) -> t.DataFrame:
+        """
+        Per-column statistics: count, number of nulls, mean, standard deviation,
+        minimum, quartiles, maximum, dtype and whether the dtype is numeric.
+        """
+        return self._table.copy(deep=False)
+
+    @property
+    def rows(self) -> int:
+        """Number of rows in the profiled DataFrame."""
+        return self._rows
+
+    @property
+    def has_nans(self) -> bool:
+        """True if there are NaN values in the DataFrame, False otherwise."""
+        return True if self.table["nulls"].any() else False
+
+    @property
+    def has_nonnumeric_dtypes(self) -> bool:
+        """
+        True if the DataFrame contains columns with non-numeric data types, False
+        otherwise.
+        """
+        return True if not self.table["numeric"].all() else False
+
+
+def _describe(values: t.Series) -> list[float]:
+    """
+    Compute the statistics of a numeric column in a single conversion.
+
+    Parameters
+    ----------
+    values : Series
+        Numeric column, possibly with a nullable or Arrow-backed dtype.
+
+    Returns
+    -------
+    list of float
+        Count of the non-null values, mean, standard deviation, minimum, quartiles
+        and maximum, NaN if undefined for the count.
+    """
+    array = values.to_numpy(dtype="float64", na_value=np.nan)
+    array = array[~np.isnan(array)]
+
+    if not len(array):
+        return [0.0] + [np.nan] * (len(STATISTICS) - 1)
+
+    std = float(array.std(ddof=1)) if len(array) > 1 else np.nan
+
+    return [
+        float(len(array)),
+        float(array.mean()),
+        std,
+        *np.quantile(array, [0, 0.25, 0.5, 0.75, 1]).tolist(),
+    ]
+
+
+class ApproximateProfile(DataProfile):
+    """
+    Class representing an approximate profile of the DataFrame.
+
+    This class builds the per-column statistics chunk by chunk: the count, mean,
+    standard deviation, minimum and maximum are exact, while the quartiles are
+    estimated with quantile sketches and come with a rank error bound. Profiles of
+    different chunks can be merged, and the data never needs to be sorted.
+    """
+
+    def __init__(self, k: int) -> None:
+        """
+        Initialize an empty profile.
+
+        Parameters
+        ----------
+        k : int
+            Size of the quantile sketches. Larger values give more accurate quartiles.
+        """
+        self._k = k
+        self._rows = 0
+        self._schema: t.DataFrame = pd.DataFrame()
+        self._nulls: t.Series = pd.Series(dtype="int64")
+        self._sketches: dict[str, sketch.ColumnSketch] = dict()
+        self._cached_table: t.DataFrame | None = None
+
+    def update(self, chunk: t.DataFrame) -> None:
+        """
+        Add a chunk of rows to the profile.
+
+        Parameters
+        ----------
+        chunk : DataFrame
+            Chunk of rows of the DataFrame.
+        """
+        other = ApproximateProfile(self._k)
+        other._rows = len(chunk)
+        other._schema = chunk.iloc[:0]
+        other._nulls = chunk.isna().sum()
+
+        numeric = chunk.select_dtypes(include=[np.floating, np.integer])
+
+        for column, values in numeric.items():
+            column_sketch = sketch.ColumnSketch(self._k)
+            column_sketch.update(values.to_numpy(dtype="float64", na_value=np.nan))
+            other._sketches[str(column)] = column_sketch
+
+        self.merge(other)
+
+    def merge(self, other: "ApproximateProfile") -> None:
+        """
+        Merge the profile of another chunk of rows into this one.
+
+        Parameters
+        ----------
+        other : ApproximateProfile
+            Profile to be merged.
+        """
+        # Concatenating the empty chunks yields the dtypes of the concatenated data
+        self._schema = pd.concat([self._schema, other._schema])
+        self._rows += other._rows
+        self._nulls = self._nulls.add(other._nulls, fill_value=0).astype("int64")
+
+        for column, column_sketch in other._sketches.items():
+            if column in self._sketches:
+                self._sketches[column].merge(column_sketch)
+            else:
+                self._sketches[column] = column_sketch
+
+        self._cached_table = None
+
+    @property
+    def table(self) -> t.DataFrame:
+        """
+        Per-column statistics: count, mean, standard deviation, minimum, approximate
+        quartiles, maximum, normalized rank error bound of the quartiles, number of
+        nulls, dtype and whether the dtype is numeric.
+        """
+        if self._cached_table is None:
+            dtypes = self._schema.dtypes
+            numeric = self._schema.select_dtypes(include=[np.floating, np.integer])
+            summary = pd.DataFrame.from_dict(
+                {column: self._sketches[column].summary for column in numeric},
+                orient="index",
+                columns=[*STATISTICS, "rank error"],
+                dtype="float64",
+            )
+
+            self._cached_table = pd.concat(
+                [
+                    summary.reindex(self._schema.columns),
+                    self._nulls.reindex(self._schema.columns).rename("nulls"),
+                    dtypes.rename("dtype"),
+                    pd.Series(
+                        dtypes.index.isin(numeric.columns), dtypes.index, name="numeric"
+                    ),
+                ],
+                axis=1,
+            )
+
+        return self._cached_table.copy(deep=False)
+
+    @property
+    def k(self) -> int:
+        """Size of the quantile sketches."""
+        return self._k
@@ -0,0 +1,253 @@
+import math
+
+import numpy as np
+
+import mlui.types.classes as t
+
+
+class QuantileSketch:
+    """
+    Class representing a mergeable quantile sketch.
+
+    This class implements a KLL sketch: the values are kept in a hierarchy of
+    compactors, where each value at level `h` stands for `2^h` values of the stream.
+    Compactors exceeding their capacity are sorted, and every other value of them is
+    promoted to the next level. The memory usage is `O(k)` regardless of the number of
+    values, and the rank error of the quantiles is bounded by `error`.
+    """
+
+    def __init__(self, k: int) -> None:
+        """
+        Initialize an empty sketch.
+
+        Parameters
+        ----------
+        k : int
+            Size of the sketch. Larger values give more accurate quantiles.
+        """
+        self._k = k
+        self._levels: list[t.NDArray] = [np.empty(0)]
+        self._rng = np.random.default_rng()
+
+    def update(self, values: t.NDArray) -> None:
+        """
+        Add the values to the sketch.
+
+        Parameters
+        ----------
+        values : NDArray
+            Values without NaNs.
+        """
+        self._levels[0] = np.concatenate([self._levels[0], values])
+        self._compress()
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """
+        Merge another sketch into this one.
+
+        Parameters
+        ----------
+        other : QuantileSketch
+            Sketch to be merged.
+        """
+        for level, values in enumerate(other._levels):
+            if level == len(self._levels):
+                self._levels.append(np.empty(0))
+
+            self._levels[level] = np.concatenate([self._levels[level], values])
+
+        self._compress()
+
+    def quantile(self, q: list[float]) -> t.NDArray:
+        """
+        Get the approximate quantiles of the values.
+
+        Parameters
+        ----------
+        q : list of float
+            Quantiles to compute, between 0 and 1.
+
+        Returns
+        -------
+        NDArray
+            Quantiles of the values, NaNs if the sketch is empty.
+        """
+        values = np.concatenate(self._levels)
+
+        if not len(values):
+            return np.full(len(q), np.nan)
+
+        weights = np.concatenate(
+            [
+                np.full(len(items), 2**level)
+                for level, items in enumerate(self._levels)
+            ]
+        )
+        order = np.argsort(values, kind="stable")
+        ranks = np.cumsum(weights[order])
+        positions = np.searchsorted(ranks, np.asarray(q) * ranks[-1], side="left")
+
+        return values[order][np.minimum(positions, len(values) - 1)]
+
+    def _get_capacity(self, level: int) -> int:
+        """
+        Get the capacity of the compactor, which decreases geometrically from the top
+        level to the bottom one.
+
+        Parameters
+        ----------
+        level : int
+            Level of the compactor.
+
+        Returns
+        -------
+        int
+            Maximum number of values at the level.
+        """
+        depth = len(self._levels) - level - 1
+
+        return max(2, math.ceil(self._k * (2 / 3) ** depth))
+
+    def _compress(self) -> None:
+        """Compact the levels until each of them fits its capacity."""
+        compacted = True
+
+        while compacted:
+            compacted = False
+
+            for level in range(len(self._levels)):
+                values = self._levels[level]
+
+                if len(values) <= self._get_capacity(level):
+                    continue
+
+                if level + 1 == len(self._levels):
+                    self._levels.append(np.empty(0))
+
+                # An odd value stays at the current level, the rest is halved
+                values = np.sort(values)
+                kept, values = values[: len(values) % 2], values[len(values) % 2 :]
+                promoted = values[self._rng.integers(2) :: 2]
+
+                self._levels[level] = kept
+                self._levels[level + 1] = np.concatenate(
+                    [self._levels[level + 1], promoted]
+                )
+                compacted = True
+
+    @property
+    def error(self) -> float:
+        """
+        Normalized rank error bound of the quantiles (with 99% confidence), 0 if the
+        sketch holds all the values exactly.
+        """
+        return 0.0 if len(self._levels) == 1 else 2.296 / self._k**0.9723
+
+
+class ColumnSketch:
+    """
+    Class representing the streaming statistics of a numeric column.
+
+    This class keeps the exact count, mean, variance, minimum and maximum of the values
+    as running moments, and their quantiles in a `QuantileSketch`. Both can be updated
+    chunk by chunk and merged across chunks.
+    """
+
+    def __init__(self, k: int) -> None:
+        """
+        Initialize empty statistics.
+
+        Parameters
+        ----------
+        k : int
+            Size of the quantile sketch.
+        """
+        self._k = k
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._min = np.inf
+        self._max = -np.inf
+        self._quantiles = QuantileSketch(k)
+
+    def update(self, values: t.NDArray) -> None:
+        """
+        Add the values to the statistics.
+
+        Parameters
+        ----------
+        values : NDArray
+            Values of the column, possibly containing NaNs.
+        """
+        values = values[~np.isnan(values)]
+
+        if not len(values):
+            return
+
+        chunk = ColumnSketch(self._k)
+        chunk._count = len(values)
+        chunk._mean = float(values.mean())
+        chunk._m2 = float(np.square(values - chunk._mean).sum())
+        chunk._min = float(values.min())
+        chunk._max = float(values.max())
+
+        self._merge_moments(chunk)
+        self._quantiles.update(values)
+
+    def merge(self, other: "ColumnSketch") -> None:
+        """
+        Merge the statistics of another column chunk into these ones.
+
+        Parameters
+        ----------
+        other : ColumnSketch
+            Statistics to be merged.
+        """
+        self._merge_moments(other)
+        self._quantiles.merge(other._quantiles)
+
+    def _merge_moments(self, other: "ColumnSketch") -> None:
+        """
+        Merge the running moments using the parallel algorithm of Chan et al.
+
+        Parameters
+        ----------
+        other : ColumnSketch
+            Statistics to be merged.
+        """
+        count = self._count + other._count
+
+        if not count:
+            return
+
+        delta = other._mean - self._mean
+
+        self._m2 += other._m2 + delta**2 * self._count * other._count / count
+        self._mean += delta * other._count / count
+        self._count = count
+        self._min = min(self._min, other._min)
+        self._max = max(self._max, other._max)
+
+    @property
+    def summary(self) -> dict[str, float]:
+        """
+        Count, mean, standard deviation, minimum, quartiles, maximum and normalized
+        rank error bound of the quartiles.
+        """
+        if not self._count:
+            return {"count": 0.0}
+
+        std = math.sqrt(self._m2 / (self._count - 1)) if self._count > 1 else np.nan
+        quartiles = self._quantiles.quantile([0.25, 0.5, 0.75])
+
+        return {
+            "count": float(self._count),
+            "mean": self._mean,
+            "std": std,
+            "min": self._min,
+            "25%": float(quartiles[0]),
+            "50%": float(quartiles[1]),
+            "75%": float(quartiles[2]),
+            "max": self._max,
+            "rank error": self._quantiles.error,
+        }
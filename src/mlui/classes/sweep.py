@@ -0,0 +1,500 @@
+import concurrent.futures
+import itertools
+import math
+import multiprocessing
+import multiprocessing.shared_memory as shared_memory
+import time
+
+import numpy as np
+import pandas as pd
+import tensorflow as tf
+
+import mlui.classes.data as data
+import mlui.classes.errors as errors
+import mlui.classes.model as model
+import mlui.enums as enums
+import mlui.tools as tools
+import mlui.types.classes as t
+
+# Arrays of the features in shared memory, attached in each process of the pool by
+# `_init_process`, and their blocks, which must stay referenced while they are used
+_x: t.NDArray | None = None
+_y: t.NDArray | None = None
+_blocks: list[shared_memory.SharedMemory] = list()
+
+
+def _init_process(threads: int, x: t.SharedArray, y: t.SharedArray) -> None:
+    """
+    Initialize a process of the pool: limit the TensorFlow thread pools to the
+    per-trial budget and attach the features shared by the main process for all
+    trials run by the process.
+
+    Parameters
+    ----------
+    threads : int
+        Number of the intra-op threads of each trial.
+    x : SharedArray
+        Shared input features.
+    y : SharedArray
+        Shared output features.
+    """
+    global _x, _y
+
+    tf.config.threading.set_intra_op_parallelism_threads(threads)
+    tf.config.threading.set_inter_op_parallelism_threads(1)
+    tf.get_logger().setLevel("ERROR")
+
+    x_block, _x = tools.data.attach_array(x)
+    y_block, _y = tools.data.attach_array(y)
+    _blocks.extend([x_block, y_block])
+
+
+class RungEarlyStopping(tf.keras.callbacks.EarlyStopping):
+    """
+    Class representing an early stopping callback continuing the previous rung.
+
+    This class starts the training with the best validation loss and the number of
+    the epochs without its improvement reached by the previous rungs of the trial,
+    instead of resetting them, so the patience spans the rungs.
+    """
+
+    def __init__(self, patience: int, state: t.StoppingState | None) -> None:
+        """
+        Initialize the callback.
+
+        Parameters
+        ----------
+        patience : int
+            Number of the epochs without improvement of the validation loss after
+            which the training is stopped.
+        state : StoppingState or None
+            State at the end of the previous rung, None for the first one.
+        """
+        super().__init__(patience=patience)
+
+        self._state = state
+
+    def on_train_begin(self, logs: t.Logs | None = None) -> None:
+        """Restore the state of the previous rung."""
+        super().on_train_begin(logs)
+
+        if self._state is not None:
+            self.best = self._state["best"]
+            self.wait = self._state["wait"]
+
+    @property
+    def state(self) -> t.StoppingState:
+        """State at the end of the training."""
+        return {"best": float(self.best), "wait": int(self.wait)}
+
+
+def build_model(spec: t.TrialSpec, inputs: int, outputs: int) -> model.CreatedModel:
+    """
+    Build the created model of a trial: a stack of Dense layers between the input and
+    the output layers.
+
+    Parameters
+    ----------
+    spec : TrialSpec
+        Configuration of the trial.
+    inputs : int
+        Number of the input features.
+    outputs : int
+        Number of the output features.
+
+    Returns
+    -------
+    CreatedModel
+        Created and compiled model.
+    """
+    created = model.CreatedModel()
+    created.set_name(f"trial_{spec['trial']}")
+    created.set_layer("Input", "input", {"shape": (inputs,)}, None)
+
+    for i in range(spec["num_layers"]):
+        created.set_layer(
+            "Dense",
+            f"dense_{i}",
+            {
+                "units": spec["units"],
+                "activation": enums.activations.classes[spec["activation"]],
+            },
+            created.layers[f"dense_{i - 1}" if i else "input"],
+        )
+
+    last = f"dense_{spec['num_layers'] - 1}" if spec["num_layers"] else "input"
+    created.set_layer(
+        "Dense",
+        "output",
+        {
+            "units": outputs,
+            "activation": enums.activations.classes[spec["output_activation"]],
+        },
+        created.layers[last],
+    )
+    created.set_outputs(["output"])
+    created.create()
+    created.set_optimizer(spec["optimizer"], {"learning_rate": spec["learning_rate"]})
+    created.set_loss("output", spec["loss"])
+    created.compile()
+
+    return created
+
+
+def _run_trial(
+    spec: t.TrialSpec,
+    weights: list[t.NDArray] | None,
+    optimizer: list[t.NDArray] | None,
+    stopping: t.StoppingState | None,
+    initial_epoch: int,
+    epochs: int,
+    batch_size: int,
+    val_split: float,
+    patience: int,
+) -> t.TrialResult:
+    """
+    Fit the model of a trial in a process of the pool, continuing from the weights,
+    the optimizer's state (e.g. the moments of Adam and the number of the steps
+    driving the learning rate schedules) and the early stopping state of the
+    previous rung if there are any.
+
+    Parameters
+    ----------
+    spec : TrialSpec
+        Configuration of the trial.
+    weights : list of NDArray or None
+        Weights of the model after the previous rung.
+    optimizer : list of NDArray or None
+        Variables of the optimizer after the previous rung.
+    stopping : StoppingState or None
+        Early stopping state after the previous rung.
+    initial_epoch : int
+        Number of the epochs completed in the previous rungs.
+    epochs : int
+        Total number of the epochs to complete by the end of this rung.
+    batch_size : int
+        Batch size.
+    val_split : float
+        Validation split.
+    patience : int
+        Number of the epochs without improvement of the validation loss after which
+        the trial is stopped, counted across the rungs.
+
+    Returns
+    -------
+    TrialResult
+        Weights, optimizer's variables, logs, early stopping state and wall time of
+        the trial.
+    """
+    assert _x is not None and _y is not None
+
+    start = time.perf_counter()
+    keras_model = build_model(spec, _x.shape[1], _y.shape[1]).keras_model
+
+    if weights is not None:
+        keras_model.set_weights(weights)
+
+    if optimizer is not None:
+        # The variables of the optimizer are only created when it is built
+        keras_model.optimizer.build(keras_model.trainable_variables)
+        keras_model.optimizer.set_weights(optimizer)
+
+    # The batches are sliced from the shared arrays, which are never copied as a whole
+    x, y = {"input": _x}, {"output": _y}
+    split = int(len(_x) * (1 - val_split))
+    train = tools.model.make_dataset(
+        x, y, batch_size, stop=split, shuffle=True, memmap=True
+    )
+    val = tools.model.make_dataset(x, y, batch_size, start=split, memmap=True)
+    callback = RungEarlyStopping(patience, stopping)
+    logs = keras_model.fit(
+        x=train,
+        validation_data=val,
+        epochs=epochs,
+        initial_epoch=initial_epoch,
+        callbacks=[callback],
+        verbose=0,
+    )
+
+    return {
+        "weights": keras_model.get_weights(),
+        "optimizer": [v.numpy() for v in keras_model.optimizer.variables],
+        "history": {name: list(map(float, v)) for name, v in logs.history.items()},
+        "stopping": callback.state,
+        "stopped": callback.stopped_epoch > 0,
+        "time": time.perf_counter() - start,
+    }
+
+
+class Sweep:
+    """
+    Class representing a hyperparameter sweep over the created models.
+
+    This class builds a stack of Dense layers for every combination of the search
+    space and fits them concurrently in a pool of processes, each of which limits
+    TensorFlow to its share of the available cores. The trials are pruned with the
+    successive halving: all of them are trained for the minimum number of epochs,
+    then only the best `1 / eta` fraction continues for `eta` times more epochs, and
+    so on up to the maximum one. The trials stopped early by the validation loss, as
+    well as the pruned ones, free their processes for the remaining configurations.
+    The features are shared with the processes through a single read-only copy in
+    shared memory.
+    """
+
+    def __init__(self, space: t.SearchSpace, loss: str, output_activation: str) -> None:
+        """
+        Initialize the sweep over all combinations of the search space.
+
+        Parameters
+        ----------
+        space : SearchSpace
+            Values of the hyperparameters to combine.
+        loss : str
+            Name of the loss function of all trials.
+        output_activation : str
+            Name of the activation function of the output layer of all trials.
+
+        Raises
+        ------
+        SweepError
+            If the search space is empty.
+        """
+        combinations = list(
+            itertools.product(
+                space["num_layers"],
+                space["units"],
+                space["activations"],
+                space["optimizers"],
+                space["learning_rates"],
+            )
+        )
+
+        if not combinations:
+            raise errors.SweepError("Please, select at least one value of each!")
+
+        self._specs: list[t.TrialSpec] = [
+            {
+                "trial": trial,
+                "num_layers": int(num_layers),
+                "units": int(units),
+                "activation": activation,
+                "optimizer": optimizer,
+                "learning_rate": float(learning_rate),
+                "loss": loss,
+                "output_activation": output_activation,
+            }
+            for trial, (num_layers, units, activation, optimizer, learning_rate) in (
+                enumerate(combinations)
+            )
+        ]
+        self._results: t.DataFrame = pd.DataFrame()
+        self._wall_time = 0.0
+
+    def run(
+        self,
+        data: data.Data,
+        inputs: t.Columns,
+        outputs: t.Columns,
+        batch_size: int,
+        min_epochs: int,
+        max_epochs: int,
+        val_split: float,
+        eta: int = 3,
+        patience: int = 5,
+        threads: int = 1,
+        on_rung: t.RungCallback | None = None,
+    ) -> t.DataFrame:
+        """
+        Run the sweep.
+
+        Parameters
+        ----------
+        data : Data
+            Data object.
+        inputs : list of str
+            Names of the input columns.
+        outputs : list of str
+            Names of the output columns.
+        batch_size : int
+            Batch size.
+        min_epochs : int
+            Number of the epochs of the first rung.
+        max_epochs : int
+            Number of the epochs of the last rung.
+        val_split : float
+            Validation split.
+        eta : int, optional
+            Factor by which the number of the trials is divided and the number of the
+            epochs is multiplied after each rung.
+        patience : int, optional
+            Number of the epochs without improvement of the validation loss after
+            which a trial is stopped.
+        threads : int, optional
+            Number of the intra-op threads of each trial. The pool has as many
+            processes as fit into the available cores.
+        on_rung : Callable or None, optional
+            Function called with the rung number, its number of epochs and the number
+            of its trials before each rung.
+
+        Returns
+        -------
+        DataFrame
+            Trials ranked by the best validation loss.
+
+        Raises
+        ------
+        SweepError
+            If there is an issue running the trials.
+        """
+        if data.has_nonnumeric_dtypes:
+            raise errors.SweepError("The data for fitting contains non-numeric values!")
+
+        if not inputs or not outputs:
+            raise errors.SweepError("Please, select the input and output columns!")
+
+        x = data.dataframe[inputs].to_numpy(dtype="float32", na_value=np.nan)
+        y = data.dataframe[outputs].to_numpy(dtype="float32", na_value=np.nan)
+        processes = max(1, tools.model.get_available_cores() // threads)
+        blocks = list()
+        results: dict[int, t.TrialResult] = dict()
+        statuses = dict.fromkeys(range(len(self._specs)), "completed")
+        active = [spec["trial"] for spec in self._specs]
+        budgets = [min_epochs]
+
+        while budgets[-1] < max_epochs:
+            budgets.append(min(budgets[-1] * eta, max_epochs))
+
+        start = time.perf_counter()
+
+        try:
+            x_block, x_spec = tools.data.share_array(x)
+            blocks.append(x_block)
+            y_block, y_spec = tools.data.share_array(y)
+            blocks.append(y_block)
+
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(processes, len(active)),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_process,
+                initargs=(threads, x_spec, y_spec),
+            ) as executor:
+                for rung, epochs in enumerate(budgets):
+                    if on_rung is not None:
+                        on_rung(rung, epochs, len(active))
+
+                    futures = {
+                        executor.submit(
+                            _run_trial,
+                            self._specs[trial],
+                            results[trial]["weights"] if trial in results else None,
+                            results[trial]["optimizer"] if trial in results else None,
+                            results[trial]["stopping"] if trial in results else None,
+                            len(results[trial]["history"]["loss"])
+                            if trial in results
+                            else 0,
+                            epochs,
+                            batch_size,
+                            val_split,
+                            patience,
+                        ): trial
+                        for trial in active
+                    }
+
+                    for future in concurrent.futures.as_completed(futures):
+                        trial = futures[future]
+                        result = future.result()
+
+                        if trial in results:
+                            for name, values in results[trial]["history"].items():
+                                result["history"][name] = (
+                                    values + result["history"][name]
+                                )
+
+                            result["time"] += results[trial]["time"]
+
+                        results[trial] = result
+
+                        if result["stopped"]:
+                            statuses[trial] = "stopped early"
+
+                    active = [
+                        trial for trial in active if statuses[trial] == "completed"
+                    ]
+
+                    if rung + 1 < len(budgets):
+                        ranked = sorted(active, key=lambda i: _best_loss(results[i]))
+                        kept = ranked[: math.ceil(len(ranked) / eta)]
+
+                        for trial in ranked[len(kept) :]:
+                            statuses[trial] = "pruned"
+
+                        active = kept
+        except (
+            RuntimeError,
+            ValueError,
+            TypeError,
+            OSError,
+            tf.errors.OpError,
+            errors.SetError,
+            errors.CreateError,
+            errors.ModelError,
+            concurrent.futures.process.BrokenProcessPool,
+        ):
+            raise errors.SweepError("Unable to run the sweep!")
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+        self._results = pd.DataFrame(
+            [
+                {
+                    **{k: v for k, v in spec.items() if k not in ("loss", "trial")},
+                    "epochs": len(results[spec["trial"]]["history"]["loss"]),
+                    "loss": results[spec["trial"]]["history"]["loss"][-1],
+                    "val_loss": _best_loss(results[spec["trial"]]),
+                    "status": statuses[spec["trial"]],
+                    "time, s": results[spec["trial"]]["time"],
+                }
+                for spec in self._specs
+            ]
+        )
+        self._results = self._results.sort_values("val_loss", ignore_index=True)
+        self._results.index += 1
+        self._wall_time = time.perf_counter() - start
+
+        return self.results
+
+    @property
+    def num_trials(self) -> int:
+        """Number of the trials in the sweep."""
+        return len(self._specs)
+
+    @property
+    def results(self) -> t.DataFrame:
+        """Trials ranked by the best validation loss, empty if the sweep is not run."""
+        return self._results.copy(deep=False)
+
+    @property
+    def wall_time(self) -> float:
+        """Wall time of the last run in seconds."""
+        return self._wall_time
+
+
+def _best_loss(result: t.TrialResult) -> float:
+    """
+    Get the best validation loss of the trial.
+
+    Parameters
+    ----------
+    result : TrialResult
+        Result of the trial.
+
+    Returns
+    -------
+    float
+        Minimum validation loss, or infinity if it is not finite.
+    """
+    loss = float(np.nanmin(result["history"].get("val_loss", [np.inf])))
+
+    return loss if math.isfinite(loss) else math.inf
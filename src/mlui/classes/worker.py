@@ -0,0 +1,302 @@
+import collections
+import threading
+import time
+
+import altair as alt
+import pandas as pd
+import tensorflow as tf
+
+import mlui.classes.data as data
+import mlui.classes.errors as errors
+import mlui.classes.model as model
+import mlui.types.classes as t
+
+TELEMETRY_SIZE = 1_000
+TELEMETRY_INTERVAL = 0.1
+
+
+class TrainingWorker:
+    """
+    Class representing a background worker fitting the model.
+
+    This class runs the model's `fit` method in a separate thread, so that the
+    training neither blocks the Streamlit script nor is interrupted by its reruns. The
+    status, progress, latest metrics and sampled batch logs of the training can be
+    polled at any time, and the training can be cancelled after the current batch.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an idle worker."""
+        self._thread: threading.Thread | None = None
+        self._cancel = threading.Event()
+        self._status: t.WorkerStatus = "idle"
+        self._num_epochs = 0
+        self._telemetry = TelemetryCallback(self._cancel)
+        self._error: str | None = None
+
+    def start(
+        self,
+        model: model.Model,
+        data: data.Data,
+        batch_size: int,
+        num_epochs: int,
+        val_split: float,
+        out_of_core: bool = False,
+    ) -> None:
+        """
+        Start fitting the model in the background.
+
+        Parameters
+        ----------
+        model : Model
+            Model object.
+        data : Data
+            Data object.
+        batch_size : int
+            Batch size.
+        num_epochs : int
+            Number of epochs.
+        val_split : float
+            Validation split.
+        out_of_core : bool, optional
+            Whether to read the data from memory-mapped files batch by batch.
+
+        Raises
+        ------
+        ModelError
+            If the model is already being trained.
+        """
+        if self.running:
+            raise errors.ModelError("The model is already being trained!")
+
+        self._cancel.clear()
+        self._status = "running"
+        self._num_epochs = num_epochs
+        self._telemetry = TelemetryCallback(self._cancel)
+        self._error = None
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(model, data, batch_size, num_epochs, val_split, out_of_core),
+            name="mlui-training",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def cancel(self) -> None:
+        """Request the training to stop after the current batch."""
+        self._cancel.set()
+
+    def join(self, timeout: float | None = None) -> None:
+        """
+        Wait for the training to finish.
+
+        Parameters
+        ----------
+        timeout : float or None, optional
+            Maximum number of seconds to wait, None to wait indefinitely.
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(
+        self,
+        model: model.Model,
+        data: data.Data,
+        batch_size: int,
+        num_epochs: int,
+        val_split: float,
+        out_of_core: bool,
+    ) -> None:
+        """
+        Fit the model, recording the outcome of the training.
+
+        Parameters
+        ----------
+        model : Model
+            Model object.
+        data : Data
+            Data object.
+        batch_size : int
+            Batch size.
+        num_epochs : int
+            Number of epochs.
+        val_split : float
+            Validation split.
+        out_of_core : bool
+            Whether to read the data from memory-mapped files batch by batch.
+        """
+        try:
+            model.fit(
+                data,
+                batch_size,
+                num_epochs,
+                val_split,
+                out_of_core,
+                callbacks=[self._telemetry],
+            )
+        except Exception as error:  # Any failure must be reported to the polling UI
+            self._error = str(error)
+            self._status = "failed"
+            return
+
+        self._status = "cancelled" if self._cancel.is_set() else "completed"
+
+    @property
+    def status(self) -> t.WorkerStatus:
+        """Status of the training."""
+        return self._status
+
+    @property
+    def running(self) -> bool:
+        """True if the model is being trained, False otherwise."""
+        return self._status == "running"
+
+    def plot_telemetry(self) -> t.Chart:
+        """
+        Plot the sampled batch logs of the training.
+
+        Returns
+        -------
+        Chart
+            Altair chart representing the batch logs.
+
+        Raises
+        ------
+        PlotError
+            If there are no batch logs yet.
+        """
+        batch_logs = self.batch_logs
+
+        if batch_logs.empty:
+            raise errors.PlotError("There are no logs yet!")
+
+        melted_logs = batch_logs.drop(columns="epoch").melt(
+            "step", var_name="log_name", value_name="log_value"
+        )
+        chart = (
+            alt.Chart(melted_logs)
+            .mark_line()
+            .encode(
+                x=alt.X("step").scale(zero=False).title("Step"),
+                y=alt.Y("log_value").scale(zero=False).title("Value"),
+                color=alt.Color("log_name").scale(scheme="set1").legend(title="Log"),
+            )
+            .properties(height=300)
+        )
+
+        return chart
+
+    @property
+    def progress(self) -> float:
+        """Fraction of the training batches processed, between 0 and 1."""
+        return self._telemetry.progress
+
+    @property
+    def epoch(self) -> int:
+        """Number of the epochs completed."""
+        return len(self._telemetry.epochs)
+
+    @property
+    def num_epochs(self) -> int:
+        """Number of the epochs requested."""
+        return self._num_epochs
+
+    @property
+    def metrics(self) -> dict[str, float]:
+        """Logs of the last completed epoch."""
+        epochs = self._telemetry.epochs
+
+        return epochs[-1].copy() if epochs else dict()
+
+    @property
+    def batch_logs(self) -> t.DataFrame:
+        """Sampled logs of the training batches, with their steps and epochs."""
+        return pd.DataFrame(list(self._telemetry.batches))
+
+    @property
+    def error(self) -> str | None:
+        """Error message of the failed training, None otherwise."""
+        return self._error
+
+
+class TelemetryCallback(tf.keras.callbacks.Callback):
+    """
+    Class representing a callback collecting structured training telemetry.
+
+    This class records the logs of each epoch, and samples the logs of the training
+    batches into a ring buffer at most once per `interval` seconds (always including
+    the last batch of each epoch), so the polling UI renders a bounded number of
+    points however long the training is. The callback also stops the training once
+    it is cancelled.
+    """
+
+    def __init__(
+        self,
+        cancel: threading.Event,
+        size: int = TELEMETRY_SIZE,
+        interval: float = TELEMETRY_INTERVAL,
+    ) -> None:
+        """
+        Initialize empty telemetry.
+
+        Parameters
+        ----------
+        cancel : Event
+            Event signaling that the training is cancelled.
+        size : int, optional
+            Maximum number of batch samples to keep.
+        interval : float, optional
+            Minimum number of seconds between two batch samples.
+        """
+        super().__init__()
+
+        self._cancel = cancel
+        self._interval = interval
+        self._sampled_at = 0.0
+        self._initial_epoch: int | None = None
+        self._epoch = 0
+        self.batches: collections.deque[dict[str, float]] = collections.deque(
+            maxlen=size
+        )
+        self.epochs: list[dict[str, float]] = list()
+        self.progress = 0.0
+
+    def on_epoch_begin(self, epoch: int, logs: t.Logs | None = None) -> None:
+        """Remember the current epoch and the first one of a resumed training."""
+        if self._initial_epoch is None:
+            self._initial_epoch = epoch
+
+        self._epoch = epoch
+
+    def on_train_batch_end(self, batch: int, logs: t.Logs | None = None) -> None:
+        """Update the progress, sample the logs and stop the training if cancelled."""
+        steps = self.params["steps"]
+        initial_epoch = self._initial_epoch or 0
+        epochs = self.params["epochs"] - initial_epoch
+        now = time.perf_counter()
+
+        self.progress = min(
+            1.0, (self._epoch - initial_epoch + (batch + 1) / steps) / epochs
+        )
+
+        if now - self._sampled_at >= self._interval or batch + 1 == steps:
+            self._sampled_at = now
+            self.batches.append(
+                {
+                    "step": self._epoch * steps + batch + 1,
+                    "epoch": self._epoch + 1,
+                    **{name: float(value) for name, value in (logs or dict()).items()},
+                }
+            )
+
+        if self._cancel.is_set():
+            self.model.stop_training = True
+
+    def on_epoch_end(self, epoch: int, logs: t.Logs | None = None) -> None:
+        """Record the logs of the completed epoch."""
+        self.epochs.append(
+            {
+                "epoch": epoch + 1,
+                **{name: float(value) for name, value in (logs or dict()).items()},
+            }
+        )
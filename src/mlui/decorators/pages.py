@@ -39,3 +39,34 @@ def check_task(page_tasks: t.PageTasks) -> t.DecorType:
         return wrapper
 
     return decorator
+
+
+def check_training(func: t.FuncType) -> t.FuncType:
+    """
+    Decorator to hide the page's content while the model is being trained, since it
+    could change the data or the model used by the training in the background.
+
+    Parameters
+    ----------
+    func : Callable
+        Function to wrap and execute.
+
+    Returns
+    -------
+    Callable
+        Wrapped function.
+    """
+
+    @functools.wraps(func)
+    def wrapper() -> None:
+        if st.session_state.worker.running:
+            st.info(
+                "The content of this page will be available once the training is "
+                "finished or cancelled on the `Train` page.",
+                icon="💡",
+            )
+            return
+
+        func()
+
+    return wrapper
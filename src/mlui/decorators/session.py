@@ -4,6 +4,7 @@ import streamlit as st
 
 import mlui.classes.data as data
 import mlui.classes.model as model
+import mlui.classes.worker as worker
 import mlui.types.classes as t
 
 
@@ -33,6 +34,9 @@ def set_state(func: t.FuncType) -> t.FuncType:
         if not st.session_state.get("model"):
             st.session_state.model = model.CreatedModel()
 
+        if not st.session_state.get("worker"):
+            st.session_state.worker = worker.TrainingWorker()
+
         if not st.session_state.get("model_type"):
             st.session_state.model_type = "Created"
 
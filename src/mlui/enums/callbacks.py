@@ -1,5 +1,6 @@
 import tensorflow as tf
 
+import mlui.classes.checkpoint as checkpoint
 import mlui.types.classes as ct
 import mlui.types.widgets as wt
 import mlui.widgets.callbacks as widget
@@ -7,9 +8,11 @@ import mlui.widgets.callbacks as widget
 classes: ct.CallbackTypes = {
     "EarlyStopping": tf.keras.callbacks.EarlyStopping,
     "TerminateOnNaN": tf.keras.callbacks.TerminateOnNaN,
+    "Checkpoint": checkpoint.Checkpoint,
 }
 
 widgets: wt.CallbackWidgetTypes = {
     "EarlyStopping": widget.EarlyStopping,
     "TerminateOnNaN": widget.TerminateOnNaN,
+    "Checkpoint": widget.Checkpoint,
 }
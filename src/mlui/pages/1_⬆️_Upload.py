@@ -7,6 +7,7 @@ st.set_page_config(page_title="Upload", page_icon="⬆️")
 
 
 @decorators.session.set_state
+@decorators.pages.check_training
 def upload_page() -> None:
     """Generate a Streamlit app page for uploading the data and the model."""
     data = st.session_state.data
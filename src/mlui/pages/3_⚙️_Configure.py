@@ -7,6 +7,7 @@ st.set_page_config(page_title="Configure", page_icon="⚙️")
 
 
 @decorators.session.set_state
+@decorators.pages.check_training
 def configure_page() -> None:
     """Generate a Streamlit app page for configuring the model."""
     data = st.session_state.data
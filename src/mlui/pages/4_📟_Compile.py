@@ -7,9 +7,11 @@ st.set_page_config(page_title="Compile", page_icon="📟")
 
 
 @decorators.session.set_state
+@decorators.pages.check_training
 @decorators.pages.check_task(["Train", "Evaluate"])
 def compile_page() -> None:
     """Generate a Streamlit app page for compiling the model."""
+    data = st.session_state.data
     model = st.session_state.model
 
     if not model.input_configured or not model.output_configured:
@@ -25,6 +27,7 @@ def compile_page() -> None:
         widgets.set_loss_functions_ui(model)
         widgets.set_metrics_ui(model)
         widgets.compile_model_ui(model)
+        widgets.benchmark_model_ui(data, model)
 
 
 if __name__ == "__main__":
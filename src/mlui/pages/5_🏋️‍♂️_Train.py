@@ -12,6 +12,7 @@ def train_page() -> None:
     """Generate a Streamlit app page for training the model."""
     data = st.session_state.data
     model = st.session_state.model
+    worker = st.session_state.worker
 
     if not model.compiled:
         st.info(
@@ -21,9 +22,19 @@ def train_page() -> None:
         return
 
     with st.container():
-        widgets.fit_model_ui(data, model)
+        widgets.fit_model_ui(data, model, worker)
+        status = st.container()
         widgets.plot_history_ui(model)
 
+        # The other runs would compete with the training for the model and the cores
+        if not worker.running:
+            widgets.cross_validation_ui(data, model)
+            widgets.sweep_ui(data, model)
+
+    # The status is refreshed until the training is finished, so it is generated last
+    with status:
+        widgets.training_status_ui(worker)
+
 
 if __name__ == "__main__":
     train_page()
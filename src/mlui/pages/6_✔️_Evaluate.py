@@ -7,6 +7,7 @@ st.set_page_config(page_title="Evaluate", page_icon="✔️")
 
 
 @decorators.session.set_state
+@decorators.pages.check_training
 @decorators.pages.check_task(["Evaluate"])
 def evaluate_page() -> None:
     """Generate a Streamlit app page for evaluating the model."""
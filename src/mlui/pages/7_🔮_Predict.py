@@ -7,6 +7,7 @@ st.set_page_config(page_title="Predict", page_icon="🔮")
 
 
 @decorators.session.set_state
+@decorators.pages.check_training
 @decorators.pages.check_task(["Predict"])
 def predict_page() -> None:
     """Generate a Streamlit app page for making the predictions of the model."""
@@ -23,6 +24,8 @@ def predict_page() -> None:
 
     with st.container():
         widgets.make_predictions_ui(data, model)
+        widgets.export_predictions_ui(data, model)
+        widgets.predict_one_ui(data, model)
 
 
 if __name__ == "__main__":
@@ -17,7 +17,10 @@ def data_page() -> None:
         widgets.dataframe_ui(data)
         widgets.statistics_ui(data)
         widgets.plot_columns_ui(data)
-        widgets.reset_data_ui(data, model)
+
+        # The data can't be reset while the model is trained on it
+        if not st.session_state.worker.running:
+            widgets.reset_data_ui(data, model)
 
 
 if __name__ == "__main__":
@@ -17,7 +17,10 @@ def model_page() -> None:
         widgets.summary_ui(model)
         widgets.graph_ui(model)
         widgets.download_model_ui(model)
-        widgets.reset_model_ui(data, model)
+
+        # The model can't be reset while it is trained
+        if not st.session_state.worker.running:
+            widgets.reset_model_ui(data, model)
 
 
 if __name__ == "__main__":
@@ -1,10 +1,64 @@
+import bz2
+import contextlib
 import csv
+import gzip
+import hashlib
+import io
+import lzma
+import multiprocessing.shared_memory as shared_memory
+import os
+import shutil
+import tempfile
+import threading
+import tracemalloc
+import typing
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as parquet
 
 import mlui.classes.errors as errors
 import mlui.types.classes as t
 
+try:
+    import zstandard
+except ImportError:  # The Zstandard support is optional
+    zstandard = None
+
+SNIFF_SIZE = 64 * 1024
+CHUNK_SIZE = 100_000
+MEMMAP_DIR = os.environ.get(
+    "MLUI_MEMMAP_DIR", os.path.join(tempfile.gettempdir(), "mlui", "memmap")
+)
+# The private directories of the sessions' exports are created in the system's
+# temporary directory unless another one is configured
+EXPORT_DIR = os.environ.get("MLUI_EXPORT_DIR")
+EXPORT_PART_SIZE = 64 * 2**20
+PREVIEW_ROWS = 100
+PLOT_POINTS = 2_000
+HISTOGRAM_BINS = 200
+# Tracing is global to the process, so it is shared by the uploads of all sessions
+TRACE_LOCK = threading.Lock()
+_tracers = 0
+_started_tracing = False
+COMPRESSIONS: dict[str, t.Compression] = {
+    ".gz": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+    ".zst": "zstd",
+}
+DATA_FORMATS: dict[str, t.DataFormat] = {
+    ".csv": "csv",
+    **{f".csv{extension}": "csv" for extension in COMPRESSIONS},
+    ".parquet": "parquet",
+    ".feather": "feather",
+    ".arrow": "feather",
+    ".npy": "npy",
+    ".npz": "npz",
+}
+
 
 def parse_csv(csv_str: str) -> str:
     """
@@ -42,6 +96,1090 @@ def parse_csv(csv_str: str) -> str:
     return delimiter
 
 
+def sniff_csv(buff: typing.BinaryIO, size: int = SNIFF_SIZE) -> str:
+    """
+    Parse the delimiter of a CSV byte stream and check for a header, using only a
+    bounded prefix of the stream.
+
+    Parameters
+    ----------
+    buff : file-like object
+        Byte stream containing the CSV data. It is rewound after the prefix is read
+        if it is seekable.
+    size : int, optional
+        Maximum number of bytes to read for the parsing.
+
+    Returns
+    -------
+    str
+        Identified delimiter.
+
+    Raises
+    ------
+    ParseCSVError
+        If the prefix is not a valid UTF-8 text. If the delimiter or header cannot be
+        determined. If the delimiter is not one of ',' or ';'.
+    """
+    prefix = buff.read(size)
+
+    if buff.seekable():
+        buff.seek(0)
+
+    if len(prefix) == size:
+        # Drop the trailing partial row, so the sniffer only sees complete rows
+        prefix = prefix[: prefix.rfind(b"\n") + 1] or prefix
+
+    try:
+        csv_str = prefix.decode("utf-8")
+    except UnicodeDecodeError:
+        raise errors.ParseCSVError("The file is not a valid UTF-8 text!")
+
+    return parse_csv(csv_str)
+
+
+def get_compression(name: str) -> t.Compression | None:
+    """
+    Identify the compression of a data file by its extension.
+
+    Parameters
+    ----------
+    name : str
+        Name of the data file.
+
+    Returns
+    -------
+    {'gzip', 'bz2', 'xz', 'zstd'} or None
+        Identified compression, None if the file is not compressed.
+    """
+    for extension, compression in COMPRESSIONS.items():
+        if name.lower().endswith(extension):
+            return compression
+
+    return None
+
+
+@contextlib.contextmanager
+def open_stream(
+    buff: typing.BinaryIO, compression: t.Compression | None
+) -> typing.Iterator[typing.BinaryIO]:
+    """
+    Open a byte stream reading the data from the start of a buffer, decompressing it
+    on the fly. Only one block of the data is decompressed at a time.
+
+    Parameters
+    ----------
+    buff : file-like object
+        Byte buffer containing the (compressed) data. It is left open on exit.
+    compression : {'gzip', 'bz2', 'xz', 'zstd'} or None
+        Compression of the data, None if the data is not compressed.
+
+    Yields
+    ------
+    file-like object
+        Byte stream of the decompressed data.
+
+    Raises
+    ------
+    ReadDataError
+        If the Zstandard support is not installed. If there is an issue decompressing
+        the data.
+    """
+    buff.seek(0)
+
+    match compression:
+        case None:
+            stream = None
+        case "gzip":
+            stream = gzip.GzipFile(fileobj=buff, mode="rb")
+        case "bz2":
+            stream = bz2.BZ2File(buff)
+        case "xz":
+            stream = lzma.LZMAFile(buff)
+        case "zstd":
+            if zstandard is None:
+                raise errors.ReadDataError(
+                    "The 'zstandard' package is required for '.zst' files!"
+                )
+
+            # Buffering makes reads return the requested number of bytes
+            stream = io.BufferedReader(
+                zstandard.ZstdDecompressor().stream_reader(buff, closefd=False)
+            )
+
+    decompression_errors = (OSError, EOFError, lzma.LZMAError)
+
+    if zstandard is not None:
+        decompression_errors += (zstandard.ZstdError,)
+
+    try:
+        yield buff if stream is None else stream
+    except decompression_errors as error:
+        raise errors.ReadDataError(f"The file cannot be decompressed: {error}")
+    finally:
+        if stream is not None:
+            stream.close()
+
+
+def read_csv(
+    buff: typing.BinaryIO,
+    delimiter: str,
+    chunksize: int | None = None,
+    engine: t.Engine = "c",
+    arrow_dtypes: bool = False,
+    on_chunk: typing.Callable[[t.DataFrame], None] | None = None,
+    rows: int | None = None,
+) -> t.DataFrame:
+    """
+    Read a CSV byte stream into a DataFrame.
+
+    Parameters
+    ----------
+    buff : file-like object
+        Byte stream containing the CSV data.
+    delimiter : str
+        Delimiter of the CSV data.
+    chunksize : int or None, optional
+        Number of rows per chunk. If provided, the stream is parsed chunk by chunk and
+        each chunk is copied into the columns of the final DataFrame; otherwise, it is
+        parsed in one go. Ignored by the 'pyarrow' engine, which reads the stream in
+        blocks by itself.
+    engine : {'c', 'pyarrow'}, optional
+        Parser engine. The 'pyarrow' engine reads the data using multiple threads.
+    arrow_dtypes : bool, optional
+        Whether to keep the Arrow-backed dtypes in the resulting DataFrame.
+    on_chunk : Callable or None, optional
+        Function to be called with each parsed chunk, e.g. to build statistics during
+        the ingestion. Only used if `chunksize` is provided.
+    rows : int or None, optional
+        Upper bound of the number of rows, e.g. the number of lines without the
+        header. If provided along with `chunksize`, the NumPy-backed columns are
+        allocated up front, so the peak memory usage stays close to the size of the
+        final DataFrame instead of twice that.
+
+    Returns
+    -------
+    DataFrame
+        Parsed data.
+
+    Raises
+    ------
+    ValueError, ParserError
+        If there is an issue parsing the data.
+    """
+    params: dict[str, typing.Any] = {"sep": delimiter, "header": 0}
+
+    if arrow_dtypes:
+        params["dtype_backend"] = "pyarrow"
+
+    if engine == "pyarrow":
+        # Arrow trims the whitespace of numeric values by itself but doesn't support
+        # the 'skipinitialspace' option, so the column names are stripped manually
+        df = pd.read_csv(buff, engine="pyarrow", **params)
+        df.columns = df.columns.str.lstrip()
+
+        return df
+
+    params["skipinitialspace"] = True
+
+    if chunksize is None:
+        return pd.read_csv(buff, **params)
+
+    with pd.read_csv(buff, chunksize=chunksize, **params) as reader:
+        if rows is None or arrow_dtypes:
+            # Arrow-backed columns are concatenated as chunked arrays, without copying
+            chunks = list()
+
+            for chunk in reader:
+                if on_chunk is not None:
+                    on_chunk(chunk)
+
+                chunks.append(chunk)
+
+            return pd.concat(chunks, ignore_index=True, copy=False)
+
+        return _fill_columns(reader, rows, on_chunk)
+
+
+def _fill_columns(
+    chunks: typing.Iterable[t.DataFrame],
+    rows: int,
+    on_chunk: typing.Callable[[t.DataFrame], None] | None,
+) -> t.DataFrame:
+    """
+    Copy the chunks into columns allocated up front.
+
+    The dtype of a column is widened as `pd.concat` would do if the chunks disagree,
+    which copies only that column. The unused tail of the columns is trimmed one column
+    at a time if `rows` overestimates the number of rows, e.g. for blank lines or
+    quoted values spanning several lines.
+
+    Parameters
+    ----------
+    chunks : iterable of DataFrame
+        Chunks of rows with the same columns.
+    rows : int
+        Upper bound of the number of rows.
+    on_chunk : Callable or None
+        Function to be called with each chunk.
+
+    Returns
+    -------
+    DataFrame
+        Data of all chunks.
+    """
+    columns: dict[typing.Hashable, t.NDArray] = dict()
+    names = pd.Index([])
+    filled = 0
+
+    for chunk in chunks:
+        if on_chunk is not None:
+            on_chunk(chunk)
+
+        if not columns:
+            names = chunk.columns
+
+        capacity = max(rows, filled + len(chunk))
+
+        for position, (name, series) in enumerate(chunk.items()):
+            values = series.to_numpy()
+            column = columns.get(position)
+
+            if column is None:
+                column = np.empty(capacity, values.dtype)
+            elif column.dtype != values.dtype or len(column) < capacity:
+                numeric = column.dtype.kind in "iuf" and values.dtype.kind in "iuf"
+                dtype = (
+                    np.result_type(column.dtype, values.dtype)
+                    if column.dtype == values.dtype or numeric
+                    else np.dtype(object)
+                )
+                size = (
+                    len(column)
+                    if len(column) >= capacity
+                    else max(capacity, 2 * len(column))
+                )
+                widened = np.empty(size, dtype)
+                widened[:filled] = column[:filled]
+                column = widened
+
+            column[filled : filled + len(values)] = values
+            columns[position] = column
+
+        filled += len(chunk)
+
+    for position, column in columns.items():
+        if len(column) > filled:
+            columns[position] = column[:filled].copy()
+
+    df = pd.DataFrame(columns, index=pd.RangeIndex(filled), copy=False)
+    df.columns = names
+
+    return df
+
+
+def count_lines(buff: typing.BinaryIO) -> int:
+    """
+    Count the lines of a byte stream block by block.
+
+    Parameters
+    ----------
+    buff : file-like object
+        Byte stream to be counted.
+
+    Returns
+    -------
+    int
+        Number of the lines, including the last one without a line break.
+    """
+    lines = 0
+    last = b""
+
+    while block := buff.read(SNIFF_SIZE):
+        lines += block.count(b"\n")
+        last = block
+
+    return lines + (1 if last and not last.endswith(b"\n") else 0)
+
+
+def get_data_format(name: str) -> t.DataFormat:
+    """
+    Identify the format of a data file by its extension.
+
+    Parameters
+    ----------
+    name : str
+        Name of the data file.
+
+    Returns
+    -------
+    DataFormat
+        Identified format.
+
+    Raises
+    ------
+    ReadDataError
+        If the extension is not supported.
+    """
+    for extension, data_format in DATA_FORMATS.items():
+        if name.lower().endswith(extension):
+            return data_format
+
+    raise errors.ReadDataError("The file's format is not supported!")
+
+
+def read_columns(buff: typing.BinaryIO, data_format: t.DataFormat) -> t.Columns:
+    """
+    Read the column names of a binary data file without reading its data.
+
+    Parameters
+    ----------
+    buff : file-like object
+        Byte buffer containing the data. It is rewound after the reading.
+    data_format : {'parquet', 'feather', 'npy', 'npz'}
+        Format of the data.
+
+    Returns
+    -------
+    list of str
+        Column names.
+
+    Raises
+    ------
+    ReadDataError
+        If there is an issue reading the file's metadata.
+    """
+    try:
+        match data_format:
+            case "parquet":
+                columns = parquet.read_schema(_get_arrow_source(buff)).names
+            case "feather":
+                columns = pa.ipc.open_file(_get_arrow_source(buff)).schema.names
+            case "npy":
+                dtype, shape = _read_npy_header(buff)[:2]
+                columns = _get_npy_columns(dtype, shape)
+            case "npz":
+                with np.load(buff) as npz:
+                    columns = list(npz.files)
+            case _:
+                raise errors.ReadDataError("The file's format has no binary schema!")
+    except (pa.ArrowException, OSError, ValueError) as error:
+        raise errors.ReadDataError(error)
+    finally:
+        buff.seek(0)
+
+    return columns
+
+
+def read_binary(
+    buff: typing.BinaryIO,
+    data_format: t.DataFormat,
+    columns: t.Columns | None = None,
+    arrow_dtypes: bool = False,
+) -> t.DataFrame:
+    """
+    Read a binary data file into a DataFrame.
+
+    Only the selected columns are read. Parquet and Feather files are read into Arrow
+    tables directly from the uploaded bytes and converted without consolidating their
+    columns, which is zero-copy for uncompressed Feather files with Arrow-backed
+    dtypes. NPY arrays are wrapped without copying; NPZ archives hold one column per
+    array.
+
+    Parameters
+    ----------
+    buff : file-like object
+        Byte buffer containing the data.
+    data_format : {'parquet', 'feather', 'npy', 'npz'}
+        Format of the data.
+    columns : list of str or None, optional
+        Columns to be read, None to read all columns.
+    arrow_dtypes : bool, optional
+        Whether to keep the Arrow-backed dtypes in the resulting DataFrame.
+
+    Returns
+    -------
+    DataFrame
+        Read data.
+
+    Raises
+    ------
+    ReadDataError
+        If there is an issue reading the data.
+    """
+    try:
+        match data_format:
+            case "parquet":
+                table = parquet.read_table(_get_arrow_source(buff), columns=columns)
+            case "feather":
+                table = feather.read_table(_get_arrow_source(buff), columns=columns)
+            case "npy":
+                df = _read_npy(buff, columns)
+            case "npz":
+                df = _read_npz(buff, columns)
+            case _:
+                raise errors.ReadDataError("The file's format is not binary!")
+
+        if data_format in ("npy", "npz"):
+            if not arrow_dtypes:
+                return df
+
+            table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowException, OSError, ValueError) as error:
+        raise errors.ReadDataError(error)
+
+    if arrow_dtypes:
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def _get_arrow_source(buff: typing.BinaryIO) -> pa.NativeFile:
+    """
+    Wrap a byte buffer into an Arrow source, without copying it if possible.
+
+    Parameters
+    ----------
+    buff : file-like object
+        Byte buffer containing the data.
+
+    Returns
+    -------
+    NativeFile
+        Arrow source reading from the buffer.
+    """
+    if isinstance(buff, io.BytesIO):
+        return pa.BufferReader(pa.py_buffer(buff.getbuffer()))
+
+    return pa.PythonFile(buff, mode="r")
+
+
+def _read_npy_header(buff: typing.BinaryIO) -> tuple[np.dtype, tuple[int, ...], bool]:
+    """
+    Read the header of an NPY file, leaving the stream at the start of the array.
+
+    Parameters
+    ----------
+    buff : file-like object
+        Byte stream containing the NPY data.
+
+    Returns
+    -------
+    tuple
+        Dtype, shape and whether the array is stored in the Fortran order.
+
+    Raises
+    ------
+    ValueError
+        If the stream is not a valid NPY file.
+    """
+    buff.seek(0)
+    version = np.lib.format.read_magic(buff)
+
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(buff)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(buff)
+
+    return dtype, shape, fortran_order
+
+
+def _get_npy_columns(dtype: np.dtype, shape: tuple[int, ...]) -> t.Columns:
+    """
+    Get the column names of an NPY array: the field names of a structured array, or
+    'column_<i>' for each column of a 2-D array.
+
+    Parameters
+    ----------
+    dtype : dtype
+        Dtype of the array.
+    shape : tuple of int
+        Shape of the array.
+
+    Returns
+    -------
+    list of str
+        Column names.
+
+    Raises
+    ------
+    ValueError
+        If the array is neither a 1-D structured array nor a 2-D array.
+    """
+    if dtype.names is not None and len(shape) == 1:
+        return list(dtype.names)
+
+    if dtype.names is None and len(shape) == 2:
+        return [f"column_{i}" for i in range(shape[1])]
+
+    raise ValueError("The array must be 2-dimensional or structured!")
+
+
+def _read_npy(buff: typing.BinaryIO, columns: t.Columns | None) -> t.DataFrame:
+    """
+    Read an NPY file into a DataFrame, viewing the uploaded bytes without copying them
+    if possible.
+
+    Parameters
+    ----------
+    buff : file-like object
+        Byte buffer containing the NPY data.
+    columns : list of str or None
+        Columns to be read, None to read all columns.
+
+    Returns
+    -------
+    DataFrame
+        Read data.
+
+    Raises
+    ------
+    ValueError
+        If the buffer is not a valid NPY file. If the array is neither a 1-D
+        structured array nor a 2-D array. If the columns are not in the array.
+    """
+    dtype, shape, fortran_order = _read_npy_header(buff)
+    names = _get_npy_columns(dtype, shape)
+
+    if isinstance(buff, io.BytesIO) and not dtype.hasobject:
+        array = np.frombuffer(
+            buff.getbuffer(), dtype, count=int(np.prod(shape)), offset=buff.tell()
+        )
+        array = array.reshape(shape, order="F" if fortran_order else "C")
+    else:
+        buff.seek(0)
+        array = np.load(buff, allow_pickle=False)
+
+    buff.seek(0)
+    df = pd.DataFrame(array, columns=None if dtype.names else names, copy=False)
+
+    if columns is None:
+        return df
+
+    if missing := set(columns).difference(names):
+        raise ValueError(f"The columns {sorted(missing)} are not in the array!")
+
+    return df[columns]
+
+
+def _read_npz(buff: typing.BinaryIO, columns: t.Columns | None) -> t.DataFrame:
+    """
+    Read an NPZ archive into a DataFrame, with one column per 1-D array. Only the
+    selected arrays are decompressed.
+
+    Parameters
+    ----------
+    buff : file-like object
+        Byte buffer containing the NPZ data.
+    columns : list of str or None
+        Columns to be read, None to read all columns.
+
+    Returns
+    -------
+    DataFrame
+        Read data.
+
+    Raises
+    ------
+    ValueError
+        If the buffer is not a valid NPZ archive. If the arrays are not 1-D or differ
+        in length. If the columns are not in the archive.
+    """
+    with np.load(buff, allow_pickle=False) as npz:
+        names = npz.files if columns is None else columns
+
+        if missing := set(names).difference(npz.files):
+            raise ValueError(f"The columns {sorted(missing)} are not in the archive!")
+
+        arrays = {name: npz[name] for name in names}
+
+    buff.seek(0)
+
+    if any(array.ndim != 1 for array in arrays.values()):
+        raise ValueError("The archive must contain 1-dimensional arrays only!")
+
+    if len({len(array) for array in arrays.values()}) > 1:
+        raise ValueError("The arrays in the archive must have the same length!")
+
+    return pd.DataFrame(arrays, copy=False)
+
+
+def iter_chunks(
+    df: t.DataFrame, chunksize: int = CHUNK_SIZE
+) -> typing.Iterator[t.DataFrame]:
+    """
+    Iterate over a DataFrame in chunks of rows.
+
+    Parameters
+    ----------
+    df : DataFrame
+        DataFrame to iterate over.
+    chunksize : int, optional
+        Number of rows per chunk.
+
+    Yields
+    ------
+    DataFrame
+        Zero-copy slice of the DataFrame's rows.
+    """
+    for start in range(0, len(df), chunksize):
+        yield df.iloc[start : start + chunksize]
+
+
+def hash_buffer(buff: typing.BinaryIO) -> str:
+    """
+    Compute the content hash of a byte buffer.
+
+    Parameters
+    ----------
+    buff : file-like object
+        Byte buffer to be hashed. It is rewound after the hashing.
+
+    Returns
+    -------
+    str
+        Hexadecimal SHA-256 digest of the buffer's content.
+    """
+    buff.seek(0)
+    digest = hashlib.file_digest(buff, "sha256").hexdigest()
+    buff.seek(0)
+
+    return digest
+
+
+def downcast_numeric(df: t.DataFrame) -> t.DataFrame:
+    """
+    Downcast the numeric columns of a DataFrame to the smallest safe dtypes.
+
+    Float columns are converted to `float32`, and integer columns to the smallest
+    integer dtype that holds all of their values. Columns with Arrow-backed or other
+    extension dtypes are left unchanged.
+
+    Parameters
+    ----------
+    df : DataFrame
+        DataFrame to be downcasted.
+
+    Returns
+    -------
+    DataFrame
+        Downcasted DataFrame.
+    """
+    dtypes = dict()
+
+    for column, dtype in df.dtypes.items():
+        if not isinstance(dtype, np.dtype):
+            continue
+
+        if dtype.kind == "f":
+            dtypes[column] = np.float32
+        elif dtype.kind in "iu":
+            dtypes[column] = pd.to_numeric(df[column], downcast="integer").dtype
+
+    return df.astype(dtypes, copy=False) if dtypes else df
+
+
+def write_memmap(
+    df: t.DataFrame,
+    columns: t.Columns,
+    directory: str = MEMMAP_DIR,
+    chunksize: int = CHUNK_SIZE,
+) -> t.NDArray:
+    """
+    Write the columns of a DataFrame to a memory-mapped `float32` NPY file.
+
+    The file is written chunk by chunk, so only one chunk of rows is converted in
+    memory at a time. On POSIX systems, the file is unlinked right after it is mapped,
+    so its disk space is released as soon as the returned array is garbage-collected.
+
+    Parameters
+    ----------
+    df : DataFrame
+        DataFrame containing the columns.
+    columns : list of str
+        Columns to be written, in order.
+    directory : str, optional
+        Directory to write the file to.
+    chunksize : int, optional
+        Number of rows per chunk.
+
+    Returns
+    -------
+    NDArray
+        Read-only memory-mapped array of shape `(rows, columns)`.
+
+    Raises
+    ------
+    OSError
+        If there is an issue writing the file.
+    """
+    os.makedirs(directory, exist_ok=True)
+
+    with tempfile.NamedTemporaryFile(suffix=".npy", dir=directory, delete=False) as tmp:
+        path = tmp.name
+
+    array = np.lib.format.open_memmap(
+        path, mode="w+", dtype=np.float32, shape=(len(df), len(columns))
+    )
+
+    for start, chunk in zip(range(0, len(df), chunksize), iter_chunks(df, chunksize)):
+        array[start : start + len(chunk)] = chunk[columns].to_numpy(
+            np.float32, na_value=np.nan
+        )
+
+    array.flush()
+    del array
+
+    array = np.load(path, mmap_mode="r")
+
+    try:
+        os.unlink(path)
+    except OSError:  # Mapped files cannot be removed on Windows
+        pass
+
+    return array
+
+
+def make_export_dir() -> str:
+    """
+    Create a private directory for the exported files of a session, readable only by
+    the current user.
+
+    Returns
+    -------
+    str
+        Path to the directory, to be removed by the caller.
+
+    Raises
+    ------
+    OSError
+        If there is an issue creating the directory.
+    """
+    if EXPORT_DIR is not None:
+        os.makedirs(EXPORT_DIR, exist_ok=True)
+
+    return tempfile.mkdtemp(prefix="mlui-exports-", dir=EXPORT_DIR)
+
+
+def write_chunks(
+    chunks: typing.Iterable[t.DataFrame],
+    fmt: t.ExportFormat,
+    directory: str,
+    part_size: int = EXPORT_PART_SIZE,
+    preview_rows: int = PREVIEW_ROWS,
+) -> t.ExportReport:
+    """
+    Write the chunks of a DataFrame to new files one by one, so that only a single
+    chunk is held in memory at a time.
+
+    The chunks are appended to a file until it exceeds the part size, and the next
+    ones go to a new file, so that each part can be read and downloaded on its own.
+
+    Parameters
+    ----------
+    chunks : iterable of DataFrame
+        Chunks of rows with the same columns and dtypes.
+    fmt : {'csv', 'parquet'}
+        Format of the files. Each chunk is appended as CSV lines, with a header in
+        each part, or as a Parquet row group.
+    directory : str
+        Directory to create the export's directory in.
+    part_size : int, optional
+        Size of a part in bytes, after which no more chunks are appended to it.
+    preview_rows : int, optional
+        Number of the first rows to keep for the preview.
+
+    Returns
+    -------
+    ExportReport
+        Directory, paths to the parts, number of rows, size in megabytes and preview
+        of the files.
+
+    Raises
+    ------
+    OSError
+        If there is an issue writing the files.
+    """
+    export_dir = tempfile.mkdtemp(prefix="predictions-", dir=directory)
+    paths: list[str] = list()
+    rows = 0
+    preview = pd.DataFrame()
+
+    try:
+        with contextlib.ExitStack() as stack:
+            sink: typing.Any = None
+            writer: parquet.ParquetWriter | None = None
+
+            for chunk in chunks:
+                if sink is None or sink.tell() >= part_size:
+                    stack.close()
+                    path = os.path.join(
+                        export_dir, f"predictions-{len(paths) + 1:05d}.{fmt}"
+                    )
+                    paths.append(path)
+                    sink = stack.enter_context(
+                        open(path, "w", newline="")
+                        if fmt == "csv"
+                        else pa.OSFile(path, "wb")
+                    )
+                    writer = None
+
+                if fmt == "csv":
+                    chunk.to_csv(sink, header=sink.tell() == 0, index=False)
+                else:
+                    table = pa.Table.from_pandas(chunk, preserve_index=False)
+
+                    if writer is None:
+                        writer = stack.enter_context(
+                            parquet.ParquetWriter(sink, table.schema)
+                        )
+
+                    writer.write_table(table)
+
+                if rows < preview_rows:
+                    preview = pd.concat([preview, chunk.iloc[: preview_rows - rows]])
+
+                rows += len(chunk)
+    except BaseException:
+        # Partial files are of no use, e.g. if the chunks fail to be produced
+        shutil.rmtree(export_dir, ignore_errors=True)
+        raise
+
+    return {
+        "directory": export_dir,
+        "paths": paths,
+        "rows": rows,
+        "size": sum(os.path.getsize(path) for path in paths) / 2**20,
+        "preview": preview.reset_index(drop=True),
+    }
+
+
+def share_array(
+    array: t.NDArray, rows: t.Indices | None = None
+) -> tuple[shared_memory.SharedMemory, t.SharedArray]:
+    """
+    Copy the array to a new block of shared memory.
+
+    The block has to be closed and unlinked by the caller once the other processes
+    no longer need it.
+
+    Parameters
+    ----------
+    array : NDArray
+        Array to be shared.
+    rows : NDArray or None, optional
+        Rows of the array to copy in this order, e.g. a permutation of them, None to
+        copy the array as it is. The rows are gathered straight into the block.
+
+    Returns
+    -------
+    SharedMemory
+        Block of shared memory holding the array.
+    SharedArray
+        Name of the block, shape and dtype of the array, to attach it in other
+        processes.
+    """
+    shape = array.shape if rows is None else (len(rows), *array.shape[1:])
+    size = int(np.prod(shape, dtype=np.int64)) * array.itemsize
+    block = shared_memory.SharedMemory(create=True, size=max(1, size))
+    view = np.ndarray(shape, array.dtype, buffer=block.buf)
+
+    if rows is None:
+        view[...] = array
+    else:
+        np.take(array, rows, axis=0, out=view)
+
+    return block, {"name": block.name, "shape": shape, "dtype": array.dtype.str}
+
+
+def attach_array(spec: t.SharedArray) -> tuple[shared_memory.SharedMemory, t.NDArray]:
+    """
+    Attach to the array shared by another process without copying it.
+
+    Parameters
+    ----------
+    spec : SharedArray
+        Name of the block, shape and dtype of the array.
+
+    Returns
+    -------
+    SharedMemory
+        Block of shared memory, which must be kept referenced while the array is used.
+    NDArray
+        Read-only view of the array.
+    """
+    block = shared_memory.SharedMemory(name=spec["name"])
+    array = np.ndarray(spec["shape"], np.dtype(spec["dtype"]), buffer=block.buf)
+    array.flags.writeable = False
+
+    return block, array
+
+
+def get_memory_usage(df: t.DataFrame) -> t.Series:
+    """
+    Get the memory usage of each column of a DataFrame.
+
+    Parameters
+    ----------
+    df : DataFrame
+        DataFrame to be measured.
+
+    Returns
+    -------
+    Series
+        Memory usage of each column in kibibytes.
+    """
+    return df.memory_usage(index=False, deep=True).div(2**10)
+
+
+def downsample_lttb(x: t.NDArray, y: t.NDArray, threshold: int) -> t.Indices:
+    """
+    Downsample a line series with the Largest-Triangle-Three-Buckets algorithm.
+
+    The series is split into buckets, and the point forming the largest triangle with
+    the previously selected point and the average of the next bucket is selected from
+    each of them, which preserves the visual shape of the line.
+
+    Parameters
+    ----------
+    x : NDArray
+        Sorted values of the x-axis without NaNs.
+    y : NDArray
+        Values of the y-axis without NaNs.
+    threshold : int
+        Number of points to keep, including the first and the last ones.
+
+    Returns
+    -------
+    NDArray
+        Indices of the selected points in ascending order.
+    """
+    size = len(x)
+
+    if threshold >= size or threshold < 3:
+        return np.arange(size)
+
+    edges = np.linspace(1, size - 1, threshold - 1).astype(np.intp)
+    edges = np.append(edges, size)
+    indices = np.empty(threshold, dtype=np.intp)
+    indices[0], indices[-1] = 0, size - 1
+
+    for bucket in range(threshold - 2):
+        start, end, next_end = edges[bucket : bucket + 3]
+        avg_x, avg_y = x[end:next_end].mean(), y[end:next_end].mean()
+        prev_x, prev_y = x[indices[bucket]], y[indices[bucket]]
+        areas = np.abs(
+            (prev_x - avg_x) * (y[start:end] - prev_y)
+            - (prev_x - x[start:end]) * (avg_y - prev_y)
+        )
+        indices[bucket + 1] = start + np.argmax(areas)
+
+    return indices
+
+
+def compute_histogram(values: t.NDArray, bins: int | None = None) -> t.DataFrame:
+    """
+    Compute the histogram of the values.
+
+    Parameters
+    ----------
+    values : NDArray
+        Values to be binned, NaNs and infinities are ignored.
+    bins : int or None, optional
+        Number of equal-width bins. If None, it is estimated from the data, but
+        doesn't exceed `HISTOGRAM_BINS`.
+
+    Returns
+    -------
+    DataFrame
+        Start, end and count of records of each bin.
+    """
+    values = values[np.isfinite(values)]
+
+    if bins is None:
+        bins = _get_bin_count(values)
+
+    counts, edges = np.histogram(values, bins)
+
+    return pd.DataFrame(
+        {"Bin_Start": edges[:-1], "Bin_End": edges[1:], "Count": counts}
+    )
+
+
+def _get_bin_count(values: t.NDArray) -> int:
+    """
+    Estimate the number of bins as NumPy's 'auto' estimator does, without building
+    the edges, so a narrow Freedman-Diaconis width cannot allocate more edges than
+    `HISTOGRAM_BINS`.
+
+    Parameters
+    ----------
+    values : NDArray
+        Finite values to be binned.
+
+    Returns
+    -------
+    int
+        Number of bins between 1 and `HISTOGRAM_BINS`.
+    """
+    if not len(values):
+        return 1
+
+    span = float(values.max() - values.min())
+
+    if not span:
+        return 1
+
+    # The 'auto' estimator takes the smaller of the Sturges and Freedman-Diaconis widths
+    count = np.log2(len(values)) + 1
+    q75, q25 = np.percentile(values, [75, 25])
+    width = 2 * (q75 - q25) / np.cbrt(len(values))
+
+    if width > 0:
+        count = max(count, span / width)
+
+    return int(min(np.ceil(count), HISTOGRAM_BINS))
+
+
+@contextlib.contextmanager
+def trace_memory() -> typing.Iterator[typing.Callable[[], float]]:
+    """
+    Trace the memory allocations made within the context.
+
+    Tracing is started by the first of the nested or concurrent contexts and stopped
+    by the last one, and its peak is never reset while another context is open, so
+    the measurements of concurrent uploads do not interfere. The peak is measured
+    from the traced memory on entering the context, which makes it an upper bound of
+    the enclosed code's allocations if other threads allocate at the same time. The
+    allocations of NumPy and Python objects are traced, while those of Arrow buffers
+    are not.
+
+    Yields
+    ------
+    Callable
+        Function returning the peak traced allocation since entering the context in
+        megabytes.
+    """
+    global _tracers, _started_tracing
+
+    with TRACE_LOCK:
+        if not _tracers and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _started_tracing = True
+
+        _tracers += 1
+        current, _ = tracemalloc.get_traced_memory()
+
+    try:
+        yield lambda: max(tracemalloc.get_traced_memory()[1] - current, 0) / 2**20
+    finally:
+        with TRACE_LOCK:
+            _tracers -= 1
+
+            if not _tracers and _started_tracing:
+                tracemalloc.stop()
+                _started_tracing = False
+
+
 def validate_df(df: t.DataFrame) -> None:
     """
     Validate the structure of a DataFrame.
@@ -100,6 +1238,6 @@ def contains_nonnumeric_dtypes(df: t.DataFrame) -> bool:
     bool
         True if there are non-numeric data types, False otherwise.
     """
-    nonnumeric_columns = df.select_dtypes(exclude=["float", "int"]).columns
+    nonnumeric_columns = df.select_dtypes(exclude=[np.floating, np.integer]).columns
 
     return True if len(nonnumeric_columns) != 0 else False
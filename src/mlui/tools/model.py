@@ -1,3 +1,9 @@
+import hashlib
+import os
+
+import numpy as np
+import tensorflow as tf
+
 import mlui.types.classes as t
 from mlui.classes import errors
 
@@ -35,3 +41,248 @@ def validate_shapes(shapes: t.Shapes) -> None:
             raise errors.ValidateModelError(
                 "At least one of the model's shapes contains more than 2 dimensions!"
             )
+
+
+def to_tensors(data: t.LayerData) -> t.LayerTensors:
+    """
+    Copy the layer data into `float32` tensors.
+
+    Convert the data once when several datasets read it, e.g. the training and the
+    validation ones, so each of them gathers its rows from the same tensors.
+
+    Parameters
+    ----------
+    data : dict of {str to NDArray}
+        Data of each layer.
+
+    Returns
+    -------
+    dict of {str to Tensor}
+        Tensor of each layer.
+    """
+    return {
+        layer: tf.convert_to_tensor(np.asarray(array, np.float32))
+        for layer, array in data.items()
+    }
+
+
+def make_dataset(
+    x: t.LayerData | t.LayerTensors,
+    y: t.LayerData | t.LayerTensors | None,
+    batch_size: int,
+    start: int = 0,
+    stop: int | None = None,
+    shuffle: bool = False,
+    memmap: bool = False,
+    skip: tuple[int, int] | None = None,
+) -> tf.data.Dataset:
+    """
+    Build an input pipeline reading batches of rows from the layer data.
+
+    The pipeline iterates over the row indices: the batches are gathered from the
+    data by a parallel map, cast to `float32` and prefetched while the model processes
+    the previous ones. In-memory data is gathered from tensors by graph operations,
+    while memory-mapped data is sliced from disk one contiguous batch at a time,
+    without ever being loaded as a whole.
+
+    Parameters
+    ----------
+    x : dict of {str to NDArray} or dict of {str to Tensor}
+        Input data of each input layer. Arrays of in-memory data are converted to
+        tensors, while the tensors made by `to_tensors` are used as they are.
+    y : dict of {str to NDArray}, dict of {str to Tensor} or None
+        Output data of each output layer, None for the predictions.
+    batch_size : int
+        Batch size.
+    start : int, optional
+        First row of the range to read.
+    stop : int or None, optional
+        Row after the last row of the range to read, None for the end of the data.
+    shuffle : bool, optional
+        Whether to shuffle the rows on each iteration. For memory-mapped data, the
+        order of the batches is shuffled instead, so the reads stay sequential.
+    memmap : bool, optional
+        Whether to slice the batches from the arrays on each step instead of copying
+        the arrays into tensors, e.g. for memory-mapped or shared-memory arrays.
+    skip : tuple of int or None, optional
+        First and after the last row of a range within the read one to leave out,
+        e.g. the validation fold of the cross-validation.
+
+    Returns
+    -------
+    Dataset
+        Dataset of input batches, or of pairs of input and output batches.
+    """
+    arrays = list(x.values()) if y is None else [*x.values(), *y.values()]
+    stop = len(arrays[0]) if stop is None else stop
+    segments = [(start, stop)] if skip is None else [(start, skip[0]), (skip[1], stop)]
+    segments = [(first, last) for first, last in segments if first < last]
+
+    if memmap:
+        bounds = np.array(
+            [
+                (row, min(row + batch_size, last))
+                for first, last in segments
+                for row in range(first, last, batch_size)
+            ],
+            dtype=np.int64,
+        ).reshape(-1, 2)
+        dataset = tf.data.Dataset.from_tensor_slices(bounds)
+
+        if shuffle:
+            dataset = dataset.shuffle(len(bounds), reshuffle_each_iteration=True)
+
+        def read(bounds: t.Indices) -> list[t.NDArray]:
+            rows = slice(*bounds)
+
+            return [np.asarray(array[rows], dtype=np.float32) for array in arrays]
+
+        def gather(bounds: tf.Tensor) -> list[tf.Tensor]:
+            batch = tf.numpy_function(read, [bounds], [tf.float32] * len(arrays))
+
+            for tensor, array in zip(batch, arrays):
+                tensor.set_shape([None, array.shape[1]])
+
+            return batch
+
+    else:
+        tensors = [
+            array
+            if isinstance(array, tf.Tensor)
+            else tf.convert_to_tensor(np.asarray(array, np.float32))
+            for array in arrays
+        ]
+        rows = sum(last - first for first, last in segments)
+        dataset = tf.data.Dataset.from_tensors(
+            tf.concat(
+                [tf.range(first, last, dtype=tf.int64) for first, last in segments]
+                or [tf.zeros([0], tf.int64)],
+                axis=0,
+            )
+        )
+
+        if shuffle:
+            dataset = dataset.map(tf.random.shuffle)
+
+        dataset = dataset.flat_map(
+            lambda indices: _split_batches(indices, rows, batch_size)
+        )
+        dataset = dataset.apply(
+            tf.data.experimental.assert_cardinality(len(range(0, rows, batch_size)))
+        )
+
+        def gather(indices: tf.Tensor) -> list[tf.Tensor]:
+            return [tf.gather(tensor, indices) for tensor in tensors]
+
+    def load(rows: tf.Tensor) -> t.Batch:
+        batch = gather(rows)
+        inputs = dict(zip(x, batch[: len(x)]))
+
+        if y is None:
+            return inputs
+
+        return inputs, dict(zip(y, batch[len(x) :]))
+
+    dataset = dataset.map(
+        load, num_parallel_calls=tf.data.AUTOTUNE, deterministic=not shuffle
+    )
+
+    return dataset.prefetch(tf.data.AUTOTUNE)
+
+
+def _split_batches(indices: tf.Tensor, rows: int, batch_size: int) -> tf.data.Dataset:
+    """
+    Split the row indices into batches.
+
+    Parameters
+    ----------
+    indices : Tensor
+        Row indices.
+    rows : int
+        Number of the row indices.
+    batch_size : int
+        Batch size.
+
+    Returns
+    -------
+    Dataset
+        Dataset of the batches of row indices, the last one possibly partial.
+    """
+    full = rows // batch_size * batch_size
+    batches = tf.data.Dataset.from_tensor_slices(
+        tf.reshape(indices[:full], [-1, batch_size])
+    )
+
+    if full < rows:
+        batches = batches.concatenate(tf.data.Dataset.from_tensors(indices[full:]))
+
+    return batches
+
+
+def get_activations_size(model: t.Object, batch_size: int) -> float:
+    """
+    Get the memory taken by the outputs of the model's layers for a batch.
+
+    Parameters
+    ----------
+    model : Model
+        Keras model.
+    batch_size : int
+        Batch size.
+
+    Returns
+    -------
+    float
+        Size of the activations in mebibytes, according to the compute dtypes of the
+        layers.
+    """
+    size = 0
+
+    for layer in model.layers:
+        dtype = tf.as_dtype(layer.compute_dtype or "float32")
+
+        for output in tf.nest.flatten(layer.output):
+            elements = np.prod([dim or 1 for dim in output.shape[1:]], dtype=np.int64)
+            size += int(elements) * batch_size * dtype.size
+
+    return size / 2**20
+
+
+def get_available_cores() -> int:
+    """
+    Get the number of CPU cores available to the current process.
+
+    Returns
+    -------
+    int
+        Number of the cores.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+
+    return os.cpu_count() or 1
+
+
+def get_weights_fingerprint(model: t.Object) -> str:
+    """
+    Compute the fingerprint of the model's weights.
+
+    Parameters
+    ----------
+    model : Model
+        Keras model.
+
+    Returns
+    -------
+    str
+        Hexadecimal SHA-256 digest of the shapes, dtypes and values of the weights.
+    """
+    digest = hashlib.sha256()
+
+    for weight in model.weights:
+        array = np.ascontiguousarray(weight.numpy())
+
+        digest.update(f"{weight.name}:{array.shape}:{array.dtype};".encode())
+        digest.update(memoryview(array).cast("B"))
+
+    return digest.hexdigest()
@@ -15,14 +15,73 @@ PageTasks: typing.TypeAlias = list[str]
 Columns: typing.TypeAlias = list[str]
 Features: typing.TypeAlias = list[str]
 DataFrame: typing.TypeAlias = pd.DataFrame
+Series: typing.TypeAlias = pd.Series
+Engine: typing.TypeAlias = typing.Literal["c", "pyarrow"]
+Compression: typing.TypeAlias = typing.Literal["gzip", "bz2", "xz", "zstd"]
+DataFormat: typing.TypeAlias = typing.Literal["csv", "parquet", "feather", "npy", "npz"]
+CacheEntry: typing.TypeAlias = tuple[DataFrame | None, str | None]
+
+
+class ViewKey(typing.NamedTuple):
+    """Type annotation class for the sorting and filtering options of the data view."""
+
+    sort_by: str | None = None
+    ascending: bool = True
+    filter_by: str | None = None
+    bounds: tuple[float, float] | None = None
+
+
+class UploadReport(typing.TypedDict):
+    """Type annotation class for the performance report of the data upload."""
+
+    time: float
+    size: float
+    peak_memory: float | None
+    cached: bool
+
+
+ExportFormat: typing.TypeAlias = typing.Literal["csv", "parquet"]
+
+
+class ExportReport(typing.TypedDict):
+    """Type annotation class for the report of the file export."""
+
+    directory: str
+    paths: list[str]
+    rows: int
+    size: float
+    preview: DataFrame
+
+
+class SharedArray(typing.TypedDict):
+    """Type annotation class for the array in shared memory."""
+
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+
+class CrossValidationReport(typing.TypedDict):
+    """Type annotation class for the report of the cross-validation."""
+
+    folds: DataFrame
+    summary: DataFrame
+    wall_time: float
+
 
 Object: typing.TypeAlias = tf.keras.Model
 Side: typing.TypeAlias = typing.Literal["input", "output"]
 Shape: typing.TypeAlias = tuple[None, int]
 Shapes: typing.TypeAlias = dict[str, Shape] | list[Shape] | Shape
 NDArray: typing.TypeAlias = npt.NDArray[np.float64]
+Indices: typing.TypeAlias = npt.NDArray[np.intp]
 EvaluationResults: typing.TypeAlias = DataFrame
 Predictions: typing.TypeAlias = list[DataFrame]
+Result: typing.TypeAlias = EvaluationResults | Predictions
+Logs: typing.TypeAlias = dict[str, typing.Any]
+WorkerStatus: typing.TypeAlias = typing.Literal[
+    "idle", "running", "completed", "cancelled", "failed"
+]
 
 # Charts
 LogsNames: typing.TypeAlias = list[str]
@@ -43,7 +102,26 @@ LayerFeatures: typing.TypeAlias = dict[str, Features]
 LayerConfigured: typing.TypeAlias = dict[str, bool]
 LayerObject: typing.TypeAlias = dict[str, Layer]
 LayerData: typing.TypeAlias = dict[str, NDArray]
+LayerTensors: typing.TypeAlias = dict[str, tf.Tensor]
+LayerDataKey: typing.TypeAlias = tuple[
+    int, Side, bool, tuple[tuple[str, tuple[str, ...]], ...]
+]
 LayerConnection: typing.TypeAlias = Layer | list[Layer] | None
+Batch: typing.TypeAlias = (
+    dict[str, tf.Tensor] | tuple[dict[str, tf.Tensor], dict[str, tf.Tensor]]
+)
+InputBatch: typing.TypeAlias = dict[str, tf.Tensor] | LayerData
+ServingFunction: typing.TypeAlias = typing.Callable[[InputBatch], list[tf.Tensor]]
+
+
+class ServingStats(typing.TypedDict):
+    """Type annotation class for the statistics of the serving function."""
+
+    traces: int
+    calls: int
+    mean: float
+    p50: float
+    p95: float
 
 
 class LayerParams(typing.TypedDict):
@@ -139,3 +217,57 @@ class EarlyStoppingParams(CallbackParams):
 
     min_delta: float
     patience: int
+
+
+class CheckpointParams(CallbackParams):
+    """Type annotation class for the Checkpoint callback."""
+
+    max_to_keep: int
+    best_only: bool
+    monitor: str
+    run_id: str | None
+
+
+# Sweeps
+class SearchSpace(typing.TypedDict):
+    """Type annotation class for the search space of the sweep."""
+
+    num_layers: list[int]
+    units: list[int]
+    activations: list[str]
+    optimizers: list[str]
+    learning_rates: list[float]
+
+
+class TrialSpec(typing.TypedDict):
+    """Type annotation class for the configuration of the sweep trial."""
+
+    trial: int
+    num_layers: int
+    units: int
+    activation: str
+    optimizer: str
+    learning_rate: float
+    loss: str
+    output_activation: str
+
+
+class StoppingState(typing.TypedDict):
+    """Type annotation class for the early stopping state of the sweep trial."""
+
+    best: float
+    wait: int
+
+
+class TrialResult(typing.TypedDict):
+    """Type annotation class for the result of the sweep trial."""
+
+    weights: list[NDArray]
+    optimizer: list[NDArray]
+    history: dict[str, list[float]]
+    stopping: StoppingState
+    stopped: bool
+    time: float
+
+
+RungCallback: typing.TypeAlias = typing.Callable[[int, int, int], None]
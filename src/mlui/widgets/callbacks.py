@@ -49,3 +49,33 @@ class TerminateOnNaN(CallbackWidget):
     @property
     def params(self) -> t.CallbackParams:
         return {}
+
+
+class Checkpoint(CallbackWidget):
+    """Widget class for the Checkpoint callback."""
+
+    def __init__(self) -> None:
+        self._max_to_keep = st.number_input(
+            "Checkpoints to keep:", min_value=1, max_value=20, value=3, step=1
+        )
+        self._best_only = st.toggle(
+            "Best Only",
+            help="Save a checkpoint only when the monitored log improves.",
+        )
+        self._monitor = st.selectbox(
+            "Monitor:", ["val_loss", "loss"], disabled=not self._best_only
+        )
+        self._run_id = st.text_input(
+            "Run ID:",
+            help="Leave empty to start a new run, or enter the ID of an interrupted "
+            "run to resume it.",
+        )
+
+    @property
+    def params(self) -> t.CheckpointParams:
+        return {
+            "max_to_keep": int(self._max_to_keep),
+            "best_only": self._best_only,
+            "monitor": str(self._monitor),
+            "run_id": self._run_id.strip() or None,
+        }
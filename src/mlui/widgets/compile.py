@@ -1,5 +1,6 @@
 import streamlit as st
 
+import mlui.classes.data as data
 import mlui.classes.errors as errors
 import mlui.classes.model as model
 import mlui.enums as enums
@@ -114,15 +115,84 @@ def compile_model_ui(model: model.Model) -> None:
     st.markdown(
         "Compile the model by pressing the provided button. It will use the parameters "
         "selected above. Any changes made to the previous sections afterward will not "
-        "take effect until you click the button again."
+        "take effect until you click the button again. Small models usually train "
+        "faster with the XLA compilation and several steps per execution, which "
+        "reduce the overhead of running each batch."
+    )
+
+    jit_compile = st.toggle(
+        "XLA Compilation",
+        value=model.jit_compile,
+        help="Fuse the operations of each training step into fewer kernels.",
+    )
+    steps_per_execution = st.number_input(
+        "Steps per execution:",
+        min_value=1,
+        max_value=1000,
+        value=model.steps_per_execution,
+        step=1,
+        help="Number of batches to run in each call of the compiled step function. "
+        "The training progress is updated less frequently with larger values.",
+    )
+    mixed_precision = st.toggle(
+        "Mixed Precision",
+        value=model.mixed_precision,
+        help="Compute the hidden layers in bfloat16, keeping the weights and the "
+        "output layers in float32. Speeds up the training and halves the memory of "
+        "the activations on CPUs with bfloat16 support.",
     )
 
     def compile_model() -> None:
         """Supporting function for the accurate representation of widgets."""
         try:
-            model.compile()
+            model.compile(jit_compile, int(steps_per_execution), mixed_precision)
             st.toast("Model is compiled!", icon="✅")
         except errors.ModelError as error:
             st.toast(error, icon="❌")
 
     st.button("Compile Model", on_click=compile_model)
+
+
+def benchmark_model_ui(data: data.Data, model: model.Model) -> None:
+    """Generate the UI for benchmarking the compilation settings of the model.
+
+    Parameters
+    ----------
+    data : Data
+        Data object.
+    model : Model
+        Model object.
+    """
+    st.header("Benchmark Compilation")
+    st.markdown(
+        "Compare the time per epoch, throughput and memory taken by the activations "
+        "of a batch of the model compiled with the settings above against the default "
+        "ones. Both configurations are trained on copies of the "
+        "model, so its weights are left intact. The first epoch includes the "
+        "compilation time and is shown separately."
+    )
+
+    if data.empty or not model.compiled:
+        st.info(
+            "Benchmarking will be available once the data is uploaded and the model "
+            "is compiled.",
+            icon="💡",
+        )
+        return
+
+    batch_size = st.number_input(
+        "Batch size:", min_value=1, max_value=1024, value=32, step=1
+    )
+    num_epochs = st.number_input(
+        "Number of epochs:", min_value=2, max_value=20, value=3, step=1
+    )
+    benchmark_btn = st.button("Run Benchmark")
+
+    if benchmark_btn:
+        try:
+            with st.spinner("Benchmarking..."):
+                results = model.benchmark(data, int(batch_size), int(num_epochs))
+
+            st.dataframe(results, hide_index=True, use_container_width=True)
+        except errors.ModelError as error:
+            st.toast(error, icon="❌")
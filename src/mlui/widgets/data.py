@@ -47,13 +47,52 @@ def dataframe_ui(data: data.Data) -> None:
     """
     st.header("Dataframe")
     st.markdown(
-        "View your data file. You can sort and resize columns, search through data by "
-        "clicking the search icon or pressing `⌘ Cmd + F` / `Ctrl + F` on the table, "
-        "copy/paste different parts to/from clipboard, and download the dataset in "
-        "`CSV` format."
+        "View your data file page by page. Sorting and filtering by a range of values "
+        "are applied to the whole dataset before paging, while only the rows of the "
+        "current page are sent to the table. You can resize columns, search through "
+        "the page by clicking the search icon or pressing `⌘ Cmd + F` / `Ctrl + F` on "
+        "the table, copy/paste different parts to/from clipboard, and download the page "
+        "in `CSV` format."
     )
 
-    st.dataframe(data.dataframe, use_container_width=True)
+    with st.expander("View Options"):
+        sort_by = st.selectbox(
+            "Sort by column:", data.columns, index=None, placeholder="No sorting"
+        )
+        descending = st.toggle("Descending Order", disabled=sort_by is None)
+        filter_by = st.selectbox(
+            "Filter by column:",
+            data.numeric_columns,
+            index=None,
+            placeholder="No filtering",
+        )
+        lower = st.number_input(
+            "Minimum value:", value=None, placeholder="-∞", disabled=filter_by is None
+        )
+        upper = st.number_input(
+            "Maximum value:", value=None, placeholder="+∞", disabled=filter_by is None
+        )
+        page_size = st.selectbox("Rows per page:", [50, 100, 500, 1000], index=1)
+
+    bounds = None
+
+    if lower is not None or upper is not None:
+        bounds = (
+            -float("inf") if lower is None else float(lower),
+            float("inf") if upper is None else float(upper),
+        )
+
+    _, rows = data.get_page(0, page_size, sort_by, not descending, filter_by, bounds)
+    pages = max(1, -(-rows // page_size))
+    page = st.number_input(
+        f"Page (of {pages}):", min_value=1, max_value=pages, value=1, step=1
+    )
+    df, _ = data.get_page(
+        int(page) - 1, page_size, sort_by, not descending, filter_by, bounds
+    )
+
+    st.dataframe(df, use_container_width=True)
+    st.caption(f"{rows} rows in total.")
 
 
 def statistics_ui(data: data.Data) -> None:
@@ -66,8 +105,10 @@ def statistics_ui(data: data.Data) -> None:
     """
     st.header("Statistics")
     st.markdown(
-        "View the descriptive statistics of the dataset, as well as the dtype and "
-        "percent of missing values for each column."
+        "View the descriptive statistics of the dataset, as well as the dtype, "
+        "percent of missing values, and memory usage before and after downcasting "
+        "for each column. If the data was uploaded with approximate statistics, the "
+        "quartiles are estimated, and their rank error bound is shown in percent."
     )
 
     stats = data.get_stats()
@@ -86,20 +127,39 @@ def plot_columns_ui(data: data.Data) -> None:
     st.markdown(
         "Plot different columns of the dataset against each other. A simple line plot "
         "is used for two distinct columns, and a histogram is used for the same ones. "
+        "The number of histogram bins is estimated from the data unless specified. "
         "Additionally, you can interact with the plot by zooming in and out, dragging "
         "it, and accessing different download options by clicking the three dots in "
-        "the upper right corner."
+        "the upper right corner. Long line plots are downsampled to the specified "
+        "number of points, preserving their shape, unless the exact plot is chosen."
     )
 
     with st.form("plot_columns_form", border=False):
         x = st.selectbox("Select X-axis column:", data.columns)
         y = st.selectbox("Select Y-axis column:", data.columns)
         points = st.toggle("Point Markers")
+        max_points = st.number_input(
+            "Number of points:", min_value=100, max_value=20000, value=2000, step=100
+        )
+        exact = st.toggle("Exact Plot")
+        bins = st.number_input(
+            "Number of bins (0 for automatic):",
+            min_value=0,
+            max_value=1000,
+            value=0,
+            step=1,
+        )
         plot_columns_btn = st.form_submit_button("Plot Columns")
 
     if plot_columns_btn:
         try:
-            chart = data.plot_columns(x, y, points)
+            chart = data.plot_columns(
+                x,
+                y,
+                points,
+                None if exact else int(max_points),
+                int(bins) if bins else None,
+            )
 
             st.altair_chart(chart, use_container_width=True)
         except errors.PlotError as error:
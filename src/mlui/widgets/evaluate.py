@@ -27,13 +27,17 @@ def evaluate_model_ui(data: data.Data, model: model.UploadedModel) -> None:
     batch_size = st.number_input(
         "Batch size:", min_value=1, max_value=1024, value=32, step=1
     )
+    out_of_core = st.toggle(
+        "Out-of-core Mode",
+        help="Write the features to memory-mapped files on disk and read them batch "
+        "by batch, for datasets which don't fit in memory together with their copies.",
+    )
     evaluate_model_btn = st.button("Evaluate Model")
 
     if evaluate_model_btn:
         with st.status("Evaluation Results"):
             try:
-                df = data.dataframe
-                results = model.evaluate(df, int(batch_size))
+                results = model.evaluate(data, int(batch_size), out_of_core)
 
                 st.subheader("Tracked metrics and losses")
                 st.dataframe(results, hide_index=True)
@@ -1,8 +1,13 @@
+import os
+import typing
+
+import pandas as pd
 import streamlit as st
 
 import mlui.classes.data as data
 import mlui.classes.errors as errors
 import mlui.classes.model as model
+import mlui.types.classes as t
 
 
 def make_predictions_ui(data: data.Data, model: model.UploadedModel) -> None:
@@ -27,13 +32,17 @@ def make_predictions_ui(data: data.Data, model: model.UploadedModel) -> None:
     batch_size = st.number_input(
         "Batch size:", min_value=1, max_value=1024, value=32, step=1
     )
+    out_of_core = st.toggle(
+        "Out-of-core Mode",
+        help="Write the features to memory-mapped files on disk and read them batch "
+        "by batch, for datasets which don't fit in memory together with their copies.",
+    )
     make_predictions_btn = st.button("Make Predictions")
 
     if make_predictions_btn:
         with st.status("Predictions"):
             try:
-                df = data.dataframe
-                predictions = model.predict(df, int(batch_size))
+                predictions = model.predict(data, int(batch_size), out_of_core)
                 outputs = model.outputs
 
                 for position, output in enumerate(outputs):
@@ -43,3 +52,132 @@ def make_predictions_ui(data: data.Data, model: model.UploadedModel) -> None:
                 st.toast("Predictions are completed!", icon="✅")
             except errors.ModelError as error:
                 st.toast(error, icon="❌")
+
+
+def export_predictions_ui(data: data.Data, model: model.UploadedModel) -> None:
+    """Generate the UI for exporting the predictions of the model to a file.
+
+    Parameters
+    ----------
+    data : Data
+        Data object.
+    model : UploadedModel
+        Model object.
+    """
+    st.header("Export Predictions")
+    st.markdown(
+        "Write the predictions straight to a CSV or Parquet file instead of displaying "
+        "them, which keeps the memory usage bounded for large datasets. The rows are "
+        "predicted in chunks, and each chunk is appended to the file before the next "
+        "one is predicted. The file has a column for each node of each output layer. "
+        "Large files are split into parts of about 64 MB, which are downloaded one by "
+        "one, so that only the selected part is read into memory. Once the file is "
+        "written, you can download it and look at its first rows. The file is kept in "
+        "a private directory of your session until the next export or the end of the "
+        "session."
+    )
+
+    with st.form("export_predictions_form", border=False):
+        batch_size = st.number_input(
+            "Batch size:", min_value=1, max_value=1024, value=32, step=1
+        )
+        chunk_size = st.number_input(
+            "Rows per chunk:",
+            min_value=1_000,
+            max_value=10_000_000,
+            value=100_000,
+            step=1_000,
+        )
+        fmt = st.selectbox("File format:", ["parquet", "csv"])
+        out_of_core = st.toggle(
+            "Out-of-core Mode",
+            help="Write the features to memory-mapped files on disk and read them "
+            "batch by batch, for datasets which don't fit in memory together with "
+            "their copies.",
+        )
+        export_btn = st.form_submit_button("Export Predictions")
+
+    if export_btn:
+        try:
+            with st.spinner("Exporting..."):
+                model.export_predictions(
+                    data,
+                    int(batch_size),
+                    typing.cast(t.ExportFormat, fmt),
+                    int(chunk_size),
+                    out_of_core,
+                )
+        except errors.ModelError as error:
+            st.toast(error, icon="❌")
+
+    report = model.export
+
+    if report:
+        st.caption(f"{report['rows']} rows, {report['size']:.1f} MB. The first rows:")
+        st.dataframe(report["preview"], use_container_width=True)
+
+        # Only the selected part is read into memory for the download
+        paths = report["paths"]
+        part = st.selectbox(
+            "Select part:",
+            range(len(paths)),
+            format_func=lambda index: f"{index + 1} of {len(paths)}",
+            disabled=len(paths) == 1,
+        )
+
+        with open(paths[part], "rb") as file:
+            st.download_button(
+                "Download Predictions", file, os.path.basename(paths[part])
+            )
+
+
+def predict_one_ui(data: data.Data, model: model.UploadedModel) -> None:
+    """Generate the UI for making the prediction for a single row.
+
+    Parameters
+    ----------
+    data : Data
+        Data object.
+    model : UploadedModel
+        Model object.
+    """
+    st.header("Predict Single Row")
+    st.markdown(
+        "Edit the values of the input features, prefilled from the first row of the "
+        "data, and get the prediction of the model right away. The model is prepared "
+        "for serving once, so repeated predictions take only milliseconds. The number "
+        "of the preparations and the latency of the latest predictions are shown below."
+    )
+
+    columns = list(
+        dict.fromkeys(
+            column
+            for layer in model.inputs
+            for column in model.get_features(layer, "input")
+        )
+    )
+
+    if data.empty or not columns:
+        return
+
+    row = st.data_editor(
+        data.dataframe.loc[:0, columns], hide_index=True, use_container_width=True
+    )
+    predict_btn = st.button("Predict Row")
+
+    if predict_btn:
+        try:
+            outputs = model.predict_one(row.iloc[0].astype(float).to_dict())
+
+            for output, values in outputs.items():
+                st.subheader(output)
+                st.dataframe(pd.DataFrame([values]), hide_index=True)
+        except (errors.ModelError, ValueError) as error:
+            st.toast(error, icon="❌")
+
+    stats = model.serving_stats
+    st.caption(
+        f"Traces: {stats['traces']}, calls: {stats['calls']}, latency: "
+        f"{stats['mean']:.2f} ms mean, {stats['p50']:.2f} ms median, "
+        f"{stats['p95']:.2f} ms 95th percentile."
+    )
@@ -1,13 +1,23 @@
+import time
+
+import pandas as pd
 import streamlit as st
-import streamlit_extras.capture as capture
 import streamlit_extras.chart_container as container
 
 import mlui.classes.data as data
 import mlui.classes.errors as errors
 import mlui.classes.model as model
+import mlui.classes.sweep as sweep
+import mlui.classes.worker as worker
+import mlui.enums as enums
+import mlui.tools as tools
+
+REFRESH_INTERVAL = 0.5
 
 
-def fit_model_ui(data: data.Data, model: model.Model) -> None:
+def fit_model_ui(
+    data: data.Data, model: model.Model, worker: worker.TrainingWorker
+) -> None:
     """Generate the UI for fitting the model.
 
     Parameters
@@ -16,16 +26,22 @@ def fit_model_ui(data: data.Data, model: model.Model) -> None:
         Data object.
     model : Model
         Model object.
+    worker : TrainingWorker
+        Worker object.
     """
     st.header("Fit Model")
     st.markdown(
         "Train the model by specifying the required hyperparameters. Once the `Fit "
-        "Model` button is clicked, the training process will start, and logs will be "
-        "displayed in the respective dropdown. Depending on the size of your model and "
-        "chosen hyperparameters, it might take some time. Be aware that if you change "
-        "a widget's value or navigate to other pages, the logs dropdown will "
-        "disappear. However, you will still be able to examine the history dataframe "
-        "and plot the logs in the next section."
+        "Model` button is clicked, the training process will start in the background, "
+        "and its progress and latest logs will be displayed below. Depending on the "
+        "size of your model and chosen hyperparameters, it might take some time. The "
+        "training continues if you change a widget's value or navigate to other "
+        "pages, and you can cancel it at any time. The chart shows the training logs "
+        "sampled over the batches. Once it is finished, you will be "
+        "able to examine the history dataframe and plot the logs in the next section. "
+        "If the `Checkpoint` callback is set, you can restore an interrupted run with "
+        "the `Resume from Checkpoint` button and fit the model again to continue it. "
+        "To resume a run of an earlier session, set the callback with its run ID."
     )
 
     batch_size = st.number_input(
@@ -37,18 +53,90 @@ def fit_model_ui(data: data.Data, model: model.Model) -> None:
     val_split = st.number_input(
         "Validation split:", min_value=0.01, max_value=1.0, value=0.15, step=0.01
     )
-    fit_model_btn = st.button("Fit Model")
+    out_of_core = st.toggle(
+        "Out-of-core Mode",
+        help="Write the features to memory-mapped files on disk and read them batch "
+        "by batch, for datasets which don't fit in memory together with their copies.",
+    )
+    fit_model_btn = st.button("Fit Model", disabled=worker.running)
+    resume_btn = st.button("Resume from Checkpoint", disabled=worker.running)
+    checkpoint = model.get_callback("Checkpoint")
+
+    if checkpoint is not None:
+        st.caption(f"Checkpoints are saved under the run ID `{checkpoint.run_id}`.")
 
     if fit_model_btn:
-        with st.status("Training Logs"):
-            with capture.stdout(st.empty().code):
-                try:
-                    df = data.dataframe
+        try:
+            worker.start(
+                model,
+                data,
+                int(batch_size),
+                int(num_epochs),
+                float(val_split),
+                out_of_core,
+            )
+            st.toast("Training is started!", icon="✅")
+        except errors.ModelError as error:
+            st.toast(error, icon="❌")
+
+    if resume_btn:
+        try:
+            epoch = model.restore_checkpoint()
+            st.toast(f"Checkpoint of epoch {epoch} is restored!", icon="✅")
+        except errors.ModelError as error:
+            st.toast(error, icon="❌")
+
+
+def training_status_ui(worker: worker.TrainingWorker) -> None:
+    """Generate the UI for tracking the training in the background.
 
-                    model.fit(df, int(batch_size), int(num_epochs), float(val_split))
-                    st.toast("Training is completed!", icon="✅")
-                except errors.ModelError as error:
-                    st.toast(error, icon="❌")
+    The progress bar, the chart of the batch logs and the logs of the last epoch are
+    rendered once per run. While the training is running, the page is rerun after
+    `REFRESH_INTERVAL` seconds to refresh them, so this UI should be generated last.
+    Interacting with any widget reruns the page earlier, but doesn't interrupt the
+    training.
+
+    Parameters
+    ----------
+    worker : TrainingWorker
+        Worker object.
+    """
+    if worker.status == "idle":
+        return
+
+    # Read the status first, so the final logs are rendered once it is finished
+    running = worker.running
+
+    if running and st.button("Cancel Training"):
+        worker.cancel()
+        st.toast("Training will stop after the current batch.", icon="💡")
+
+    st.progress(
+        worker.progress, f"Epoch {worker.epoch} of {worker.num_epochs} completed."
+    )
+
+    try:
+        st.altair_chart(worker.plot_telemetry(), use_container_width=True)
+    except errors.PlotError:
+        pass
+
+    if worker.metrics:
+        st.dataframe(
+            pd.DataFrame([worker.metrics]).set_index("epoch"),
+            use_container_width=True,
+        )
+
+    if running:
+        time.sleep(REFRESH_INTERVAL)
+        st.rerun()
+
+    match worker.status:
+        case "completed":
+            st.success("Training is completed!", icon="✅")
+        case "cancelled":
+            st.info("Training is cancelled.", icon="💡")
+        case "failed":
+            st.error(worker.error, icon="❌")
 
 
 def plot_history_ui(model: model.Model) -> None:
@@ -84,3 +172,182 @@ def plot_history_ui(model: model.Model) -> None:
                 st.altair_chart(chart, use_container_width=True)
             except errors.PlotError as error:
                 st.toast(error, icon="❌")
+
+
+def cross_validation_ui(data: data.Data, model: model.Model) -> None:
+    """Generate the UI for cross-validating the model.
+
+    Parameters
+    ----------
+    data : Data
+        Data object.
+    model : Model
+        Model object.
+    """
+    st.header("Cross-Validation")
+    st.markdown(
+        "Estimate how well the model generalizes with the K-fold cross-validation. The "
+        "rows are shuffled and split into K folds, and for each of them a copy of the "
+        "model is trained on the other rows and evaluated on the fold. The folds are "
+        "trained in parallel processes sharing a single copy of the data. Your model "
+        "is not changed."
+    )
+
+    with st.form("cross_validation_form", border=False):
+        num_folds = st.number_input(
+            "Number of folds:", min_value=2, max_value=20, value=5, step=1
+        )
+        batch_size = st.number_input(
+            "Batch size:", min_value=1, max_value=1024, value=32, step=1
+        )
+        num_epochs = st.number_input(
+            "Number of epochs:", min_value=1, max_value=1000, value=10, step=1
+        )
+        threads = st.number_input(
+            "Threads per fold:",
+            min_value=1,
+            max_value=tools.model.get_available_cores(),
+            value=1,
+            step=1,
+        )
+        shuffle = st.toggle(
+            "Shuffle Rows",
+            value=True,
+            help="Shuffle the rows with a seeded permutation before splitting them "
+            "into the folds, otherwise the folds are consecutive ranges of the rows.",
+        )
+        seed = st.number_input("Seed:", min_value=0, value=0, step=1)
+        cross_validate_btn = st.form_submit_button("Cross-Validate")
+
+    if cross_validate_btn:
+        try:
+            with st.spinner("Cross-validating..."):
+                report = model.cross_validate(
+                    data,
+                    int(num_folds),
+                    int(batch_size),
+                    int(num_epochs),
+                    int(threads),
+                    shuffle,
+                    int(seed),
+                )
+
+            st.dataframe(report["folds"], use_container_width=True)
+            st.dataframe(report["summary"], use_container_width=True)
+            st.caption(f"The cross-validation took {report['wall_time']:.1f} s.")
+        except errors.ModelError as error:
+            st.toast(error, icon="❌")
+
+
+def sweep_ui(data: data.Data, model: model.Model) -> None:
+    """Generate the UI for running a hyperparameter sweep.
+
+    Parameters
+    ----------
+    data : Data
+        Data object.
+    model : Model
+        Model object.
+    """
+    st.header("Hyperparameter Sweep")
+    st.markdown(
+        "Search for the best configuration of a model made of an input layer, a stack "
+        "of `Dense` layers and an output layer, using the features of the model above. "
+        "A model is built for each combination of the selected values, and the models "
+        "are trained in parallel processes, each using the selected number of threads. "
+        "After each round only the best third of the models continues training for "
+        "three times more epochs, until the maximum number of epochs is reached. The "
+        "models are ranked by the best validation loss. Your model is not changed."
+    )
+
+    inputs = list(
+        dict.fromkeys(
+            c for layer in model.inputs for c in model.get_features(layer, "input")
+        )
+    )
+    outputs = list(
+        dict.fromkeys(
+            c for layer in model.outputs for c in model.get_features(layer, "output")
+        )
+    )
+    loss = model.get_loss(model.outputs[0]) if model.outputs else None
+    losses = enums.losses.classes
+    activations = list(enums.activations.classes)
+    cores = tools.model.get_available_cores()
+
+    with st.form("sweep_form", border=False):
+        num_layers = st.multiselect("Numbers of hidden layers:", range(5), [1, 2])
+        units = st.multiselect(
+            "Numbers of units:", [8, 16, 32, 64, 128, 256, 512], [16, 64]
+        )
+        activation = st.multiselect("Activation functions:", activations, ["ReLU"])
+        optimizers = st.multiselect(
+            "Optimizers:", list(enums.optimizers.classes), ["Adam"]
+        )
+        learning_rates = st.multiselect(
+            "Learning rates:", [0.1, 0.03, 0.01, 0.003, 0.001, 0.0003], [0.01, 0.001]
+        )
+        loss_entity = st.selectbox(
+            "Loss function:", losses, losses.index(loss) if loss else 0
+        )
+        output_activation = st.selectbox("Output activation function:", activations)
+        batch_size = st.number_input(
+            "Batch size:", min_value=1, max_value=1024, value=32, step=1
+        )
+        min_epochs = st.number_input(
+            "Minimum number of epochs:", min_value=1, max_value=100, value=3, step=1
+        )
+        max_epochs = st.number_input(
+            "Maximum number of epochs:", min_value=1, max_value=1000, value=27, step=1
+        )
+        val_split = st.number_input(
+            "Validation split:", min_value=0.01, max_value=0.99, value=0.15, step=0.01
+        )
+        patience = st.number_input(
+            "Patience:", min_value=1, max_value=50, value=5, step=1
+        )
+        threads = st.number_input(
+            "Threads per model:", min_value=1, max_value=cores, value=1, step=1
+        )
+        run_sweep_btn = st.form_submit_button("Run Sweep")
+
+    if run_sweep_btn:
+        try:
+            search = sweep.Sweep(
+                {
+                    "num_layers": num_layers,
+                    "units": units,
+                    "activations": activation,
+                    "optimizers": optimizers,
+                    "learning_rates": learning_rates,
+                },
+                str(loss_entity),
+                str(output_activation),
+            )
+            progress = st.progress(0.0, f"{search.num_trials} models in total.")
+
+            def on_rung(rung: int, epochs: int, trials: int) -> None:
+                """Supporting function for displaying the progress of the sweep."""
+                progress.progress(
+                    epochs / int(max_epochs),
+                    f"Round {rung + 1}: training {trials} models for {epochs} epochs.",
+                )
+
+            results = search.run(
+                data,
+                inputs,
+                outputs,
+                int(batch_size),
+                int(min_epochs),
+                max(int(min_epochs), int(max_epochs)),
+                float(val_split),
+                patience=int(patience),
+                threads=int(threads),
+                on_rung=on_rung,
+            )
+            progress.empty()
+
+            st.dataframe(results, use_container_width=True)
+            st.caption(f"The sweep took {search.wall_time:.1f} s.")
+        except errors.SweepError as error:
+            st.toast(error, icon="❌")
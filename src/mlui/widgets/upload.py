@@ -20,17 +20,89 @@ def upload_data_ui(data: data.Data) -> None:
         "during the upload if the file is poorly formatted or lacks sufficient rows "
         "and columns. Additionally, be aware that files containing NaN and/or "
         "non-numeric values may result in errors during the training, evaluation, or "
-        "prediction processes."
+        "prediction processes. For large files, enable streaming ingestion in the "
+        "upload options to parse the file in chunks with a lower peak memory usage, "
+        "or select the `pyarrow` engine to parse it using all available cores. "
+        "Downcasting numeric dtypes roughly halves the memory used by the data; the "
+        "memory usage before and after it is shown on the `Data` page. Approximate "
+        "statistics avoid sorting the data and are built chunk by chunk in the "
+        "streaming mode, which pays off for very tall files. CSV files compressed "
+        "with gzip, bzip2, xz or Zstandard are decompressed on the fly. Besides CSV, "
+        "Parquet, Feather/Arrow IPC, NPY and NPZ files are supported, and you can "
+        "select the columns to read from them."
     )
 
-    buff = st.file_uploader("Choose a data file:", "csv", key="file_uploader")
+    with st.expander("Upload Options"):
+        engine = st.selectbox("Select parser engine:", ("c", "pyarrow"))
+        streaming = st.toggle("Streaming ingestion", disabled=engine == "pyarrow")
+        arrow_dtypes = st.toggle("Arrow-backed dtypes")
+        downcast = st.toggle("Downcast numeric dtypes", disabled=arrow_dtypes)
+        approximate = st.toggle("Approximate statistics")
+        sketch_size = st.number_input(
+            "Sketch size:",
+            min_value=8,
+            max_value=4096,
+            value=200,
+            step=8,
+            disabled=not approximate,
+            help="Larger sketches give more accurate quartiles, e.g. the rank error "
+            "is below 1.4% for the size of 200 and below 0.3% for the size of 1024.",
+        )
+        measure_memory = st.toggle(
+            "Measure memory usage",
+            help="Trace the memory allocations of the upload, which slows it down.",
+        )
 
-    if buff:
-        try:
-            data.upload(buff)
-            st.toast("File is uploaded!", icon="✅")
-        except errors.UploadError as error:
-            st.toast(error, icon="❌")
+    buff = st.file_uploader(
+        "Choose a data file:",
+        ["csv", "gz", "bz2", "xz", "zst", "parquet", "feather", "arrow", "npy", "npz"],
+        key="file_uploader",
+    )
+
+    if not buff:
+        return
+
+    try:
+        file_columns = data.read_columns(buff)
+    except errors.UploadError as error:
+        st.toast(error, icon="❌")
+        return
+
+    columns = None
+
+    if file_columns is not None:
+        columns = st.multiselect(
+            "Select columns to read:", file_columns, default=file_columns
+        )
+
+    try:
+        data.upload(
+            buff,
+            streaming,
+            engine,
+            arrow_dtypes,
+            downcast,
+            int(sketch_size) if approximate else None,
+            columns,
+            measure_memory,
+        )
+        st.toast("File is uploaded!", icon="✅")
+    except errors.UploadError as error:
+        st.toast(error, icon="❌")
+
+    report = data.upload_report
+
+    if report:
+        source = "from cache" if report["cached"] else "from file"
+        caption = f"Uploaded {report['size']:.2f} MB {source} in {report['time']:.2f} s"
+
+        if report["peak_memory"] is not None:
+            caption += (
+                f", peak traced allocation of {report['peak_memory']:.2f} MB per MB "
+                "of input (NumPy and Python objects, Arrow buffers are not traced)"
+            )
+
+        st.caption(f"{caption}.")
 
 
 def upload_model_ui(model: model.UploadedModel) -> None:
@@ -7,6 +7,7 @@ st.set_page_config(page_title="Welcome!", page_icon="🏠")
 
 
 @decorators.session.set_state
+@decorators.pages.check_training
 def home_page() -> None:
     """Generate a Streamlit app page for the home screen."""
     st.write("# Welcome! 👋")
@@ -1,7 +1,11 @@
+import io
+
+import numpy as np
+import pandas as pd
 import pytest
 
-from mlui.data_classes import data as data_cls
-from mlui.data_classes import model as model_cls
+from mlui.classes import data as data_cls
+from mlui.classes import model as model_cls
 
 
 @pytest.fixture
@@ -10,5 +14,45 @@ def data() -> data_cls.Data:
 
 
 @pytest.fixture
-def model() -> model_cls.Model:
-    return model_cls.Model()
+def model() -> model_cls.CreatedModel:
+    return model_cls.CreatedModel()
+
+
+@pytest.fixture
+def fit_data(data: data_cls.Data) -> data_cls.Data:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.random((512, 2)), columns=["a", "b"])
+    df["y"] = df["a"] - df["b"]
+    buff = io.BytesIO(df.to_csv(index=False).encode())
+    buff.name = "data.csv"
+    data.upload(buff)
+
+    return data
+
+
+@pytest.fixture
+def fit_model(model: model_cls.CreatedModel) -> model_cls.CreatedModel:
+    model.set_layer("Input", "input", {"shape": (2,)}, None)
+    model.set_layer("Dense", "output", {"units": 1}, model.layers["input"])
+    model.set_outputs(["output"])
+    model.create()
+    model.set_features("input", ["a", "b"], "input")
+    model.set_features("output", ["y"], "output")
+    model.set_optimizer("Adam", {"learning_rate": 0.01})
+    model.set_loss("output", "MeanSquaredError")
+    model.compile()
+
+    return model
+
+
+@pytest.fixture
+def uploaded_model(fit_model: model_cls.CreatedModel) -> model_cls.UploadedModel:
+    model = model_cls.UploadedModel()
+    model.upload(io.BytesIO(fit_model.as_bytes))
+    model.set_features("input", ["a", "b"], "input")
+    model.set_features("output", ["y"], "output")
+    model.set_optimizer("Adam", {"learning_rate": 0.01})
+    model.set_loss("output", "MeanSquaredError")
+    model.compile()
+
+    return model
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+import tensorflow as tf
+
+from mlui.classes import checkpoint as checkpoint_cls
+from mlui.classes import errors
+from mlui.classes import model as model_cls
+
+
+def set_checkpoint(model: model_cls.Model, directory: str, **params) -> None:
+    model._callbacks["Checkpoint"] = checkpoint_cls.Checkpoint(
+        directory=directory, **params
+    )
+
+
+def test_checkpoint_resume(fit_data, fit_model, tmp_path) -> None:
+    set_checkpoint(fit_model, str(tmp_path), run_id="run")
+    fit_model.fit(fit_data, 64, 3, 0.25)
+    weights = fit_model._object.get_weights()
+    iterations = int(fit_model._object.optimizer.iterations)
+    fit_model.fit(fit_data, 64, 2, 0.25)
+
+    set_checkpoint(fit_model, str(tmp_path), run_id="run", max_to_keep=5)
+    fit_model._history = fit_model._history.iloc[:0]
+    epoch = fit_model.restore_checkpoint()
+
+    assert epoch == 5
+    assert fit_model.history["epoch"].tolist() == [1, 2, 3, 4, 5]
+    assert int(fit_model._object.optimizer.iterations) > iterations
+    assert not all(
+        np.array_equal(a, b) for a, b in zip(weights, fit_model._object.get_weights())
+    )
+
+    epochs = list()
+    fit_model.fit(
+        fit_data,
+        64,
+        2,
+        0.25,
+        callbacks=[
+            tf.keras.callbacks.LambdaCallback(
+                on_epoch_begin=lambda epoch, logs: epochs.append(epoch)
+            )
+        ],
+    )
+
+    assert epochs == [5, 6]
+    assert fit_model.history["epoch"].tolist() == list(range(1, 8))
+
+
+def test_checkpoint_runs_are_isolated(fit_data, fit_model, tmp_path) -> None:
+    set_checkpoint(fit_model, str(tmp_path), run_id="first", max_to_keep=1)
+    fit_model.fit(fit_data, 64, 2, 0.25)
+    set_checkpoint(fit_model, str(tmp_path), max_to_keep=1)
+    fit_model.fit(fit_data, 64, 2, 0.25)
+
+    set_checkpoint(fit_model, str(tmp_path), run_id="first")
+
+    assert fit_model.restore_checkpoint() == 2
+
+    set_checkpoint(fit_model, str(tmp_path), run_id="missing")
+
+    with pytest.raises(errors.ModelError):
+        fit_model.restore_checkpoint()
+
+
+def test_checkpoint_restores_best(fit_data, fit_model, tmp_path) -> None:
+    set_checkpoint(fit_model, str(tmp_path), run_id="best", best_only=True)
+    fit_model.fit(fit_data, 64, 3, 0.25)
+    best = fit_model.get_callback("Checkpoint")._best
+
+    set_checkpoint(fit_model, str(tmp_path), run_id="best", best_only=True)
+    fit_model.restore_checkpoint()
+
+    assert best is not None
+    assert fit_model.get_callback("Checkpoint")._best == best
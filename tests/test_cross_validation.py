@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from mlui.classes import errors
+from mlui.tools import data as data_tools
+
+
+def test_share_array_rows() -> None:
+    array = np.arange(12, dtype=np.float32).reshape(6, 2)
+    rows = np.random.default_rng(0).permutation(6)
+    block, spec = data_tools.share_array(array, rows)
+
+    try:
+        attached, shared = data_tools.attach_array(spec)
+
+        assert np.array_equal(shared, array[rows])
+        assert not shared.flags.writeable
+
+        del shared
+        attached.close()
+    finally:
+        block.close()
+        block.unlink()
+
+
+def test_cross_validate_folds(fit_data, fit_model) -> None:
+    weights = fit_model._object.get_weights()
+    report = fit_model.cross_validate(fit_data, 4, 64, 2)
+
+    assert report["folds"]["rows"].tolist() == [128] * 4
+    assert list(report["summary"].index) == ["mean", "std"]
+    assert "loss" in report["folds"]
+    assert all(
+        np.array_equal(a, b) for a, b in zip(weights, fit_model._object.get_weights())
+    )
+
+
+def test_cross_validate_is_seeded(fit_data, fit_model) -> None:
+    first = fit_model.cross_validate(fit_data, 2, 512, 1, seed=1)["folds"]
+    second = fit_model.cross_validate(fit_data, 2, 512, 1, seed=1)["folds"]
+    contiguous = fit_model.cross_validate(fit_data, 2, 512, 1, shuffle=False)["folds"]
+
+    assert np.allclose(first["loss"], second["loss"])
+    assert not np.allclose(first["loss"], contiguous["loss"])
+
+
+def test_cross_validate_num_folds(fit_data, fit_model) -> None:
+    with pytest.raises(errors.ModelError):
+        fit_model.cross_validate(fit_data, 1, 64, 1)
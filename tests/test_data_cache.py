@@ -0,0 +1,46 @@
+import os
+import stat
+
+import pandas as pd
+
+from mlui.classes import cache
+
+
+def make_df() -> pd.DataFrame:
+    return pd.DataFrame({"a": [1.0, 2.0], "b": [3.0, 4.0]})
+
+
+def test_data_cache_private(tmp_path) -> None:
+    path = tmp_path / "data"
+    data_cache = cache.DataCache(path, 2**20)
+    data_cache.set("key", make_df(), None)
+    df, error = data_cache.get("key")
+
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o700
+    assert error is None
+    pd.testing.assert_frame_equal(df, make_df())
+
+
+def test_data_cache_rejects_shared_dir(tmp_path) -> None:
+    path = tmp_path / "data"
+    data_cache = cache.DataCache(path, 2**20)
+    data_cache.set("key", make_df(), None)
+    path.chmod(0o777)
+
+    assert data_cache.get("key") is None
+
+    data_cache.set("other", make_df(), None)
+
+    assert not (path / "other.json").exists()
+
+
+def test_data_cache_rejects_symlink(tmp_path) -> None:
+    target = tmp_path / "target"
+    target.mkdir(mode=0o700)
+    path = tmp_path / "data"
+    path.symlink_to(target)
+    data_cache = cache.DataCache(path, 2**20)
+    data_cache.set("key", make_df(), None)
+
+    assert not list(target.iterdir())
+    assert data_cache.get("key") is None
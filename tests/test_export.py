@@ -0,0 +1,62 @@
+import gc
+import io
+import os
+import stat
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from mlui.classes import cache
+from mlui.classes import model as model_cls
+from mlui.tools import data as data_tools
+
+
+@pytest.mark.parametrize("fmt", ["csv", "parquet"])
+def test_write_chunks_parts(tmp_path, fmt) -> None:
+    chunks = [
+        pd.DataFrame({"output_0": np.arange(i, i + 100.0)}) for i in range(0, 1000, 100)
+    ]
+    report = data_tools.write_chunks(iter(chunks), fmt, str(tmp_path), part_size=1)
+    read = pd.read_csv if fmt == "csv" else pd.read_parquet
+
+    assert len(report["paths"]) == 10
+    assert report["rows"] == 1000
+    assert len(report["preview"]) == data_tools.PREVIEW_ROWS
+    pd.testing.assert_frame_equal(
+        pd.concat([read(path) for path in report["paths"]], ignore_index=True),
+        pd.concat(chunks, ignore_index=True),
+    )
+
+
+def test_export_lifecycle(fit_data, uploaded_model) -> None:
+    cache.result_cache.clear()
+    first = uploaded_model.export_predictions(fit_data, 64, "csv", 100)
+    export_dir = os.path.dirname(first["directory"])
+    package_dir = os.path.dirname(os.path.dirname(data_tools.__file__))
+
+    assert not os.path.realpath(export_dir).startswith(os.path.realpath(package_dir))
+    assert stat.S_IMODE(os.stat(export_dir).st_mode) == 0o700
+
+    predictions = uploaded_model.predict(fit_data, 64)[0].to_numpy()
+    exported = pd.concat(map(pd.read_csv, first["paths"])).to_numpy()
+
+    np.testing.assert_allclose(exported, predictions, rtol=1e-6)
+
+    second = uploaded_model.export_predictions(fit_data, 64, "parquet", 100)
+
+    assert not os.path.exists(first["directory"])
+    assert os.path.exists(second["directory"])
+
+
+def test_export_dir_removed_with_model(fit_model) -> None:
+    model = model_cls.UploadedModel()
+    model.upload(io.BytesIO(fit_model.as_bytes))
+    export_dir = model._get_export_dir()
+
+    assert os.path.isdir(export_dir)
+
+    del model
+    gc.collect()
+
+    assert not os.path.exists(export_dir)
@@ -0,0 +1,37 @@
+import numpy as np
+
+from mlui.tools import data as data_tools
+
+
+def test_lttb_short_series() -> None:
+    x = np.arange(10, dtype=np.float64)
+
+    assert data_tools.downsample_lttb(x, x, 20).tolist() == list(range(10))
+    assert data_tools.downsample_lttb(x, x, 2).tolist() == list(range(10))
+
+
+def test_lttb_indices() -> None:
+    rng = np.random.default_rng(0)
+    x = np.sort(rng.random(10_000))
+    indices = data_tools.downsample_lttb(x, rng.normal(size=10_000), 500)
+
+    assert len(indices) == 500
+    assert indices[0] == 0 and indices[-1] == 9_999
+    assert (np.diff(indices) > 0).all()
+
+
+def test_lttb_keeps_spikes() -> None:
+    x = np.arange(10_000, dtype=np.float64)
+    y = np.zeros(10_000)
+    y[[1_234, 7_777]] = [100.0, -100.0]
+    indices = data_tools.downsample_lttb(x, y, 100)
+
+    assert {1_234, 7_777} <= set(indices.tolist())
+
+
+def test_lttb_one_point_per_bucket() -> None:
+    x = np.arange(1_000, dtype=np.float64)
+    indices = data_tools.downsample_lttb(x, np.sin(x / 50), 50)
+    edges = np.append(np.linspace(1, 999, 49).astype(np.intp), 1_000)
+
+    assert np.array_equal(np.searchsorted(edges, indices[1:-1], "right"), range(1, 49))
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from mlui.tools import model as model_tools
+
+
+def make_layer_data(rows: int) -> tuple[dict, dict]:
+    x = {"input": np.arange(rows * 2, dtype=np.float64).reshape(rows, 2)}
+    y = {"output": np.arange(rows, dtype=np.float64).reshape(rows, 1)}
+
+    return x, y
+
+
+def read_rows(dataset) -> list[int]:
+    return [int(row) for _, outputs in dataset for row in outputs["output"][:, 0]]
+
+
+@pytest.mark.parametrize("memmap", [False, True])
+def test_make_dataset_range(memmap: bool) -> None:
+    x, y = make_layer_data(23)
+    dataset = model_tools.make_dataset(x, y, 5, start=3, stop=20, memmap=memmap)
+
+    assert read_rows(dataset) == list(range(3, 20))
+    assert [len(o["output"]) for _, o in dataset] == [5, 5, 5, 2]
+
+
+@pytest.mark.parametrize("memmap", [False, True])
+def test_make_dataset_skip(memmap: bool) -> None:
+    x, y = make_layer_data(20)
+    dataset = model_tools.make_dataset(x, y, 4, skip=(8, 12), memmap=memmap)
+
+    assert read_rows(dataset) == [*range(8), *range(12, 20)]
+
+
+@pytest.mark.parametrize("memmap", [False, True])
+def test_make_dataset_shuffle(memmap: bool) -> None:
+    x, y = make_layer_data(40)
+    dataset = model_tools.make_dataset(
+        x, y, 4, skip=(0, 8), shuffle=True, memmap=memmap
+    )
+
+    assert sorted(read_rows(dataset)) == list(range(8, 40))
+
+
+def test_make_dataset_inputs_only() -> None:
+    x, _ = make_layer_data(7)
+    batches = list(model_tools.make_dataset(x, None, 4))
+
+    assert [batch["input"].shape.as_list() for batch in batches] == [[4, 2], [3, 2]]
+    assert batches[0]["input"].dtype.name == "float32"
+
+
+def test_make_dataset_shared_tensors() -> None:
+    x, y = make_layer_data(10)
+    x, y = model_tools.to_tensors(x), model_tools.to_tensors(y)
+    train = model_tools.make_dataset(x, y, 3, stop=8)
+    val = model_tools.make_dataset(x, y, 3, start=8)
+
+    assert read_rows(train) == list(range(8))
+    assert read_rows(val) == [8, 9]
@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+
+from mlui.classes import profile
+
+
+def test_profile_matches_pandas() -> None:
+    df = pd.DataFrame(
+        {
+            "a": [1.0, np.nan, 3.0, 4.0],
+            "b": pd.array([1, None, 3, 4], dtype="Int64"),
+            "c": ["x", "y", None, "z"],
+            "d": pd.array([1.5, 2.5, None, 0.5], dtype="float64[pyarrow]"),
+            "e": [1, 2, 3, 4],
+        }
+    )
+    table = profile.DataProfile(df).table
+    numeric = ["a", "b", "d", "e"]
+    expected = df[numeric].astype("float64").describe().transpose()
+
+    pd.testing.assert_frame_equal(table.loc[numeric, profile.STATISTICS], expected)
+    assert table["nulls"].tolist() == [1, 1, 1, 1, 0]
+    assert table.loc["c", profile.STATISTICS].isna().all()
+    assert table["numeric"].tolist() == [True, True, False, True, True]
+
+
+def test_profile_edge_cases() -> None:
+    df = pd.DataFrame({"a": [np.nan, np.nan], "b": [1.0, np.nan]})
+    table = profile.DataProfile(df).table
+
+    assert table.loc["a", "count"] == 0
+    assert table.loc["a", ["mean", "min", "max"]].isna().all()
+    assert table.loc["b", ["count", "min", "max"]].tolist() == [1.0, 1.0, 1.0]
+    assert np.isnan(table.loc["b", "std"])
+    assert profile.DataProfile(pd.DataFrame()).table.empty
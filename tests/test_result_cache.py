@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+
+from mlui.classes import cache
+
+
+def test_result_key_follows_compiled_losses(fit_data, uploaded_model) -> None:
+    cache.result_cache.clear()
+    mse = uploaded_model.evaluate(fit_data, 64)
+
+    # The loss is only staged, the compiled model still evaluates the old one
+    uploaded_model.set_loss("output", "MeanAbsoluteError")
+
+    assert uploaded_model.evaluate(fit_data, 64).equals(mse)
+
+    uploaded_model.compile()
+    mae = uploaded_model.evaluate(fit_data, 64)
+
+    assert not mae.equals(mse)
+
+    cache.result_cache.clear()
+
+    assert uploaded_model.evaluate(fit_data, 64).equals(mae)
+
+
+def make_result(value: float, rows: int = 100) -> pd.DataFrame:
+    return pd.DataFrame({"output_0": np.full(rows, value, dtype=np.float32)})
+
+
+def test_result_cache_lru() -> None:
+    size = cache.get_result_size(make_result(0))
+    result_cache = cache.ResultCache(2 * size)
+    result_cache.set("a", make_result(1))
+    result_cache.set("b", make_result(2))
+    result_cache.get("a")
+    result_cache.set("c", make_result(3))
+
+    assert result_cache.get("b") is None
+    assert result_cache.get("a") is not None
+    assert result_cache.get("c") is not None
+    assert result_cache.size == 2 * size
+
+
+def test_result_cache_disabled_and_oversized() -> None:
+    disabled = cache.ResultCache(0)
+    disabled.set("a", make_result(1))
+    small = cache.ResultCache(10)
+    small.set("a", make_result(1))
+
+    assert not disabled.enabled
+    assert disabled.get("a") is None
+    assert small.get("a") is None
+
+
+def test_result_cache_spill(tmp_path) -> None:
+    predictions = [make_result(1), make_result(2, rows=50)]
+    result_cache = cache.ResultCache(
+        cache.get_result_size(predictions), tmp_path, 2**20
+    )
+    result_cache.set("a", predictions)
+    result_cache.set("b", make_result(3))
+
+    # Both entries don't fit in memory at once, so each hit spills the other one
+    (spill_path,) = tmp_path.iterdir()
+
+    assert spill_path.stat().st_mode & 0o777 == 0o700
+    assert [path.name for path in spill_path.iterdir()] == ["a"]
+
+    loaded = result_cache.get("a")
+
+    assert isinstance(loaded, list)
+    assert all(x.equals(y) for x, y in zip(loaded, predictions))
+    assert [path.name for path in spill_path.iterdir()] == ["b"]
+    assert result_cache.get("b").equals(make_result(3))
+
+    result_cache.clear()
+
+    assert not list(spill_path.iterdir())
+    assert result_cache.get("a") is None
+
+
+def test_result_cache_spill_cap(tmp_path) -> None:
+    size = cache.get_result_size(make_result(0))
+    result_cache = cache.ResultCache(size, tmp_path, 1)
+
+    for key in "abc":
+        result_cache.set(key, make_result(ord(key)))
+
+    (spill_path,) = tmp_path.iterdir()
+
+    assert not list(spill_path.iterdir())
@@ -0,0 +1,77 @@
+import collections
+
+import numpy as np
+import tensorflow as tf
+
+from mlui.classes import cache
+
+
+def test_predict_matches_keras(fit_data, uploaded_model) -> None:
+    cache.result_cache.clear()
+    predictions = uploaded_model.predict(fit_data, 64)
+    expected = uploaded_model._object.predict(
+        fit_data.dataframe[["a", "b"]].to_numpy(np.float32), verbose=0
+    )["output"]
+
+    np.testing.assert_allclose(predictions[0].to_numpy(), expected, rtol=1e-5)
+
+
+def test_predict_one_matches_predict(fit_data, uploaded_model) -> None:
+    cache.result_cache.clear()
+    predictions = uploaded_model.predict(fit_data, 64)[0].to_numpy()
+    row = fit_data.dataframe.iloc[0]
+    prediction = uploaded_model.predict_one({"a": row["a"], "b": row["b"]})
+
+    np.testing.assert_allclose(prediction["output"], predictions[0], rtol=1e-5)
+
+
+def test_serving_function_traced_once(fit_data, uploaded_model) -> None:
+    cache.result_cache.clear()
+
+    # 512 rows leave a partial last batch for every batch size
+    for batch_size in (64, 100, 300):
+        uploaded_model.predict(fit_data, batch_size)
+
+    uploaded_model.predict_one({"a": 0.5, "b": 0.5})
+    stats = uploaded_model.serving_stats
+
+    assert stats["traces"] == 1
+    assert stats["calls"] == 8 + 6 + 2 + 1
+
+
+class CountingCallback(tf.keras.callbacks.Callback):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = collections.Counter()
+        self.steps = list()
+        self.rows = 0
+
+    def on_predict_begin(self, logs=None) -> None:
+        self.calls["begin"] += 1
+
+    def on_predict_batch_end(self, batch, logs=None) -> None:
+        self.steps.append(batch)
+        self.rows += len(logs["outputs"][0])
+
+    def on_predict_end(self, logs=None) -> None:
+        self.calls["end"] += 1
+
+
+def test_predict_calls_callbacks(fit_data, uploaded_model) -> None:
+    cache.result_cache.clear()
+    callback = CountingCallback()
+    uploaded_model._callbacks["Counter"] = callback
+    uploaded_model.predict(fit_data, 100)
+
+    assert callback.model is uploaded_model._object
+    assert callback.calls == {"begin": 1, "end": 1}
+    assert callback.steps == list(range(6))
+    assert callback.rows == 512
+
+    callback = CountingCallback()
+    uploaded_model._callbacks["Counter"] = callback
+    uploaded_model.export_predictions(fit_data, 64, "csv", 100)
+
+    assert callback.calls == {"begin": 1, "end": 1}
+    assert callback.steps == list(range(len(callback.steps)))
+    assert callback.rows == 512
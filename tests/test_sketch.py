@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from mlui.classes import profile as profile_cls
+from mlui.classes import sketch as sketch_cls
+
+
+def get_rank_errors(values: np.ndarray, estimates: np.ndarray, q: list[float]):
+    ranks = np.searchsorted(np.sort(values), estimates) / len(values)
+
+    return np.abs(ranks - np.asarray(q))
+
+
+def test_quantile_sketch_exact() -> None:
+    values = np.arange(100, dtype=np.float64)
+    sketch = sketch_cls.QuantileSketch(200)
+    sketch.update(values)
+
+    assert sketch.error == 0.0
+    assert sketch.quantile([0.0, 0.5, 1.0]).tolist() == [0.0, 49.0, 99.0]
+
+
+def test_quantile_sketch_empty() -> None:
+    sketch = sketch_cls.QuantileSketch(200)
+
+    assert np.isnan(sketch.quantile([0.5])).all()
+
+
+def test_quantile_sketch_rank_error() -> None:
+    values = np.random.default_rng(0).lognormal(size=100_000)
+    q = [0.1, 0.25, 0.5, 0.75, 0.9]
+    sketch = sketch_cls.QuantileSketch(200)
+
+    for chunk in np.array_split(values, 37):
+        sketch.update(chunk)
+
+    assert 0 < sketch.error < 0.05
+    assert (get_rank_errors(values, sketch.quantile(q), q) <= 2 * sketch.error).all()
+
+
+def test_quantile_sketch_merge() -> None:
+    values = np.random.default_rng(1).normal(size=50_000)
+    q = [0.25, 0.5, 0.75]
+    sketches = [sketch_cls.QuantileSketch(200) for _ in range(4)]
+
+    for sketch, chunk in zip(sketches, np.array_split(values, 4)):
+        sketch.update(chunk)
+
+    for sketch in sketches[1:]:
+        sketches[0].merge(sketch)
+
+    errors = get_rank_errors(values, sketches[0].quantile(q), q)
+
+    assert (errors <= 2 * sketches[0].error).all()
+
+
+def test_column_sketch_merged_moments() -> None:
+    values = np.random.default_rng(2).normal(5.0, 3.0, size=10_001)
+    values[::100] = np.nan
+    left, right = sketch_cls.ColumnSketch(200), sketch_cls.ColumnSketch(200)
+    left.update(values[:3_000])
+    right.update(values[3_000:])
+    left.merge(right)
+    summary = left.summary
+    finite = values[~np.isnan(values)]
+
+    assert summary["count"] == len(finite)
+    assert summary["mean"] == pytest.approx(finite.mean())
+    assert summary["std"] == pytest.approx(finite.std(ddof=1))
+    assert summary["min"] == finite.min()
+    assert summary["max"] == finite.max()
+
+
+def test_approximate_profile_matches_describe() -> None:
+    rng = np.random.default_rng(3)
+    df = pd.DataFrame({"a": rng.random(5_000), "b": rng.integers(0, 9, 5_000)})
+    df.loc[::10, "a"] = np.nan
+    df["c"] = "text"
+    profile = profile_cls.ApproximateProfile(200)
+
+    for start in range(0, len(df), 1_000):
+        profile.update(df.iloc[start : start + 1_000])
+
+    table = profile.table
+    expected = df.describe().T
+
+    assert profile.rows == len(df)
+    assert table.loc["a", "nulls"] == 500
+    assert not table.loc["c", "numeric"]
+    assert np.allclose(
+        table.loc[["a", "b"], ["count", "mean", "std", "min", "max"]],
+        expected[["count", "mean", "std", "min", "max"]],
+    )
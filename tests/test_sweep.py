@@ -0,0 +1,78 @@
+import math
+
+import pytest
+
+from mlui.classes import errors
+from mlui.classes import sweep as sweep_cls
+
+
+def make_space(**values) -> dict:
+    return {
+        "num_layers": [1],
+        "units": [4],
+        "activations": ["ReLU"],
+        "optimizers": ["Adam"],
+        "learning_rates": [0.01],
+        **values,
+    }
+
+
+def test_sweep_empty_space() -> None:
+    with pytest.raises(errors.SweepError):
+        sweep_cls.Sweep(make_space(units=[]), "MeanSquaredError", "Linear")
+
+
+def test_sweep_successive_halving(fit_data) -> None:
+    sweep = sweep_cls.Sweep(
+        make_space(num_layers=[0, 1], learning_rates=[0.1, 0.001]),
+        "MeanSquaredError",
+        "Linear",
+    )
+    rungs = list()
+    results = sweep.run(
+        fit_data,
+        ["a", "b"],
+        ["y"],
+        batch_size=64,
+        min_epochs=1,
+        max_epochs=4,
+        val_split=0.25,
+        eta=2,
+        on_rung=lambda *rung: rungs.append(rung),
+    )
+
+    assert sweep.num_trials == 4
+    assert rungs == [(0, 1, 4), (1, 2, 2), (2, 4, 1)]
+    assert results["val_loss"].is_monotonic_increasing
+    assert results["status"].value_counts().to_dict() == {"pruned": 3, "completed": 1}
+    assert results.loc[1, "epochs"] == 4
+    assert sorted(results["epochs"].tolist()) == [1, 1, 2, 4]
+
+
+def test_rung_early_stopping_carries_state() -> None:
+    callback = sweep_cls.RungEarlyStopping(3, {"best": 0.5, "wait": 2})
+    callback.on_train_begin()
+
+    assert callback.state == {"best": 0.5, "wait": 2}
+
+    callback = sweep_cls.RungEarlyStopping(3, None)
+    callback.on_train_begin()
+
+    assert callback.state == {"best": math.inf, "wait": 0}
+
+
+def test_run_trial_carries_optimizer(monkeypatch, fit_data) -> None:
+    monkeypatch.setattr(
+        sweep_cls, "_x", fit_data.dataframe[["a", "b"]].to_numpy("float32")
+    )
+    monkeypatch.setattr(sweep_cls, "_y", fit_data.dataframe[["y"]].to_numpy("float32"))
+    spec = sweep_cls.Sweep(make_space(), "MeanSquaredError", "Linear")._specs[0]
+    first = sweep_cls._run_trial(spec, None, None, None, 0, 1, 64, 0.25, 5)
+    second = sweep_cls._run_trial(
+        spec, first["weights"], first["optimizer"], first["stopping"], 1, 3, 64, 0.25, 5
+    )
+
+    # The step counter and the moments continue instead of starting from scratch
+    assert first["optimizer"][0] == 6
+    assert second["optimizer"][0] == 18
+    assert len(second["history"]["loss"]) == 2
@@ -0,0 +1,43 @@
+import threading
+import tracemalloc
+
+import numpy as np
+
+from mlui.tools import data as data_tools
+
+
+def test_trace_memory_concurrent() -> None:
+    entered = threading.Barrier(2)
+    allocated = threading.Event()
+    peaks = dict()
+
+    def upload(name: str, size: int) -> None:
+        with data_tools.trace_memory() as get_peak:
+            entered.wait()
+
+            if name == "second":
+                allocated.wait()
+
+            array = np.ones(size)
+            allocated.set()
+            peaks[name] = get_peak()
+            del array
+
+    threads = [
+        threading.Thread(target=upload, args=("first", 2**23)),
+        threading.Thread(target=upload, args=("second", 2**20)),
+    ]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert peaks["first"] >= 64
+    assert peaks["second"] >= 8
+    assert not tracemalloc.is_tracing()
+
+
+def test_upload_does_not_trace_by_default(fit_data) -> None:
+    assert fit_data.upload_report["peak_memory"] is None
@@ -0,0 +1,48 @@
+import io
+
+import numpy as np
+import pandas as pd
+
+from mlui.classes import data as data_cls
+from mlui.tools import data as data_tools
+
+
+def make_buffer(name: str = "data.csv") -> io.BytesIO:
+    df = pd.DataFrame(np.random.default_rng(0).random((64, 2)), columns=["a", "b"])
+    buff = io.BytesIO(df.to_csv(index=False).encode())
+    buff.name = name
+
+    return buff
+
+
+def test_reupload_keeps_version(monkeypatch) -> None:
+    hashes = []
+    hash_buffer = data_tools.hash_buffer
+    monkeypatch.setattr(
+        data_tools, "hash_buffer", lambda buff: hashes.append(1) or hash_buffer(buff)
+    )
+    data = data_cls.Data()
+    buff = make_buffer()
+    buff.file_id = "file"
+    data.upload(buff)
+    version = data.version
+    report = data.upload_report
+    data.upload(buff)
+
+    assert data.version == version
+    assert data.upload_report == report
+    assert len(hashes) == 1
+
+    data.upload(buff, downcast=True)
+
+    assert data.version != version
+    assert len(hashes) == 1
+
+
+def test_reupload_after_reset(data) -> None:
+    buff = make_buffer()
+    data.upload(buff)
+    data.reset_state()
+    data.upload(buff)
+
+    assert list(data.columns) == ["a", "b"]
@@ -0,0 +1,89 @@
+import pathlib
+import threading
+
+import pytest
+import tensorflow as tf
+from streamlit.testing.v1 import AppTest
+
+from mlui.classes import errors
+from mlui.classes import worker as worker_cls
+
+PAGES = pathlib.Path(__file__).parents[1] / "src" / "mlui" / "pages"
+
+
+class BlockingCallback(tf.keras.callbacks.Callback):
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = threading.Event()
+
+    def on_train_batch_end(self, batch: int, logs: dict | None = None) -> None:
+        self.release.wait(10)
+
+
+def test_worker_completes(fit_data, fit_model) -> None:
+    worker = worker_cls.TrainingWorker()
+    worker.start(fit_model, fit_data, 64, 3, 0.25)
+    worker.join(60)
+
+    assert worker.status == "completed"
+    assert worker.epoch == 3
+    assert worker.progress == 1.0
+    assert {"loss", "val_loss"} <= set(worker.metrics)
+    assert not worker.batch_logs.empty
+
+
+def test_worker_cancel(fit_data, fit_model) -> None:
+    blocking = BlockingCallback()
+    fit_model._callbacks["Blocking"] = blocking
+    worker = worker_cls.TrainingWorker()
+    worker.start(fit_model, fit_data, 8, 50, 0.25)
+
+    with pytest.raises(errors.ModelError):
+        worker.start(fit_model, fit_data, 8, 50, 0.25)
+
+    worker.cancel()
+    blocking.release.set()
+    worker.join(60)
+
+    assert worker.status == "cancelled"
+    assert worker.epoch < 50
+
+
+def test_pages_gated_while_training(fit_data, fit_model) -> None:
+    blocking = BlockingCallback()
+    fit_model._callbacks["Blocking"] = blocking
+    worker = worker_cls.TrainingWorker()
+    worker.start(fit_model, fit_data, 8, 50, 0.25)
+
+    try:
+        app = AppTest.from_file(str(next(PAGES.glob("4_*_Compile.py"))))
+        app.session_state.data = fit_data
+        app.session_state.model = fit_model
+        app.session_state.worker = worker
+        app.run()
+
+        assert "training is finished" in app.info[0].value
+        assert not app.button
+    finally:
+        worker.cancel()
+        blocking.release.set()
+        worker.join(60)
+
+
+def test_status_polls_until_finished(fit_data, fit_model) -> None:
+    worker = worker_cls.TrainingWorker()
+    worker.start(fit_model, fit_data, 64, 10, 0.25)
+    app = AppTest.from_file(str(next(PAGES.glob("5_*_Train.py"))), default_timeout=60)
+    app.session_state.data = fit_data
+    app.session_state.model = fit_model
+    app.session_state.worker = worker
+
+    # The page reruns itself while the training is running
+    app.run()
+
+    assert worker.status == "completed"
+
+    app.run()
+
+    assert app.success[0].value == "Training is completed!"
+    assert "Cancel Training" not in [button.label for button in app.button]